@@ -0,0 +1,132 @@
+import select
+import logging
+import threading
+import psycopg2
+from psycopg2 import extensions
+from config import (
+    CACHE_NOTIFY_CHANNEL, CACHE_LISTENER_POLL_SECONDS, CACHE_LISTENER_MAX_BACKOFF_SECONDS,
+    QUERY_CACHE_PREWARM_ENTRIES,
+)
+from .dbCore import get_db_connection, is_sqlite
+from . import queryCache
+
+logger = logging.getLogger(__name__)
+
+
+class CacheInvalidationListener(threading.Thread):
+    """
+    Background thread of each API process that moves the local query caches to the data
+    generation published by the ETL (bump_data_generation), dropping stale entries and
+    pre-warming the hot ones.
+
+    On Postgres it LISTENs on CACHE_NOTIFY_CHANNEL over a dedicated connection; on SQLite,
+    which has no NOTIFY, it polls the data_generation table every `poll_seconds`.
+    After every (re)connect the generation is read from the table, so notifications
+    missed while disconnected are not lost. Any error reconnects with a back-off instead
+    of ending the thread, which would leave the caches serving stale data.
+    """
+
+    def __init__(self, poll_seconds=CACHE_LISTENER_POLL_SECONDS, prewarm=QUERY_CACHE_PREWARM_ENTRIES,
+                 max_backoff=CACHE_LISTENER_MAX_BACKOFF_SECONDS):
+        super().__init__(name="cache-listener", daemon=True)
+        self.poll_seconds = poll_seconds
+        self.prewarm = prewarm
+        self.max_backoff = max_backoff
+        self.failures = 0
+        self.stop_event = threading.Event()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def apply(self, generation):
+        if queryCache.set_generation(generation, prewarm=self.prewarm):
+            logger.info(f"Cache Listener: Moved to data generation {generation}.")
+
+    def sync(self, conn):
+        """Reads the current generation from the database and applies it."""
+        cursor = conn.cursor()
+        cursor.execute("SELECT generation FROM data_generation WHERE id = 1;")
+        row = cursor.fetchone()
+        cursor.close()
+        self.failures = 0
+        if row is not None:
+            self.apply(row[0])
+
+    def drain_notifications(self, conn):
+        """Applies the last of the pending notifications (they arrive in commit order)."""
+        conn.poll()
+        generations = []
+        while conn.notifies:
+            notify = conn.notifies.pop(0)
+            try:
+                generations.append(int(notify.payload))
+            except ValueError:
+                logger.warning(f"Cache Listener: Ignoring notification payload {notify.payload!r}.")
+        if generations:
+            self.apply(generations[-1])
+
+    def _listen(self, conn):
+        conn.set_isolation_level(extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        cursor = conn.cursor()
+        cursor.execute(f"LISTEN {CACHE_NOTIFY_CHANNEL};")
+        cursor.close()
+        self.sync(conn)
+        logger.info(f"Cache Listener: Listening on '{CACHE_NOTIFY_CHANNEL}'.")
+
+        while not self.stop_event.is_set():
+            if select.select([conn], [], [], self.poll_seconds) == ([], [], []):
+                continue
+            self.drain_notifications(conn)
+
+    def _poll(self, conn):
+        while not self.stop_event.is_set():
+            self.sync(conn)
+            self.stop_event.wait(self.poll_seconds)
+
+    def backoff(self):
+        """Delay before the next reconnect: doubles with each failure in a row (reset by sync)."""
+        delay = min(self.poll_seconds * 2 ** self.failures, self.max_backoff)
+        self.failures += 1
+        return delay
+
+    def run(self):
+        while not self.stop_event.is_set():
+            conn, delay = None, 0
+            try:
+                conn = get_db_connection()
+                if conn is None:
+                    delay = self.backoff()
+                    logger.warning(f"Cache Listener: No DB connection; retrying in {delay}s.")
+                elif is_sqlite():
+                    self._poll(conn)
+                else:
+                    self._listen(conn)
+            except psycopg2.Error as e:
+                delay = self.backoff()
+                logger.warning(f"Cache Listener: Connection lost ({e}); reconnecting in {delay}s.")
+            except Exception as e:
+                delay = self.backoff()
+                logger.error(f"Cache Listener: Unexpected error ({e}); reconnecting in {delay}s.", exc_info=True)
+            finally:
+                if conn is not None:
+                    conn.close()
+            self.stop_event.wait(delay)
+
+
+_listener = None
+
+
+def start_cache_listener():
+    """Starts this process's cache listener (once)."""
+    global _listener
+    if _listener is None or not _listener.is_alive():
+        _listener = CacheInvalidationListener()
+        _listener.start()
+    return _listener
+
+
+def stop_cache_listener():
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -1,15 +1,43 @@
 import psycopg2
 import logging
 import os
+import time
+import threading
+from contextlib import contextmanager
+from psycopg2 import extensions, extras
+from psycopg2.pool import ThreadedConnectionPool, PoolError
 from dotenv import load_dotenv
+from config import (
+    DB_BACKEND, DB_FILE_PATH, DB_POOL_MIN_CONNECTIONS, DB_POOL_MAX_CONNECTIONS,
+    DB_POOL_TIMEOUT_SECONDS, DB_POOL_HEALTHCHECK_SECONDS,
+)
+from .sqliteBackend import connect_sqlite, execute_values_sqlite, SqliteCursor
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
 DATABASE_URL = os.environ.get('DATABASE_URL')
+DB_BACKEND = os.environ.get('DB_BACKEND', DB_BACKEND)
+BACKENDS = ("postgres", "sqlite")
+
+
+def is_sqlite():
+    """True when the app runs on the embedded SQLite file (DB_FILE_PATH) instead of Postgres."""
+    return DB_BACKEND == "sqlite"
+
 
 def get_db_connection():
-    """Return a PostgreSQL connection."""
+    """
+    Return a new, dedicated connection (the caller must close it): PostgreSQL, or the
+    SQLite file when DB_BACKEND is "sqlite".
+    Short queries should borrow one from the pool with db_connection() instead.
+    """
+    if is_sqlite():
+        try:
+            return connect_sqlite(DB_FILE_PATH)
+        except psycopg2.Error as e:
+            logger.critical(f"Database connection failed: {e}")
+            return None
     try:
         conn = psycopg2.connect(DATABASE_URL)
         return conn
@@ -18,6 +46,181 @@ def get_db_connection():
         return None
 
 
+def execute_values(cursor, sql, argslist, fetch=False):
+    """psycopg2.extras.execute_values for either backend."""
+    if isinstance(cursor, SqliteCursor):
+        return execute_values_sqlite(cursor, sql, argslist, fetch=fetch)
+    return extras.execute_values(cursor, sql, argslist, fetch=fetch)
+
+
+class PoolTimeout(PoolError):
+    """No pooled connection became free within the pool timeout."""
+
+
+class ConnectionPool:
+    """
+    Thread-safe PostgreSQL connection pool. Unlike psycopg2's ThreadedConnectionPool,
+    which raises as soon as it is exhausted, getconn() waits up to `timeout` seconds for
+    a free connection. Connections idle for more than `healthcheck_after` seconds are
+    checked with SELECT 1 before being handed out and replaced when dead.
+    """
+
+    def __init__(self, dsn, min_size=DB_POOL_MIN_CONNECTIONS, max_size=DB_POOL_MAX_CONNECTIONS,
+                 timeout=DB_POOL_TIMEOUT_SECONDS, healthcheck_after=DB_POOL_HEALTHCHECK_SECONDS):
+        self.pool = ThreadedConnectionPool(min_size, max_size, dsn)
+        self.slots = threading.BoundedSemaphore(max_size)
+        self.timeout = timeout
+        self.healthcheck_after = healthcheck_after
+        self.lock = threading.Lock()
+        self.last_used = {}
+        self.checkouts = 0
+        self.wait_seconds = 0.0
+        self.in_use = 0
+        self.max_in_use = 0
+        self.timeouts = 0
+        self.replaced = 0
+
+    def getconn(self):
+        started = time.perf_counter()
+        if not self.slots.acquire(timeout=self.timeout):
+            with self.lock:
+                self.timeouts += 1
+            raise PoolTimeout(f"No DB connection became free within {self.timeout}s.")
+
+        try:
+            conn = self.pool.getconn()
+            if not self._is_healthy(conn):
+                self.pool.putconn(conn, close=True)
+                conn = self.pool.getconn()
+                with self.lock:
+                    self.replaced += 1
+        except Exception:
+            self.slots.release()
+            raise
+
+        with self.lock:
+            self.checkouts += 1
+            self.wait_seconds += time.perf_counter() - started
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+        return conn
+
+    def putconn(self, conn):
+        broken = bool(conn.closed)
+        if not broken and conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                broken = True
+
+        with self.lock:
+            self.in_use -= 1
+            if broken:
+                self.last_used.pop(id(conn), None)
+            else:
+                self.last_used[id(conn)] = time.monotonic()
+        self.pool.putconn(conn, close=broken)
+        self.slots.release()
+
+    def _is_healthy(self, conn):
+        if conn.closed:
+            return False
+        idle_since = self.last_used.get(id(conn))
+        if idle_since is not None and time.monotonic() - idle_since < self.healthcheck_after:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error as e:
+            logger.warning(f"DB Pool: Dropping dead connection: {e}")
+            return False
+
+    def stats(self):
+        with self.lock:
+            return {
+                "checkouts": self.checkouts,
+                "avg_wait_ms": round(1000 * self.wait_seconds / self.checkouts, 2) if self.checkouts else 0.0,
+                "in_use": self.in_use,
+                "max_in_use": self.max_in_use,
+                "timeouts": self.timeouts,
+                "replaced": self.replaced,
+            }
+
+    def close(self):
+        self.pool.closeall()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """Return the process-wide connection pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(DATABASE_URL)
+                logger.info(
+                    f"DB Pool: Created (min {DB_POOL_MIN_CONNECTIONS}, max {DB_POOL_MAX_CONNECTIONS} connections)."
+                )
+    return _pool
+
+
+def pool_stats():
+    """Checkout/wait/in-use counters of the connection pool (empty before first use)."""
+    return _pool.stats() if _pool is not None else {}
+
+
+def close_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+@contextmanager
+def db_connection():
+    """
+    Borrow a pooled connection: commits when the block succeeds, rolls back when it raises,
+    and always hands the connection back to the pool.
+    Yields None when no connection can be obtained (same contract as get_db_connection).
+    On the SQLite backend every block gets its own short-lived connection (opening one is cheap).
+    """
+    if is_sqlite():
+        conn = get_db_connection()
+        if conn is None:
+            yield None
+            return
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+        return
+
+    try:
+        pool = get_pool()
+        conn = pool.getconn()
+    except psycopg2.Error as e:
+        logger.critical(f"Database connection failed: {e}")
+        yield None
+        return
+
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        if not conn.closed:
+            conn.rollback()
+        raise
+    finally:
+        pool.putconn(conn)
+
+
 def get_or_create_id(cursor, table, column_prefix, value, cache=None):
     """
     Return an existing ID from a lookup table or create a new one.
@@ -55,4 +258,54 @@ def get_or_create_id(cursor, table, column_prefix, value, cache=None):
 
     except psycopg2.Error as e:
         logger.error(f"get_or_create_id failed for {table} value='{value}': {e}")
-        return None
\ No newline at end of file
+        return None
+
+def resolve_ids(cursor, table, column_prefix, names, cache=None):
+    """
+    Return a {name: id} map for a whole batch of lookup values, creating the missing ones.
+    Costs at most two round trips: one INSERT ... ON CONFLICT DO NOTHING RETURNING for the
+    new names and one SELECT for the names that already existed (or were inserted
+    concurrently by another loader). Empty and 'N/A' values are skipped, as in get_or_create_id.
+    """
+    resolved = {}
+    missing = set()
+    for name in names:
+        if not name or name == "N/A":
+            continue
+        if cache is not None and name in cache:
+            resolved[name] = cache[name]
+        else:
+            missing.add(name)
+
+    if not missing:
+        return resolved
+
+    name_field = f"{column_prefix}_name"
+    id_field = f"{column_prefix}_id"
+    # Sorted so concurrent loaders lock the unique index entries in the same order.
+    batch = sorted(missing)
+
+    try:
+        cursor.execute(
+            f"INSERT INTO {table} ({name_field}) SELECT unnest(%s::text[]) "
+            f"ON CONFLICT ({name_field}) DO NOTHING RETURNING {name_field}, {id_field}",
+            (batch,)
+        )
+        found = dict(cursor.fetchall())
+
+        existing = [name for name in batch if name not in found]
+        if existing:
+            cursor.execute(
+                f"SELECT {name_field}, {id_field} FROM {table} WHERE {name_field} = ANY(%s)",
+                (existing,)
+            )
+            found.update(cursor.fetchall())
+
+    except psycopg2.Error as e:
+        logger.error(f"resolve_ids failed for {table} ({len(batch)} values): {e}")
+        raise
+
+    if cache is not None:
+        cache.update(found)
+    resolved.update(found)
+    return resolved
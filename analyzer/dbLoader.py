@@ -1,11 +1,28 @@
 import json
 import os
 import logging
-from config import JSONL_OUTPUT_FILE 
-from .dbCore import get_db_connection, get_or_create_id 
+from config import (
+    JSONL_OUTPUT_FILE, JSONL_DELTA_OUTPUT_FILE, JSONL_COMPRESSION, DB_LOAD_MODE, CACHE_NOTIFY_CHANNEL,
+    QUERY_CACHE_PREWARM_ENTRIES,
+    SEARCH_TEXT_CONFIG,
+)
+from jobScraper.storage import output_path, open_jsonl
+from .dbCore import db_connection, resolve_ids, execute_values, is_sqlite
+from .queryCache import set_generation
+from .dbQueries import write_skill_dictionary
+from .sqliteBackend import SqliteCursor
+from .stagingTables import create_staging_tables, index_staging_tables, swap_staging_tables, staging_name
 
 logger = logging.getLogger(__name__)
 
+LOAD_MODES = ("rows", "bulk", "incremental", "swap")
+ROWS_BATCH_SIZE = 500
+
+# Hash of a staged posting's content; a job whose hash changes is rewritten and re-tagged.
+CONTENT_HASH_SQL = "md5(concat_ws(E'\\x1f', s.title, s.description, s.company, s.level, s.locations::text))"
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
 
 def create_schema(cursor):
     logger.info("Verifying database schema...")
@@ -65,6 +82,53 @@ def create_schema(cursor):
         PRIMARY KEY (job_id, location_id)
     );""")
     
+    # Incremental loads key jobs on their link and track when each posting was seen.
+    cursor.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS content_hash TEXT;")
+    cursor.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS skills_hash TEXT;")
+    cursor.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP;")
+    cursor.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS last_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP;")
+    cursor.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS closed_at TIMESTAMP;")
+
+    # Skill tagging state: jobs are re-tagged when description_hash moves away from skills_hash
+    # (the description hash they were tagged from); skill_dictionary holds the skill_keywords.json
+    # entries (JSON synonym lists) the current links were built with, so edits can be diffed.
+    cursor.execute(
+        "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS description_hash TEXT "
+        "GENERATED ALWAYS AS (md5(coalesce(description, ''))) STORED;")
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS skill_dictionary (
+        skill_name TEXT PRIMARY KEY,
+        synonyms TEXT NOT NULL
+    );""")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_job_skills_skill_id ON job_skills (skill_id);")
+
+    # Single-row counter the ETL bumps after each completed load; read-query caches key on it.
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS data_generation (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        generation BIGINT NOT NULL DEFAULT 0,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );""")
+    cursor.execute("INSERT INTO data_generation (id, generation) VALUES (1, 0) ON CONFLICT (id) DO NOTHING;")
+
+    # Dashboard aggregates, recomputed by refresh_dashboard_summaries() at the end of each ETL run.
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS dashboard_skill_stats (
+        skill_name TEXT PRIMARY KEY,
+        job_count INTEGER NOT NULL,
+        percentage NUMERIC(5, 1) NOT NULL,
+        skill_rank INTEGER NOT NULL
+    );""")
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS dashboard_level_stats (
+        level_name TEXT PRIMARY KEY,
+        job_count INTEGER NOT NULL
+    );""")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_dashboard_skill_rank ON dashboard_skill_stats (skill_rank);")
+
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_link ON jobs (link);")
+    if not isinstance(cursor, SqliteCursor):
+        create_search_indexes(cursor)
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_company_id ON jobs (company_id);")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_level_id ON jobs (level_id);")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_skills_name ON skills (skill_name);")
@@ -73,72 +137,450 @@ def create_schema(cursor):
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_experience_name ON experience_levels (level_name);")
 
 
-def load_raw_data_to_db():
-    if not os.path.exists(JSONL_OUTPUT_FILE):
-        logger.error(f"Error: {JSONL_OUTPUT_FILE} not found.")
+def create_search_indexes(cursor):
+    """
+    Postgres text search over postings: a generated tsvector over title (weight A) and
+    description (weight B), GIN-indexed for /api/jobs/search, plus trigram indexes on
+    title (get_popular_skills_for_profile) and description (skill re-tag candidates).
+    """
+    cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+    cursor.execute(f"""
+    ALTER TABLE jobs ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('{SEARCH_TEXT_CONFIG}', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('{SEARCH_TEXT_CONFIG}', coalesce(description, '')), 'B')
+    ) STORED;""")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_search ON jobs USING GIN (search_vector);")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_title_trgm ON jobs USING GIN (title gin_trgm_ops);")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_description_trgm ON jobs USING GIN (description gin_trgm_ops);")
+
+
+def _copy_field(value):
+    """Encodes one value for COPY ... FROM STDIN (text format)."""
+    if value is None:
+        return "\\N"
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def _staging_lines(f_json):
+    """Yields one COPY line per valid JSONL row: title, description, link, company, level, locations."""
+    for line in f_json:
+        try:
+            job = json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning(f"JSON Decode Error: {line[:50]}...")
+            continue
+        fields = (
+            job.get('title'), job.get('description'), job.get('link'),
+            job.get('company'), job.get('experience'),
+            json.dumps(job.get('locations') or [], ensure_ascii=False),
+        )
+        yield "\t".join(_copy_field(field) for field in fields) + "\n"
+
+
+class _CopyStream:
+    """Read-only file object over an iterator of COPY lines, so the snapshot is streamed to COPY."""
+
+    def __init__(self, lines):
+        self.lines = lines
+        self.pending = []
+        self.pending_size = 0
+
+    def read(self, size=-1):
+        while size < 0 or self.pending_size < size:
+            line = next(self.lines, None)
+            if line is None:
+                break
+            self.pending.append(line)
+            self.pending_size += len(line)
+
+        data = "".join(self.pending)
+        if 0 <= size < len(data):
+            data, rest = data[:size], data[size:]
+            self.pending, self.pending_size = [rest], len(rest)
+        else:
+            self.pending, self.pending_size = [], 0
+        return data
+
+
+def _stage_snapshot(cursor, f_json, job_id_default="NULL"):
+    """
+    COPYs a JSONL snapshot into the temp table staging_jobs (dropped on commit) and upserts
+    its companies, levels and locations set-wise.
+    """
+    cursor.execute(f"""
+    CREATE TEMP TABLE staging_jobs (
+        job_id INTEGER DEFAULT {job_id_default},
+        title TEXT,
+        description TEXT,
+        link TEXT,
+        company TEXT,
+        level TEXT,
+        locations JSONB
+    ) ON COMMIT DROP;""")
+
+    cursor.copy_expert(
+        "COPY staging_jobs (title, description, link, company, level, locations) FROM STDIN",
+        _CopyStream(_staging_lines(f_json)),
+    )
+
+    # Same rules as resolve_ids: empty and 'N/A' values get no dimension row.
+    cursor.execute("""
+    INSERT INTO companies (company_name)
+    SELECT DISTINCT company FROM staging_jobs
+    WHERE company IS NOT NULL AND company NOT IN ('', 'N/A')
+    ON CONFLICT (company_name) DO NOTHING;""")
+
+    cursor.execute("""
+    INSERT INTO experience_levels (level_name)
+    SELECT DISTINCT level FROM staging_jobs
+    WHERE level IS NOT NULL AND level NOT IN ('', 'N/A')
+    ON CONFLICT (level_name) DO NOTHING;""")
+
+    cursor.execute("""
+    INSERT INTO locations (location_name)
+    SELECT DISTINCT loc.name
+    FROM staging_jobs s, jsonb_array_elements_text(s.locations) AS loc(name)
+    WHERE loc.name NOT IN ('', 'N/A')
+    ON CONFLICT (location_name) DO NOTHING;""")
+
+
+def bulk_load_jobs(cursor, f_json, jobs_table="jobs", locations_table="job_locations"):
+    """
+    Loads a JSONL snapshot in a fixed number of statements: COPY into a temp staging table
+    (job ids drawn from the jobs sequence in file order), set-wise upserts of companies,
+    levels and locations, then one INSERT ... SELECT each for jobs and job_locations
+    (or the given tables, e.g. the swap-mode staging tables).
+    Returns the number of jobs inserted.
+    """
+    _stage_snapshot(cursor, f_json, "nextval(pg_get_serial_sequence('jobs', 'job_id')::regclass)")
+
+    cursor.execute("""
+    INSERT INTO {jobs_table} (job_id, title, description, link, company_id, level_id, content_hash)
+    SELECT s.job_id, s.title, s.description, s.link, c.company_id, l.level_id, {CONTENT_HASH_SQL}
+    FROM staging_jobs s
+    LEFT JOIN companies c ON c.company_name = s.company
+    LEFT JOIN experience_levels l ON l.level_name = s.level
+    ORDER BY s.job_id;""".format(jobs_table=jobs_table, CONTENT_HASH_SQL=CONTENT_HASH_SQL))
+    inserted_jobs_count = cursor.rowcount
+
+    cursor.execute(f"""
+    INSERT INTO {locations_table} (job_id, location_id)
+    SELECT DISTINCT s.job_id, loc.location_id
+    FROM staging_jobs s
+    CROSS JOIN LATERAL jsonb_array_elements_text(s.locations) AS names(name)
+    JOIN locations loc ON loc.location_name = names.name;""")
+
+    return inserted_jobs_count
+
+
+def incremental_load_jobs(cursor, f_json, close_missing=True):
+    """
+    Applies a JSONL snapshot as a delta keyed on the posting link: new links are inserted,
+    jobs whose content hash changed are updated in place (keeping their job_id) and have their
+    locations rewritten, unchanged jobs only get last_seen bumped, and open jobs missing
+    from the snapshot are marked closed. Skill links are left to the skill processor, which
+    re-tags jobs whose description_hash no longer matches skills_hash.
+    Postings without a link cannot be matched to a stored job and are skipped (the full
+    loads do insert them); their number is reported as "skipped".
+    close_missing=False leaves jobs missing from the file open, for partial snapshots such
+    as the delta scrape output.
+    Returns a dict with the new/changed/unchanged/closed/skipped counts.
+    """
+    _stage_snapshot(cursor, f_json)
+
+    cursor.execute("SELECT COUNT(*) FROM staging_jobs s WHERE s.link IS NULL OR s.link IN ('', 'N/A');")
+    skipped_count = cursor.fetchone()[0]
+    if skipped_count:
+        logger.warning(f"DB Loader: Skipping {skipped_count} postings without a link (incremental loads key on it).")
+
+    cursor.execute("""
+    CREATE TEMP TABLE incoming_jobs ON COMMIT DROP AS
+    SELECT DISTINCT ON (s.link)
+        s.link, s.title, s.description, c.company_id, l.level_id, s.locations,
+        {CONTENT_HASH_SQL} AS content_hash
+    FROM staging_jobs s
+    LEFT JOIN companies c ON c.company_name = s.company
+    LEFT JOIN experience_levels l ON l.level_name = s.level
+    WHERE s.link IS NOT NULL AND s.link NOT IN ('', 'N/A')
+    ORDER BY s.link;""".format(CONTENT_HASH_SQL=CONTENT_HASH_SQL))
+    cursor.execute("CREATE TEMP TABLE touched_jobs (job_id INTEGER PRIMARY KEY) ON COMMIT DROP;")
+
+    cursor.execute("""
+    WITH changed AS (
+        UPDATE jobs j
+        SET title = i.title, description = i.description,
+            company_id = i.company_id, level_id = i.level_id,
+            content_hash = i.content_hash, last_seen = now(), closed_at = NULL
+        FROM incoming_jobs i
+        WHERE j.link = i.link AND j.content_hash IS DISTINCT FROM i.content_hash
+        RETURNING j.job_id
+    )
+    INSERT INTO touched_jobs SELECT job_id FROM changed;""")
+    changed_count = cursor.rowcount
+
+    cursor.execute("""
+    UPDATE jobs j
+    SET last_seen = now(), closed_at = NULL
+    FROM incoming_jobs i
+    WHERE j.link = i.link AND j.content_hash = i.content_hash AND j.last_seen < now();""")
+    unchanged_count = cursor.rowcount
+
+    cursor.execute("""
+    WITH added AS (
+        INSERT INTO jobs (title, description, link, company_id, level_id, content_hash)
+        SELECT i.title, i.description, i.link, i.company_id, i.level_id, i.content_hash
+        FROM incoming_jobs i
+        WHERE NOT EXISTS (SELECT 1 FROM jobs j WHERE j.link = i.link)
+        RETURNING job_id
+    )
+    INSERT INTO touched_jobs SELECT job_id FROM added;""")
+    new_count = cursor.rowcount
+
+    closed_count = 0
+    if close_missing:
+        cursor.execute("""
+        UPDATE jobs SET closed_at = now()
+        WHERE closed_at IS NULL AND last_seen < now();""")
+        closed_count = cursor.rowcount
+
+    cursor.execute("DELETE FROM job_locations WHERE job_id IN (SELECT job_id FROM touched_jobs);")
+    cursor.execute("""
+    INSERT INTO job_locations (job_id, location_id)
+    SELECT DISTINCT j.job_id, loc.location_id
+    FROM touched_jobs t
+    JOIN jobs j ON j.job_id = t.job_id
+    JOIN incoming_jobs i ON i.link = j.link
+    CROSS JOIN LATERAL jsonb_array_elements_text(i.locations) AS names(name)
+    JOIN locations loc ON loc.location_name = names.name
+    ON CONFLICT DO NOTHING;""")
+
+    return {
+        "new": new_count, "changed": changed_count, "unchanged": unchanged_count,
+        "closed": closed_count, "skipped": skipped_count,
+    }
+
+
+def _insert_job_batch(cursor, batch, caches):
+    """Inserts a batch of parsed jobs with their location links (mode="rows"). Returns the job count."""
+    if not batch:
+        return 0
+
+    company_ids = resolve_ids(
+        cursor, "companies", "company", {job.get('company') for job in batch}, caches["companies"])
+    level_ids = resolve_ids(
+        cursor, "experience_levels", "level", {job.get('experience') for job in batch}, caches["experience_levels"])
+    location_ids = resolve_ids(
+        cursor, "locations", "location",
+        {loc for job in batch for loc in job.get('locations') or []}, caches["locations"])
+
+    inserted = execute_values(cursor, """
+        INSERT INTO jobs (title, description, link, company_id, level_id)
+        VALUES %s RETURNING job_id""", [
+        (job.get('title'), job.get('description'), job.get('link'),
+         company_ids.get(job.get('company')), level_ids.get(job.get('experience')))
+        for job in batch
+    ], fetch=True)
+
+    job_locations_to_insert = [
+        (job_id, location_ids[loc_name])
+        for (job_id,), job in zip(inserted, batch)
+        for loc_name in job.get('locations') or []
+        if loc_name in location_ids
+    ]
+    if job_locations_to_insert:
+        execute_values(cursor, """
+            INSERT INTO job_locations (job_id, location_id)
+            VALUES %s
+            ON CONFLICT DO NOTHING""", job_locations_to_insert)
+
+    return len(inserted)
+
+
+def effective_load_mode(mode):
+    """COPY, temp-table and swap loads need Postgres; the SQLite backend always loads with mode="rows"."""
+    if is_sqlite() and mode != "rows":
+        logger.warning(f"DB Loader: Load mode '{mode}' needs Postgres; using 'rows' on SQLite.")
+        return "rows"
+    return mode
+
+
+def load_raw_data_to_db(mode=DB_LOAD_MODE, delta=False):
+    """
+    Loads the JSONL snapshot into the jobs tables.
+    mode="bulk" replaces all jobs, streaming the file through COPY and resolving ids in SQL
+    (see bulk_load_jobs); mode="rows" replaces all jobs in batches of ROWS_BATCH_SIZE with
+    batch-resolved ids; mode="incremental" applies the snapshot as a delta keyed on the link,
+    keeping job ids stable (see incremental_load_jobs); mode="swap" bulk-loads into the
+    staging tables only, to be tagged with skills and swapped in by swap_in_staged_load.
+    delta=True loads the delta scrape output (new and changed postings only) instead; it
+    needs mode="incremental" and closes no jobs, since the file is not the whole market.
+    """
+    if mode not in LOAD_MODES:
+        raise ValueError(f"Unknown load mode '{mode}'. Expected one of {LOAD_MODES}.")
+    mode = effective_load_mode(mode)
+    if delta and mode != "incremental":
+        logger.error(f"DB Loader: A delta file can only be applied incrementally, not with mode '{mode}'.")
+        return False
+
+    snapshot_path = output_path(JSONL_DELTA_OUTPUT_FILE if delta else JSONL_OUTPUT_FILE, JSONL_COMPRESSION)
+    if not os.path.exists(snapshot_path):
+        logger.error(f"Error: {snapshot_path} not found.")
         return False
 
-    job_locations_to_insert = []
-    company_cache = {}
-    location_cache = {}
-    level_cache = {}
+    caches = {"companies": {}, "experience_levels": {}, "locations": {}}
     inserted_jobs_count = 0
 
     try:
-        with open(JSONL_OUTPUT_FILE, 'r', encoding='utf-8') as f_json, \
-             get_db_connection() as conn:
+        with open_jsonl(snapshot_path) as f_json, \
+             db_connection() as conn:
             
             if conn is None: 
                 logger.error("DB Loader: Could not get DB connection.")
                 return False
             
             cursor = conn.cursor()
-            
+
+            if mode == "incremental":
+                logger.info(f"DB Loader: Starting incremental load from {snapshot_path}...")
+                counts = incremental_load_jobs(cursor, f_json, close_missing=not delta)
+                conn.commit()
+                logger.info(
+                    f"DB Loader: Incremental load complete! {counts['new']} new, {counts['changed']} changed, "
+                    f"{counts['unchanged']} unchanged, {counts['closed']} closed, "
+                    f"{counts['skipped']} skipped without a link."
+                )
+                return True
+
+            if mode == "swap":
+                logger.info(f"DB Loader: Building staging tables from {snapshot_path}...")
+                create_staging_tables(cursor)
+                inserted_jobs_count = bulk_load_jobs(
+                    cursor, f_json, staging_name("jobs"), staging_name("job_locations"))
+                conn.commit()
+                logger.info(
+                    f"DB Loader: Staged {inserted_jobs_count} jobs. Live tables stay untouched "
+                    f"until swap_in_staged_load()."
+                )
+                return True
+
             logger.info("DB Loader: Clearing old data...")
             cursor.execute("TRUNCATE TABLE jobs, job_skills, job_locations RESTART IDENTITY CASCADE;")
             
-            logger.info(f"DB Loader: Starting raw data load from {JSONL_OUTPUT_FILE}...")
-            
+            logger.info(f"DB Loader: Starting raw data load from {snapshot_path} (mode: {mode})...")
+
+            if mode == "bulk":
+                inserted_jobs_count = bulk_load_jobs(cursor, f_json)
+                conn.commit()
+                logger.info(f"DB Loader: Bulk load complete! Inserted {inserted_jobs_count} jobs.")
+                return True
+
+            batch = []
             for line in f_json:
                 try:
-                    job = json.loads(line)
-                    company_id = get_or_create_id(cursor, "companies", "company", job.get('company'), company_cache)
-                    level_id = get_or_create_id(cursor, "experience_levels", "level", job.get('experience'), level_cache)
-
-                    cursor.execute("""
-                    INSERT INTO jobs (title, description, link, company_id, level_id)
-                    VALUES (%s, %s, %s, %s, %s)
-                    RETURNING job_id""", (
-                        job.get('title'), job.get('description'), job.get('link'),
-                        company_id, level_id
-                    ))
-                    job_id = cursor.fetchone()[0]
-                    inserted_jobs_count += 1
-
-                    locations_list = job.get('locations', [])
-                    if not locations_list:
-                        loc_name = "N/A"
-                        location_id = get_or_create_id(cursor, "locations", "location", loc_name, location_cache)
-                        if location_id: job_locations_to_insert.append((job_id, location_id))
-                    else:
-                        for loc_name in locations_list:
-                            location_id = get_or_create_id(cursor, "locations", "location", loc_name, location_cache)
-                            if location_id: job_locations_to_insert.append((job_id, location_id))
-                                
+                    batch.append(json.loads(line))
                 except json.JSONDecodeError:
                     logger.warning(f"JSON Decode Error: {line[:50]}...")
-            
-            if job_locations_to_insert:
-                cursor.executemany("""
-                    INSERT INTO job_locations (job_id, location_id) 
-                    VALUES (%s, %s) 
-                    ON CONFLICT DO NOTHING
-                """, job_locations_to_insert)
-            
+                    continue
+                if len(batch) >= ROWS_BATCH_SIZE:
+                    inserted_jobs_count += _insert_job_batch(cursor, batch, caches)
+                    batch = []
+            inserted_jobs_count += _insert_job_batch(cursor, batch, caches)
+
             conn.commit()
             logger.info(f"DB Loader: Raw data load complete! Inserted {inserted_jobs_count} jobs.")
             return True
 
     except Exception as e:
         logger.critical(f"General error during raw data load: {e}", exc_info=True)
-        return False
\ No newline at end of file
+        return False
+
+
+def swap_in_staged_load(skill_dictionary=None):
+    """
+    Indexes the staging tables filled by mode="swap" (and the skill processor), then swaps
+    them in for the live tables in one short transaction.
+    `skill_dictionary` (the entries the staged jobs were tagged with) is recorded in that same
+    transaction, so the applied dictionary always matches the live job_skills.
+    """
+    try:
+        with db_connection() as conn:
+            if conn is None:
+                logger.error("DB Loader: Could not get DB connection.")
+                return False
+            cursor = conn.cursor()
+
+            index_staging_tables(cursor)
+            conn.commit()
+
+            swap_staging_tables(cursor)
+            if skill_dictionary is not None:
+                write_skill_dictionary(cursor, skill_dictionary)
+            conn.commit()
+            logger.info("DB Loader: Staged load is live.")
+            return True
+
+    except Exception as e:
+        logger.critical(f"DB Loader: Swapping in the staged load failed: {e}", exc_info=True)
+        return False
+
+
+def refresh_dashboard_summaries(cursor):
+    """
+    Recomputes the dashboard aggregates over the open jobs. Runs in the caller's
+    transaction, so readers keep seeing the previous figures until it commits.
+    """
+    cursor.execute("DELETE FROM dashboard_skill_stats;")
+    cursor.execute("""
+        INSERT INTO dashboard_skill_stats (skill_name, job_count, percentage, skill_rank)
+        SELECT
+            s.skill_name,
+            COUNT(*),
+            ROUND(COUNT(*) * 100.0 / (SELECT COUNT(*) FROM jobs WHERE closed_at IS NULL), 1),
+            ROW_NUMBER() OVER (ORDER BY COUNT(*) DESC, s.skill_name)
+        FROM skills AS s
+        JOIN job_skills AS js ON s.skill_id = js.skill_id
+        JOIN jobs AS j ON js.job_id = j.job_id AND j.closed_at IS NULL
+        GROUP BY s.skill_name;
+    """)
+    skill_rows = cursor.rowcount
+
+    cursor.execute("DELETE FROM dashboard_level_stats;")
+    cursor.execute("""
+        INSERT INTO dashboard_level_stats (level_name, job_count)
+        SELECT el.level_name, COUNT(*)
+        FROM jobs AS j
+        JOIN experience_levels AS el ON j.level_id = el.level_id
+        WHERE j.closed_at IS NULL
+        GROUP BY el.level_name;
+    """)
+    logger.info(f"DB Loader: Refreshed dashboard summaries ({skill_rows} skills, {cursor.rowcount} levels).")
+
+
+def bump_data_generation():
+    """
+    Marks the loaded data as a new generation once the ETL has committed, which
+    invalidates every cached read query. On Postgres the generation is also sent with
+    NOTIFY (delivered on commit) to the cache listeners of the API processes.
+    Returns the new generation, or None on failure.
+    """
+    try:
+        with db_connection() as conn:
+            if conn is None:
+                logger.error("DB Loader: Could not get DB connection.")
+                return None
+            cursor = conn.cursor()
+            cursor.execute(
+                "UPDATE data_generation SET generation = generation + 1, updated_at = now() "
+                "WHERE id = 1 RETURNING generation;"
+            )
+            generation = cursor.fetchone()[0]
+            if not is_sqlite():
+                cursor.execute("SELECT pg_notify(%s, %s);", (CACHE_NOTIFY_CHANNEL, str(generation)))
+            conn.commit()
+    except Exception as e:
+        logger.error(f"DB Loader: Could not bump the data generation: {e}", exc_info=True)
+        return None
+
+    set_generation(generation, prewarm=QUERY_CACHE_PREWARM_ENTRIES)
+    logger.info(f"DB Loader: Data generation is now {generation}.")
+    return generation
@@ -1,72 +1,123 @@
 import psycopg2
 from psycopg2.extras import RealDictCursor
 import logging
-from .dbCore import get_db_connection, get_or_create_id
-from functools import lru_cache
+from .dbCore import db_connection, resolve_ids, execute_values
+from .sqliteBackend import SqliteConnection
+from config import SEARCH_TEXT_CONFIG, SKILL_CHUNK_SIZE
+from .queryCache import cached_query
 import json
+import re
 from pathlib import Path
+from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
-def get_jobs_to_process():
+def _jobs_to_process_query(pending_only, jobs_table):
+    query = f"SELECT job_id, description FROM {jobs_table} WHERE closed_at IS NULL"
+    if pending_only:
+        query += " AND skills_hash IS DISTINCT FROM description_hash"
+    return query
+
+def get_jobs_to_process(pending_only=False, jobs_table="jobs"):
     """ 
-    Fetches *all* jobs from the DB for skill processing.
+    Fetches all open jobs from the DB for skill processing.
+    pending_only=True returns only jobs whose description changed since they were last tagged
+    or were never tagged (skills_hash differs from description_hash).
+    jobs_table="jobs_staging" reads a swap-mode load that is not live yet.
     """
     jobs = []
     try:
-        with get_db_connection() as conn:
+        with db_connection() as conn:
             if conn is None: 
                 logger.error("DB Queries: Could not get DB connection in get_jobs_to_process.")
                 return []
             cursor = conn.cursor()
-            cursor.execute("SELECT job_id, description FROM jobs")
+            cursor.execute(_jobs_to_process_query(pending_only, jobs_table))
             jobs = cursor.fetchall()
             logger.info(f"DB Queries: Found {len(jobs)} jobs to process for skills.")
     except psycopg2.Error as e:
         logger.error(f"DB Queries: Error fetching jobs to process: {e}", exc_info=True)
     return jobs
 
-def save_processed_skills(processed_results: dict):
+def _write_skill_links(cursor, processed_results: dict, diff: bool, jobs_table: str, skills_table: str,
+                       only_skills=None):
+    """
+    Writes the links of `processed_results` within the caller's transaction. diff=True applies
+    the difference to the stored links of those jobs; otherwise the links are only inserted.
+    """
+    job_ids = list(processed_results)
+    skill_names = {
+        skill_name
+        for skills_list in processed_results.values() if skills_list
+        for skill_name in skills_list
+    }
+    skill_ids = resolve_ids(cursor, "skills", "skill", skill_names)
+    new_links = {
+        (job_id, skill_ids[skill_name])
+        for job_id, skills_list in processed_results.items() if skills_list
+        for skill_name in skills_list
+        if skill_name in skill_ids
+    }
+
+    links_to_insert = new_links
+    if diff:
+        query = f"SELECT js.job_id, js.skill_id FROM {skills_table} js WHERE js.job_id = ANY(%s)"
+        params = [job_ids]
+        if only_skills is not None:
+            query += " AND js.skill_id IN (SELECT skill_id FROM skills WHERE skill_name = ANY(%s))"
+            params.append(list(only_skills))
+        cursor.execute(query, tuple(params))
+        old_links = {tuple(row) for row in cursor.fetchall()}
+
+        links_to_delete = sorted(old_links - new_links)
+        links_to_insert = new_links - old_links
+        if links_to_delete:
+            logger.info(f"DB Queries: Removing {len(links_to_delete)} stale skill links...")
+            execute_values(
+                cursor, f"DELETE FROM {skills_table} WHERE (job_id, skill_id) IN (VALUES %s)", links_to_delete)
+
+    if links_to_insert:
+        logger.info(f"DB Queries: Inserting {len(links_to_insert)} skill links into {skills_table} table...")
+        # Postgres equivalent for INSERT OR IGNORE -> ON CONFLICT DO NOTHING
+        execute_values(cursor, f"""
+            INSERT INTO {skills_table} (job_id, skill_id) 
+            VALUES %s 
+            ON CONFLICT DO NOTHING
+        """, sorted(links_to_insert))
+
+    if only_skills is None:
+        cursor.execute(
+            f"UPDATE {jobs_table} SET skills_hash = description_hash WHERE job_id = ANY(%s);", (job_ids,))
+
+def save_processed_skills(processed_results: dict, replace_all: bool = True,
+                          jobs_table: str = "jobs", skills_table: str = "job_skills",
+                          only_skills=None):
     """
     Saves the processed skills (from skillProcessor) into the DB.
+    replace_all=True rewrites the whole links table. Otherwise only the difference between
+    the stored and the new links of the jobs in `processed_results` is applied, limited to
+    the skills named in `only_skills` when given (a rescan for changed dictionary entries).
+    Unless `only_skills` is given, processed jobs are stamped with skills_hash = description_hash.
+    The table arguments redirect the write to the swap-mode staging tables.
     """
     if not processed_results:
         logger.warning("DB Queries: No processed skills received to save (processed_results is empty).")
         return False
 
     logger.info(f"DB Queries: Starting to save processed skills for {len(processed_results)} jobs...")
-    all_job_skills_to_insert = []
-    skill_cache = {} 
 
     try:
-        with get_db_connection() as conn:
+        with db_connection() as conn:
             if conn is None: 
                 logger.error("DB Queries: Could not get DB connection in save_processed_skills.")
                 return False
             cursor = conn.cursor()
 
-            logger.info("DB Queries: Clearing old skill links (DELETE FROM job_skills)...")
-            cursor.execute("DELETE FROM job_skills;")
-
-            for job_id, skills_list in processed_results.items():
-                if not skills_list: continue
-
-                for skill_name in skills_list:
-                    if not skill_name: continue
-                    
-                    skill_id = get_or_create_id(cursor, "skills", "skill", skill_name, skill_cache)
-                    
-                    if skill_id:
-                        all_job_skills_to_insert.append((job_id, skill_id))
-
-            if all_job_skills_to_insert:
-                logger.info(f"DB Queries: Inserting {len(all_job_skills_to_insert)} skill links into job_skills table...")
-                # Postgres equivalent for INSERT OR IGNORE -> ON CONFLICT DO NOTHING
-                cursor.executemany("""
-                    INSERT INTO job_skills (job_id, skill_id) 
-                    VALUES (%s, %s) 
-                    ON CONFLICT DO NOTHING
-                """, all_job_skills_to_insert)
+            if replace_all:
+                logger.info(f"DB Queries: Clearing old skill links (DELETE FROM {skills_table})...")
+                cursor.execute(f"DELETE FROM {skills_table};")
+            _write_skill_links(cursor, processed_results, not replace_all, jobs_table, skills_table,
+                               only_skills=only_skills)
             
             conn.commit()
             logger.info("DB Queries: Saving processed skills complete!")
@@ -76,7 +127,144 @@ def save_processed_skills(processed_results: dict):
         logger.critical(f"DB Queries: Critical error while saving processed skills: {e}", exc_info=True)
         return False
 
-@lru_cache(maxsize=1)
+def iter_jobs_to_process(pending_only=False, jobs_table="jobs", batch_size=SKILL_CHUNK_SIZE):
+    """
+    Streaming get_jobs_to_process: yields lists of up to `batch_size` (job_id, description).
+    On Postgres the rows come from a named (server-side) cursor, so only one batch is held
+    in memory whatever the size of the corpus. Errors are logged and re-raised, so a
+    caller writing as it reads can roll its transaction back.
+    """
+    with db_connection() as conn:
+        if conn is None:
+            logger.error("DB Queries: Could not get DB connection in iter_jobs_to_process.")
+            return
+        try:
+            if isinstance(conn, SqliteConnection):
+                # sqlite3 already steps through the result set lazily.
+                cursor = conn.cursor()
+            else:
+                cursor = conn.cursor(name="jobs_to_process")
+                cursor.itersize = batch_size
+            cursor.execute(_jobs_to_process_query(pending_only, jobs_table))
+            streamed = 0
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    break
+                streamed += len(batch)
+                yield batch
+            cursor.close()
+            logger.info(f"DB Queries: Streamed {streamed} jobs to process for skills.")
+        except psycopg2.Error as e:
+            logger.error(f"DB Queries: Error streaming jobs to process: {e}", exc_info=True)
+            raise
+
+@contextmanager
+def skill_link_writer(replace_all: bool = True, jobs_table: str = "jobs", skills_table: str = "job_skills"):
+    """
+    Batch-by-batch save_processed_skills for results streamed from iter_jobs_to_process.
+    Yields write(processed_results); every batch is written as it arrives, and the whole
+    run is committed once when the block ends (rolled back when it raises), so readers
+    never see a half-rewritten links table. replace_all=True clears the links table before
+    the first batch; otherwise every batch is applied as a diff.
+    """
+    with db_connection() as conn:
+        if conn is None:
+            raise RuntimeError("DB Queries: Could not get DB connection in skill_link_writer.")
+        cursor = conn.cursor()
+        needs_clear = replace_all
+
+        def write(processed_results):
+            nonlocal needs_clear
+            if not processed_results:
+                return
+            if needs_clear:
+                logger.info(f"DB Queries: Clearing old skill links (DELETE FROM {skills_table})...")
+                cursor.execute(f"DELETE FROM {skills_table};")
+                needs_clear = False
+            _write_skill_links(cursor, processed_results, not replace_all, jobs_table, skills_table)
+
+        yield write
+        conn.commit()
+
+def get_retag_candidates(added_terms, linked_skills, jobs_table="jobs", skills_table="job_skills"):
+    """
+    Open jobs that a dictionary edit can affect: descriptions containing any of `added_terms`
+    (case-insensitive substring, served by the trigram index on description) plus jobs
+    currently linked to one of `linked_skills`. Returns [(job_id, description)].
+    """
+    parts, params = [], []
+    if added_terms:
+        parts.append(f"SELECT job_id FROM {jobs_table} WHERE description ~* %s")
+        params.append("|".join(re.escape(term) for term in sorted(added_terms)))
+    if linked_skills:
+        parts.append(
+            f"SELECT js.job_id FROM {skills_table} js JOIN skills s ON s.skill_id = js.skill_id "
+            f"WHERE s.skill_name = ANY(%s)")
+        params.append(sorted(linked_skills))
+    if not parts:
+        return []
+
+    query = f"""
+        WITH candidates AS ({" UNION ".join(parts)})
+        SELECT j.job_id, j.description
+        FROM {jobs_table} j
+        JOIN candidates c ON c.job_id = j.job_id
+        WHERE j.closed_at IS NULL
+        ORDER BY j.job_id
+    """
+    try:
+        with db_connection() as conn:
+            if conn is None:
+                logger.error("DB Queries: Could not get DB connection in get_retag_candidates.")
+                return []
+            cursor = conn.cursor()
+            cursor.execute(query, tuple(params))
+            jobs = cursor.fetchall()
+            logger.info(f"DB Queries: Found {len(jobs)} candidate jobs for re-tagging.")
+            return jobs
+    except psycopg2.Error as e:
+        logger.error(f"DB Queries: Error fetching re-tag candidates: {e}", exc_info=True)
+        return []
+
+def get_skill_dictionary():
+    """The skill_keywords.json entries (skill -> synonyms) the stored skill links were built with."""
+    try:
+        with db_connection() as conn:
+            if conn is None:
+                logger.error("DB Queries: Could not get DB connection in get_skill_dictionary.")
+                return {}
+            cursor = conn.cursor()
+            cursor.execute("SELECT skill_name, synonyms FROM skill_dictionary;")
+            return {skill_name: json.loads(synonyms) for skill_name, synonyms in cursor.fetchall()}
+    except psycopg2.Error as e:
+        logger.error(f"DB Queries: Error fetching the skill dictionary: {e}", exc_info=True)
+        return {}
+
+def write_skill_dictionary(cursor, entries: dict):
+    """Replaces the recorded dictionary entries within the caller's transaction."""
+    cursor.execute("DELETE FROM skill_dictionary;")
+    if entries:
+        execute_values(cursor, "INSERT INTO skill_dictionary (skill_name, synonyms) VALUES %s", [
+            (skill_name, json.dumps(synonyms, ensure_ascii=False)) for skill_name, synonyms in sorted(entries.items())
+        ])
+
+def save_skill_dictionary(entries: dict):
+    """Records the dictionary entries the skill links are now built with."""
+    try:
+        with db_connection() as conn:
+            if conn is None:
+                logger.error("DB Queries: Could not get DB connection in save_skill_dictionary.")
+                return False
+            write_skill_dictionary(conn.cursor(), entries)
+            conn.commit()
+            logger.info(f"DB Queries: Recorded {len(entries)} skill dictionary entries.")
+            return True
+    except psycopg2.Error as e:
+        logger.error(f"DB Queries: Error saving the skill dictionary: {e}", exc_info=True)
+        return False
+
+@cached_query(maxsize=16)
 def get_popular_skills(top_n=20):
     """
     Fetches the top N most popular skills.
@@ -87,6 +275,8 @@ def get_popular_skills(top_n=20):
             COUNT(js.job_id) AS job_count
         FROM skills AS s
         JOIN job_skills AS js ON s.skill_id = js.skill_id
+        JOIN jobs AS j ON js.job_id = j.job_id
+        WHERE j.closed_at IS NULL
         GROUP BY s.skill_name
         ORDER BY job_count DESC
         LIMIT %s
@@ -94,7 +284,7 @@ def get_popular_skills(top_n=20):
     
     results = []
     try:
-        with get_db_connection() as conn:
+        with db_connection() as conn:
             if conn is None: 
                 logger.error("DB Queries: Could not get DB connection in get_popular_skills.")
                 return []
@@ -107,6 +297,7 @@ def get_popular_skills(top_n=20):
     
     return results
 
+@cached_query()
 def find_matching_jobs(
     user_skills_list: list, 
     target_level_names: list, 
@@ -119,7 +310,7 @@ def find_matching_jobs(
     """
     
     try:
-        with get_db_connection() as conn:
+        with db_connection() as conn:
             if conn is None: 
                 logger.error("DB Queries: Could not get DB connection in find_matching_jobs.")
                 return []
@@ -163,7 +354,7 @@ def find_matching_jobs(
                     SUM(CASE WHEN js.skill_id IN ({skill_id_placeholders}) THEN 1 ELSE 0 END) AS user_matched_skills
                 FROM job_skills AS js
                 JOIN jobs AS j ON js.job_id = j.job_id
-                WHERE j.level_id IN ({level_id_placeholders})
+                WHERE j.level_id IN ({level_id_placeholders}) AND j.closed_at IS NULL
                 GROUP BY js.job_id, j.title, j.link, j.level_id, j.company_id
             ),
             JobPenalizedStats AS (
@@ -209,6 +400,7 @@ def find_matching_jobs(
         logger.error(f"DB Queries: Critical error in find_matching_jobs: {e}", exc_info=True)
         return []
 
+@cached_query()
 def get_experience_level_distribution():
     """
     Counts the number of jobs for each experience level (for dashboard pie chart).
@@ -219,13 +411,14 @@ def get_experience_level_distribution():
             COUNT(j.job_id) AS count
         FROM jobs AS j
         JOIN experience_levels AS el ON j.level_id = el.level_id
+        WHERE j.closed_at IS NULL
         GROUP BY el.level_name
         ORDER BY count DESC;
     """
     
     results = []
     try:
-        with get_db_connection() as conn:
+        with db_connection() as conn:
             if conn is None: 
                 logger.error("DB Queries: Could not get DB connection in get_experience_level_distribution.")
                 return []
@@ -240,13 +433,14 @@ def get_experience_level_distribution():
     
     return results
 
+@cached_query()
 def get_skill_popularity_percentages(top_n=20):
     """
     Returns a list of skills + job count + percentage of total jobs.
     """
     query = """
         WITH total_jobs AS (
-            SELECT COUNT(*) AS total_count FROM jobs
+            SELECT COUNT(*) AS total_count FROM jobs WHERE closed_at IS NULL
         )
         SELECT 
             s.skill_name AS skill,
@@ -254,6 +448,7 @@ def get_skill_popularity_percentages(top_n=20):
             ROUND((COUNT(js.job_id) * 100.0 / tj.total_count), 1) AS percentage
         FROM skills AS s
         JOIN job_skills AS js ON s.skill_id = js.skill_id
+        JOIN jobs AS j ON js.job_id = j.job_id AND j.closed_at IS NULL
         CROSS JOIN total_jobs AS tj
         GROUP BY s.skill_name, tj.total_count
         ORDER BY job_count DESC
@@ -261,7 +456,7 @@ def get_skill_popularity_percentages(top_n=20):
     """
 
     try:
-        with get_db_connection() as conn:
+        with db_connection() as conn:
             if conn is None:
                 logger.error("DB Queries: Could not get DB connection in get_skill_popularity_percentages.")
                 return []
@@ -274,17 +469,63 @@ def get_skill_popularity_percentages(top_n=20):
         logger.error(f"DB Queries: Error fetching skills with percentages: {e}", exc_info=True)
         return []
 
-@lru_cache(maxsize=128)
+@cached_query(maxsize=16)
+def get_dashboard_summary(top_n=10):
+    """
+    Reads the dashboard aggregates precomputed by the ETL in one round trip.
+    Returns {"skills": [(skill, job_count, percentage)], "levels": [{"name", "count"}]},
+    or {} when the summaries are missing (e.g. before the first ETL run) or on error.
+    """
+    query = """
+        SELECT 'skill' AS kind, skill_name AS name, job_count, percentage, skill_rank AS rank
+        FROM dashboard_skill_stats
+        WHERE skill_rank <= %s
+        UNION ALL
+        SELECT 'level', level_name, job_count, NULL, NULL
+        FROM dashboard_level_stats
+        ORDER BY kind, rank, job_count DESC;
+    """
+
+    try:
+        with db_connection() as conn:
+            if conn is None:
+                logger.error("DB Queries: Could not get DB connection in get_dashboard_summary.")
+                return {}
+            cursor = conn.cursor()
+            cursor.execute(query, (top_n,))
+            rows = cursor.fetchall()
+    except psycopg2.Error as e:
+        logger.error(f"DB Queries: Error fetching dashboard summary: {e}", exc_info=True)
+        return {}
+
+    skills = [(name, job_count, percentage) for kind, name, job_count, percentage, _ in rows if kind == "skill"]
+    levels = [{"name": name, "count": job_count} for kind, name, job_count, _, _ in rows if kind == "level"]
+    if not skills and not levels:
+        return {}
+    return {"skills": skills, "levels": levels}
+
+PROFILE_SKILLS_QUERY = """
+    SELECT s.skill_name, COUNT(js.job_id) AS job_count
+    FROM skills s
+    JOIN job_skills js ON s.skill_id = js.skill_id
+    JOIN jobs j ON js.job_id = j.job_id
+    WHERE {title_filter} AND j.closed_at IS NULL
+    GROUP BY s.skill_name
+    ORDER BY job_count DESC
+    LIMIT %s
+"""
+
+@cached_query(maxsize=128)
 def get_popular_skills_for_profile(profile_name: str, top_n: int = 20):
     """
     Fetches the most popular skills for a specific profile.
-    Tries 2 methods: by title LIKE, by keywords.
+    Tries 2 methods: title contains the profile name, title matches any of its keywords.
     """
     if not profile_name:
         return []
 
     try:
-        with get_db_connection() as conn:
+        with db_connection() as conn:
             if conn is None: 
                 logger.error("DB Queries: Could not get DB connection in get_popular_skills_for_profile.")
                 return []
@@ -292,43 +533,24 @@ def get_popular_skills_for_profile(profile_name: str, top_n: int = 20):
             
             # --- התיקון החשוב: מחקנו את החיפוש לפי profile_name ---
 
-            # ניסיון 1: לפי כותרת המשרה (LIKE)
+            # ניסיון 1: לפי כותרת המשרה (ILIKE, על אינדקס ה-trigram)
             try:
-                cursor.execute("""
-                    SELECT s.skill_name, COUNT(js.job_id) AS job_count
-                    FROM skills s
-                    JOIN job_skills js ON s.skill_id = js.skill_id
-                    JOIN jobs j ON js.job_id = j.job_id
-                    WHERE LOWER(j.title) LIKE LOWER(%s)
-                    GROUP BY s.skill_name
-                    ORDER BY job_count DESC
-                    LIMIT %s
-                """, (f"%{profile_name}%", top_n))
+                cursor.execute(PROFILE_SKILLS_QUERY.format(title_filter="j.title ILIKE %s"),
+                               (f"%{profile_name}%", top_n))
                 rows = cursor.fetchall()
                 if rows:
-                    logger.info(f"DB Queries: Found {len(rows)} skills for profile '{profile_name}' (by title LIKE).")
+                    logger.info(f"DB Queries: Found {len(rows)} skills for profile '{profile_name}' (by title).")
                     return [r[0] for r in rows]
             except psycopg2.Error as e:
                 # אם נכשל - חייבים לעשות rollback כדי לא לתקוע את החיבור
                 logger.warning(f"Query failed inside get_popular_skills_for_profile (method 1): {e}")
                 conn.rollback()
 
-            # ניסיון 2: לפי מילות מפתח
+            # ניסיון 2: לפי מילות מפתח - regex אחד במקום שרשרת של LIKE, גם הוא על אינדקס ה-trigram
             try:
                 keywords = profile_name.lower().split()
-                placeholders = " OR ".join(["LOWER(j.title) LIKE %s"] * len(keywords))
-                params = [f"%{kw}%" for kw in keywords] + [top_n]
-                
-                cursor.execute(f"""
-                    SELECT s.skill_name, COUNT(js.job_id) AS job_count
-                    FROM skills s
-                    JOIN job_skills js ON s.skill_id = js.skill_id
-                    JOIN jobs j ON js.job_id = j.job_id
-                    WHERE {placeholders}
-                    GROUP BY s.skill_name
-                    ORDER BY job_count DESC
-                    LIMIT %s
-                """, tuple(params))
+                pattern = "|".join(re.escape(kw) for kw in keywords)
+                cursor.execute(PROFILE_SKILLS_QUERY.format(title_filter="j.title ~* %s"), (pattern, top_n))
                 rows = cursor.fetchall()
                 if rows:
                     logger.info(f"DB Queries: Found {len(rows)} skills for profile '{profile_name}' (by keywords).")
@@ -344,6 +566,64 @@ def get_popular_skills_for_profile(profile_name: str, top_n: int = 20):
     logger.warning(f"DB Queries: No skills found at all for profile '{profile_name}'.")
     return []
 
+JOB_SEARCH_QUERY = f"""
+    WITH q AS (SELECT websearch_to_tsquery('{SEARCH_TEXT_CONFIG}', %s) AS query)
+    SELECT j.job_id, j.title, c.company_name AS company, el.level_name AS level, j.link,
+           ts_rank_cd(j.search_vector, q.query) AS rank,
+           COUNT(*) OVER () AS total
+    FROM jobs j
+    CROSS JOIN q
+    LEFT JOIN companies c ON j.company_id = c.company_id
+    LEFT JOIN experience_levels el ON j.level_id = el.level_id
+    WHERE j.search_vector @@ q.query AND j.closed_at IS NULL
+    ORDER BY rank DESC, j.job_id DESC
+    LIMIT %s OFFSET %s
+"""
+
+# SQLite has no tsvector: substring match, title hits ranked above description hits.
+JOB_SEARCH_QUERY_SQLITE = """
+    SELECT j.job_id, j.title, c.company_name AS company, el.level_name AS level, j.link,
+           (CASE WHEN j.title LIKE %s THEN 2 ELSE 0 END) + (CASE WHEN j.description LIKE %s THEN 1 ELSE 0 END) AS rank,
+           COUNT(*) OVER () AS total
+    FROM jobs j
+    LEFT JOIN companies c ON j.company_id = c.company_id
+    LEFT JOIN experience_levels el ON j.level_id = el.level_id
+    WHERE (j.title LIKE %s OR j.description LIKE %s) AND j.closed_at IS NULL
+    ORDER BY rank DESC, j.job_id DESC
+    LIMIT %s OFFSET %s
+"""
+
+@cached_query(maxsize=256)
+def search_jobs(text: str, limit: int = 20, offset: int = 0):
+    """
+    Ranked full-text search over open postings (title and description).
+    Returns {"total": int, "results": [dict]}, or {} on error.
+    """
+    try:
+        with db_connection() as conn:
+            if conn is None:
+                logger.error("DB Queries: Could not get DB connection in search_jobs.")
+                return {}
+            if isinstance(conn, SqliteConnection):
+                pattern = f"%{text}%"
+                query, params = JOB_SEARCH_QUERY_SQLITE, (pattern, pattern, pattern, pattern, limit, offset)
+            else:
+                query, params = JOB_SEARCH_QUERY, (text, limit, offset)
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            cursor.execute(query, params)
+            rows = [dict(row) for row in cursor.fetchall()]
+    except psycopg2.Error as e:
+        logger.error(f"DB Queries: Error searching jobs for '{text}': {e}", exc_info=True)
+        return {}
+
+    total = rows[0]["total"] if rows else 0
+    for row in rows:
+        del row["total"]
+        row["rank"] = float(row["rank"])
+    logger.info(f"DB Queries: Job search '{text}' matched {total} postings.")
+    return {"total": total, "results": rows}
+
+@cached_query(maxsize=1, ttl=None)
 def get_all_canonical_profiles():
     """Load canonical profiles from JSON file."""
     path = Path(__file__).parent / "ProfileConfig.json"
@@ -357,7 +637,7 @@ def get_all_canonical_profiles():
         logger.critical(f"CRITICAL ERROR: Failed to load ProfileConfig.json: {e}", exc_info=True)
         return []
     
-@lru_cache(maxsize=1)
+@cached_query(maxsize=1, ttl=None)
 def get_level_hierarchy():
     """Loads the level hierarchy from ProfileConfig.json file."""
     path = Path(__file__).parent / "ProfileConfig.json"
@@ -374,7 +654,7 @@ def get_level_hierarchy():
         logger.critical(f"CRITICAL ERROR: Failed to load ProfileConfig.json: {e}", exc_info=True)
         return {}
 
-@lru_cache(maxsize=1) 
+@cached_query(maxsize=1, ttl=None)
 def get_all_canonical_skills():
     """Load canonical skills map from JSON file and return its keys."""
     
@@ -395,7 +675,7 @@ def get_all_canonical_skills():
         logger.critical(f"CRITICAL ERROR: Failed to load skill_keywords.json: {e}", exc_info=True)
         return []
 
-@lru_cache(maxsize=1)
+@cached_query(maxsize=1, ttl=None)
 def get_skill_keywords_dict():
     """Loads the full skill keywords dictionary (with synonyms)."""
     path = Path(__file__).parent / "skill_keywords.json"
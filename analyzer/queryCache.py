@@ -0,0 +1,159 @@
+import time
+import logging
+import functools
+import threading
+from collections import OrderedDict
+
+from config import QUERY_CACHE_TTL_SECONDS, QUERY_CACHE_MAX_ENTRIES
+
+logger = logging.getLogger(__name__)
+
+_generation = 0
+_generation_lock = threading.Lock()
+_registry = {}
+
+
+def current_generation():
+    """Data generation the cached results belong to (bumped by the ETL after each load)."""
+    return _generation
+
+
+def set_generation(generation, prewarm=0):
+    """
+    Moves the cache to `generation` and drops every cached result. Any change counts, not
+    only a higher number: after a database reset or restore the generation starts over.
+    With prewarm > 0, the `prewarm` most recently used calls of each cached query are
+    re-run right away, so the first requests after an ETL run don't all miss.
+    Returns True when the generation changed.
+    """
+    global _generation
+    with _generation_lock:
+        if generation == _generation:
+            return False
+        _generation = generation
+    hot_calls = [
+        (func, args, kwargs)
+        for cache, func in _registry.values()
+        for args, kwargs in cache.recent_calls(prewarm)
+    ]
+    clear_all()
+    logger.info(f"Query Cache: Now at data generation {generation}; caches cleared.")
+
+    for func, args, kwargs in hot_calls:
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            logger.warning(f"Query Cache: Pre-warming {func.__name__} failed: {e}")
+    if hot_calls:
+        logger.info(f"Query Cache: Pre-warmed {len(hot_calls)} entries.")
+    return True
+
+
+def clear_all():
+    for cache, _ in _registry.values():
+        cache.clear()
+
+
+def cache_stats():
+    """Hit/miss/eviction counters of every registered cache, keyed by function name."""
+    return {name: cache.stats() for name, (cache, _) in _registry.items()}
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+class QueryCache:
+    """Thread-safe LRU cache with a per-entry TTL and hit/miss/eviction counters."""
+
+    def __init__(self, maxsize=QUERY_CACHE_MAX_ENTRIES, ttl=QUERY_CACHE_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Returns (True, value) on a fresh hit, (False, None) otherwise."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                value, expires_at, _ = entry
+                if expires_at is None or time.monotonic() < expires_at:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self.entries[key]
+                self.evictions += 1
+            self.misses += 1
+            return False, None
+
+    def set(self, key, value, call=None):
+        """`call` is the original (args, kwargs), kept so the entry can be pre-warmed later."""
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        with self.lock:
+            self.entries[key] = (value, expires_at, call)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def recent_calls(self, limit):
+        """(args, kwargs) of up to `limit` most recently used entries, most recent first."""
+        if limit <= 0:
+            return []
+        with self.lock:
+            calls = [call for _, _, call in reversed(self.entries.values()) if call is not None]
+        return calls[:limit]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "size": len(self.entries),
+            }
+
+
+def cached_query(maxsize=QUERY_CACHE_MAX_ENTRIES, ttl=QUERY_CACHE_TTL_SECONDS):
+    """
+    Caches a read query per (data generation, arguments). List arguments are frozen into
+    tuples so they can be part of the key. Empty results (what the query functions return
+    after a DB error) are not cached. Like lru_cache, the wrapper has cache_clear() and
+    cache_info().
+    """
+    def decorator(func):
+        cache = QueryCache(maxsize=maxsize, ttl=ttl)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (current_generation(), _freeze(args), _freeze(kwargs))
+            hit, value = cache.get(key)
+            if hit:
+                return value
+            value = func(*args, **kwargs)
+            if value:
+                cache.set(key, value, call=(args, kwargs))
+            return value
+
+        wrapper.cache_clear = cache.clear
+        wrapper.cache_info = cache.stats
+        _registry[func.__qualname__] = (cache, wrapper)
+        return wrapper
+
+    return decorator
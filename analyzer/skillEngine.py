@@ -0,0 +1,102 @@
+import re
+import logging
+from collections import defaultdict
+
+logger = logging.getLogger(__name__)
+
+
+def expand_synonyms(raw_list):
+    """Synonym list from skill_keywords.json, with comma-separated entries split up."""
+    out = set()
+    for item in raw_list:
+        if not isinstance(item, str):
+            continue
+        out.update(part.strip() for part in item.split(',') if part.strip())
+    return out
+
+
+def _is_word(ch):
+    # Same test as the \w of a str pattern.
+    return ch.isalnum() or ch == "_"
+
+
+def _trie_regex(words):
+    """
+    One regex for a set of lowercase words, shaped as a trie so each position only
+    follows the branch of its next character. Greedy optionals make it match the
+    longest word starting at a position.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def node_regex(node):
+        branches = [re.escape(ch) + node_regex(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return node_regex(trie)
+
+
+class SkillEngine:
+    """
+    Finds the canonical skills of a text in a single pass.
+
+    All synonyms are compiled into one case-insensitive trie regex that reports, at
+    every word start, the longest synonym beginning there; shorter synonyms at the
+    same position are prefixes of it and are looked up by length. Each candidate then
+    gets the boundary rules of the per-skill patterns it replaces:
+    not preceded or followed by a word character or '-', except the bare "c" of
+    skill "c", which may follow '-' but must not touch '+' or '#' (so c++ and c#
+    are not C).
+    """
+
+    def __init__(self, skill_keywords):
+        self.owners = defaultdict(list)
+        for canonical_name, synonyms in skill_keywords.items():
+            for synonym in expand_synonyms(synonyms):
+                strict_c = canonical_name == 'c' and synonym.lower() == 'c'
+                self.owners[synonym.lower()].append((canonical_name, strict_c))
+
+        self.lengths = sorted({len(synonym) for synonym in self.owners})
+        self.skill_count = len({name for owners in self.owners.values() for name, _ in owners})
+        # Only a word character rules a position out for every synonym; the rest is per synonym.
+        self.pattern = (
+            re.compile(r"(?<!\w)(?=(" + _trie_regex(self.owners) + "))", re.IGNORECASE) if self.owners else None
+        )
+
+    def extract(self, text):
+        found = set()
+        if not text or self.pattern is None:
+            return found
+        text_length = len(text)
+
+        for match in self.pattern.finditer(text):
+            start = match.start()
+            longest = len(match.group(1))
+            before = text[start - 1] if start else ""
+
+            for length in self.lengths:
+                if length > longest:
+                    break
+                owners = self.owners.get(text[start:start + length].lower())
+                if not owners:
+                    continue
+                end = start + length
+                after = text[end] if end < text_length else ""
+                after_is_word = after != "" and _is_word(after)
+                for canonical_name, strict_c in owners:
+                    if canonical_name in found or after_is_word:
+                        continue
+                    if strict_c:
+                        if before in ("+", "#") or after in ("+", "#"):
+                            continue
+                    elif before == "-" or after == "-":
+                        continue
+                    found.add(canonical_name)
+        return found
@@ -1,14 +1,25 @@
+import os
 import time
 import re
 import json
 import logging
 from pathlib import Path
+from itertools import chain
+from collections import deque
+from multiprocessing import get_context
 from functools import lru_cache
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 
+from config import SKILL_EXECUTOR, SKILL_PROCESS_WORKERS, SKILL_CHUNK_SIZE
 from . import dbQueries
+from .stagingTables import staging_name
+from .skillEngine import SkillEngine, expand_synonyms
 
 MAX_WORKERS = 10
+SKILL_EXECUTORS = ("process", "thread")
+
+# Engine of a skill-extraction worker process, built once by _init_worker.
+_worker_engine = None
 
 @lru_cache(maxsize=1)
 def _load_skill_keywords() -> dict:
@@ -27,24 +38,25 @@ def _load_skill_keywords() -> dict:
         logging.error(f"Corrupt skill_keywords.json file: {e}")
         raise ValueError(f"Corrupt skill_keywords.json file: {e}") from e
 
+@lru_cache(maxsize=1)
+def _get_skill_engine() -> SkillEngine:
+    engine = SkillEngine(_load_skill_keywords())
+    logging.info(f"Skill engine built: {engine.skill_count} canonical skills in a single automaton.")
+    return engine
+
 @lru_cache(maxsize=1)
 def _get_compiled_skill_engine() -> list:
+    """
+    The previous engine: one regex per canonical skill, each searched separately.
+    Kept as the reference SkillEngine is checked against (tests, benchmarks/benchSkillEngine.py).
+    """
     logging.info("Building skill engine (Regex) for the first time...")
     
     SKILL_KEYWORDS = _load_skill_keywords()
     COMPILED_SKILLS = []
 
-    def expand_synonyms_list(raw_list):
-        out = set()
-        for item in raw_list:
-            if not isinstance(item, str):
-                continue
-            parts = [p.strip() for p in item.split(',') if p.strip()]
-            out.update(parts)
-        return list(out)
-
     for canonical_name, synonyms in SKILL_KEYWORDS.items():
-        expanded_synonyms = expand_synonyms_list(synonyms)
+        expanded_synonyms = expand_synonyms(synonyms)
         expanded_synonyms = sorted(list(set(expanded_synonyms)), key=lambda s: -len(s))
 
         patterns = []
@@ -67,63 +79,312 @@ def _get_compiled_skill_engine() -> list:
     logging.info(f"Skill engine built: {len(COMPILED_SKILLS)} canonical skills ready for scanning.")
     return COMPILED_SKILLS
 
+def extract_skills_per_pattern(description) -> set:
+    """Reference extraction with the per-skill regexes of _get_compiled_skill_engine."""
+    if not description:
+        return set()
+    return {
+        canonical_name
+        for canonical_name, regex_pattern in _get_compiled_skill_engine()
+        if regex_pattern.search(description)
+    }
+
 def extract_skills_from_text(job_id, description) -> tuple:
     if not description:
         return job_id, []
 
-    COMPILED_SKILLS = _get_compiled_skill_engine()
-    
-    found_skills_canonical = set()
+    return job_id, list(_get_skill_engine().extract(description))
 
-    for canonical_name, regex_pattern in COMPILED_SKILLS:
-        if regex_pattern.search(description):
-            found_skills_canonical.add(canonical_name)
+def _init_worker(skill_keywords):
+    global _worker_engine
+    _worker_engine = SkillEngine(skill_keywords)
 
-    return job_id, list(found_skills_canonical)
+def _extract_chunk(chunk):
+    return [(job_id, list(_worker_engine.extract(description))) for job_id, description in chunk]
 
-def run_skill_processor():
-    logging.info("Starting Stage 3: Skill Processing (Keyword Processor)...")
+def _chunks(jobs, chunk_size):
+    for start in range(0, len(jobs), chunk_size):
+        yield jobs[start:start + chunk_size]
 
-    jobs_to_process = dbQueries.get_jobs_to_process()
+def _extract_in_processes(chunks, skill_keywords, workers):
+    """
+    Yields one list of (job_id, skills) per chunk, scanned in a pool of `workers`
+    processes that each build the engine once. `chunks` is consumed lazily: at most
+    2 * workers chunks are in flight, and batches come back in submission order.
+    A chunk that fails raises, so the caller's save is rolled back rather than leaving
+    its jobs with their links cleared and never re-tagged.
+    Workers are spawned, not forked: the caller may be the API process, whose server and
+    cache listener threads can hold locks a forked child would inherit.
+    """
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"),
+                             initializer=_init_worker, initargs=(skill_keywords,)) as executor:
+        pending = deque()
 
-    if not jobs_to_process:
-        logging.info("No jobs found in DB. Process stopped.")
-        return
+        def collect_oldest():
+            chunk, future = pending.popleft()
+            try:
+                return future.result()
+            except Exception as e:
+                logging.error(f"Error processing jobs {chunk[0][0]}..{chunk[-1][0]}: {e}")
+                raise
 
-    start_time = time.time()
-    results_dict = {}
-    processed_count = 0
-    total_jobs = len(jobs_to_process)
+        for chunk in chunks:
+            pending.append((chunk, executor.submit(_extract_chunk, chunk)))
+            if len(pending) >= 2 * workers:
+                yield collect_oldest()
+        while pending:
+            yield collect_oldest()
+
+def _extract_in_threads(jobs, engine):
+    """Yields a one-job batch per finished future (the GIL keeps the scanning on one core)."""
+    def extract(job_id, description):
+        return job_id, list(engine.extract(description))
 
     with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        logging.info(f"Scanning {total_jobs} job descriptions using {MAX_WORKERS} workers...")
-        
         future_to_job = {
-            executor.submit(extract_skills_from_text, job_id, desc): job_id
-            for job_id, desc in jobs_to_process
+            executor.submit(extract, job_id, desc): job_id
+            for job_id, desc in jobs
         }
 
         for future in as_completed(future_to_job):
             try:
-                job_id, skills_list = future.result()
-                results_dict[job_id] = skills_list
-                processed_count += 1
-                
-                if processed_count % 20 == 0 or processed_count == total_jobs:
-                    logging.info(f"    ...Processing: {processed_count}/{total_jobs} completed.")
+                yield [future.result()]
             except Exception as e:
                 job_id = future_to_job[future]
                 logging.error(f"Error processing job_id {job_id}: {e}")
+                raise
+
+def _extract_batches(chunks, skill_keywords, executor, workers):
+    """
+    Yields one list of (job_id, skills) per chunk of (job_id, description).
+    "process" scans the chunks in a process pool, or in-process when there is only one;
+    "thread" scans each chunk with the per-job thread pool.
+    """
+    chunks = iter(chunks)
+    if executor != "process":
+        engine = SkillEngine(skill_keywords)
+        for chunk in chunks:
+            yield [result for batch in _extract_in_threads(chunk, engine) for result in batch]
+        return
+
+    first = next(chunks, None)
+    second = next(chunks, None)
+    if second is None:
+        if first:
+            engine = SkillEngine(skill_keywords)
+            yield [(job_id, list(engine.extract(desc))) for job_id, desc in first]
+        return
+    yield from _extract_in_processes(chain((first, second), chunks), skill_keywords, workers or os.cpu_count() or 1)
+
+def _scan_jobs(jobs, skill_keywords, executor, workers, chunk_size) -> dict:
+    """Extracts the skills of `skill_keywords` from every (job_id, description); returns {job_id: skills}."""
+    results_dict = {}
+    processed_count = 0
+    total_jobs = len(jobs)
 
-    scan_end_time = time.time()
-    logging.info(f"Text scanning complete in {scan_end_time - start_time:.2f} seconds.")
+    if executor == "process" and total_jobs > chunk_size:
+        logging.info(f"Scanning {total_jobs} job descriptions in {workers or os.cpu_count() or 1} processes, "
+                     f"{chunk_size} jobs per chunk...")
+    elif executor == "process":
+        logging.info(f"Scanning {total_jobs} job descriptions in-process...")
+    else:
+        logging.info(f"Scanning {total_jobs} job descriptions using {MAX_WORKERS} workers...")
 
-    logging.info("Saving results to DB...")
-    save_success = dbQueries.save_processed_skills(results_dict)
+    next_report = 0
+    for batch in _extract_batches(_chunks(jobs, chunk_size), skill_keywords, executor, workers):
+        results_dict.update(batch)
+        processed_count += len(batch)
+        if processed_count >= next_report or processed_count == total_jobs:
+            logging.info(f"    ...Processing: {processed_count}/{total_jobs} completed.")
+            next_report = processed_count + max(20, total_jobs // 20)
+    return results_dict
+
+def _tag_streamed_jobs(skill_keywords, jobs_table, skills_table, pending_only,
+                       executor, workers, chunk_size, tagged_ids=None):
+    """
+    Tags open jobs (only the pending ones with pending_only=True) while they stream from a
+    server-side cursor in batches of `chunk_size`, and writes every scanned batch right away:
+    a full run rewrites job_skills, a pending run applies a diff, each in one transaction.
+    Only the batches in flight are held in memory, whatever the number of jobs.
+    Ids of the tagged jobs are added to `tagged_ids` when given.
+    Returns (saved, number of jobs tagged).
+    """
+    tagged_count = 0
+    next_report = 10 * chunk_size
+    try:
+        with dbQueries.skill_link_writer(replace_all=not pending_only, jobs_table=jobs_table,
+                                         skills_table=skills_table) as write:
+            chunks = dbQueries.iter_jobs_to_process(
+                pending_only=pending_only, jobs_table=jobs_table, batch_size=chunk_size)
+            for batch in _extract_batches(chunks, skill_keywords, executor, workers):
+                write(dict(batch))
+                tagged_count += len(batch)
+                if tagged_ids is not None:
+                    tagged_ids.update(job_id for job_id, _ in batch)
+                if tagged_count >= next_report:
+                    logging.info(f"    ...Processing: {tagged_count} jobs tagged and written.")
+                    next_report = tagged_count + 10 * chunk_size
+    except Exception as e:
+        logging.critical(f"Streaming skill tagging failed after {tagged_count} jobs; nothing was saved: {e}",
+                         exc_info=True)
+        return False, tagged_count
+    return True, tagged_count
+
+def dictionary_entries(skill_keywords) -> dict:
+    """The expanded, sorted synonyms of every skill_keywords.json entry (as kept in skill_dictionary)."""
+    return {
+        canonical_name: sorted(expand_synonyms(synonyms))
+        for canonical_name, synonyms in skill_keywords.items()
+    }
+
+def current_dictionary_entries() -> dict:
+    return dictionary_entries(_load_skill_keywords())
+
+def diff_dictionaries(old_entries, new_entries) -> dict:
+    """{canonical skill: (added synonyms, removed synonyms)} for every entry that differs."""
+    changes = {}
+    for canonical_name in old_entries.keys() | new_entries.keys():
+        old_terms = set(old_entries.get(canonical_name, ()))
+        new_terms = set(new_entries.get(canonical_name, ()))
+        if old_terms != new_terms:
+            changes[canonical_name] = (new_terms - old_terms, old_terms - new_terms)
+    return changes
+
+def _retag_changed_entries(skill_keywords, changes, jobs_table, skills_table, scan, skip_job_ids=()):
+    """
+    Rescans only the candidate jobs of the changed dictionary entries, and only for those
+    skills: jobs whose description contains an added synonym (found through the trigram
+    index) and jobs already linked to a skill that lost synonyms or was removed.
+    Returns (saved, number of jobs rescanned).
+    """
+    added_terms = {term for added, _ in changes.values() for term in added}
+    shrunk_skills = {name for name, (_, removed) in changes.items() if removed or name not in skill_keywords}
+    candidates = [
+        job for job in dbQueries.get_retag_candidates(added_terms, shrunk_skills, jobs_table, skills_table)
+        if job[0] not in skip_job_ids
+    ]
+    logging.info(f"Re-tagging {len(changes)} changed skills: {len(candidates)} candidate jobs.")
+    if not candidates:
+        return True, 0
+
+    changed_keywords = {name: skill_keywords[name] for name in changes if name in skill_keywords}
+    try:
+        results = scan(candidates, changed_keywords)
+    except Exception as e:
+        logging.critical(f"Re-tagging scan failed; nothing was saved: {e}", exc_info=True)
+        return False, len(candidates)
+    saved = dbQueries.save_processed_skills(
+        results, replace_all=False, jobs_table=jobs_table,
+        skills_table=skills_table, only_skills=set(changes))
+    return saved, len(candidates)
+
+def _run_incremental(jobs_table, skills_table, scan, stream):
+    """
+    Re-tags jobs whose description changed since they were tagged (or were never tagged)
+    with the full dictionary, then re-tags the other jobs affected by dictionary entries
+    that changed since the last run. Both passes save a diff of job_skills; the first one
+    streams the pending jobs (see _tag_streamed_jobs).
+    Returns True when the links are saved or were already up to date.
+    """
+    skill_keywords = _load_skill_keywords()
+    entries = dictionary_entries(skill_keywords)
+    changes = diff_dictionaries(dbQueries.get_skill_dictionary(), entries)
+    logging.info(f"Skill dictionary: {len(changes)} of {len(entries)} entries changed since the last run.")
+
+    pending_ids = set()
+    saved, pending = stream(skill_keywords, pending_only=True, tagged_ids=pending_ids)
+
+    rescanned = 0
+    if changes and saved:
+        saved, rescanned = _retag_changed_entries(
+            skill_keywords, changes, jobs_table, skills_table, scan, skip_job_ids=pending_ids)
+        if saved:
+            dbQueries.save_skill_dictionary(entries)
+
+    if saved and not pending and not rescanned:
+        logging.info("No new, changed or affected jobs; nothing to re-tag.")
+    return saved
+
+def retag_changed_skills(executor=SKILL_EXECUTOR, workers=SKILL_PROCESS_WORKERS, chunk_size=SKILL_CHUNK_SIZE):
+    """
+    Applies edits of skill_keywords.json to the live job_skills without a full reprocess:
+    only the candidate jobs of the changed entries are rescanned, for those skills only.
+    Falls back to a full run when no applied dictionary has been recorded yet.
+    Returns True when the links are up to date with the dictionary.
+    """
+    applied = dbQueries.get_skill_dictionary()
+    if not applied:
+        logging.warning("No applied skill dictionary recorded; running a full skill processing.")
+        return run_skill_processor(executor=executor, workers=workers, chunk_size=chunk_size)
+
+    start_time = time.time()
+    skill_keywords = _load_skill_keywords()
+    entries = dictionary_entries(skill_keywords)
+    changes = diff_dictionaries(applied, entries)
+    if not changes:
+        logging.info("skill_keywords.json is unchanged since the last run; nothing to re-tag.")
+        return True
+    for canonical_name, (added, removed) in sorted(changes.items()):
+        logging.info(f"    {canonical_name}: +{sorted(added)} -{sorted(removed)}")
+
+    def scan(jobs, keywords):
+        return _scan_jobs(jobs, keywords, executor, workers, chunk_size)
+
+    saved, rescanned = _retag_changed_entries(skill_keywords, changes, "jobs", "job_skills", scan)
+    if saved:
+        dbQueries.save_skill_dictionary(entries)
+        logging.info(f"Re-tagged {rescanned} jobs for {len(changes)} changed skills in {time.time() - start_time:.2f} seconds.")
+    return saved
+
+def run_skill_processor(incremental=False, staging=False, executor=SKILL_EXECUTOR,
+                        workers=SKILL_PROCESS_WORKERS, chunk_size=SKILL_CHUNK_SIZE):
+    """
+    Tags job descriptions with skills and saves the links. Returns True when the links were saved.
+    incremental=True only re-extracts jobs whose description changed since they were tagged,
+    plus, for the skill_keywords.json entries that changed, the other open jobs; job_skills
+    gets a diff instead of a rewrite, and a run with nothing to re-tag also returns True.
+    staging=True tags a swap-mode load in the staging tables before it goes live.
+    executor="process" scans chunks of `chunk_size` jobs in `workers` processes (default: one
+    per core); a run that fits in one chunk is scanned in-process. "thread" is the old
+    per-job thread pool.
+    Full runs and the pending jobs of incremental runs are streamed from the DB in batches
+    of `chunk_size` and written as they are scanned, so memory does not grow with the corpus.
+    """
+    if executor not in SKILL_EXECUTORS:
+        raise ValueError(f"Unknown skill executor '{executor}'. Expected one of {list(SKILL_EXECUTORS)}.")
+    jobs_table = staging_name("jobs") if staging else "jobs"
+    skills_table = staging_name("job_skills") if staging else "job_skills"
+    logging.info(f"Starting Stage 3: Skill Processing (Keyword Processor, incremental: {incremental})...")
+
+    start_time = time.time()
+
+    def scan(jobs, skill_keywords):
+        results = _scan_jobs(jobs, skill_keywords, executor, workers, chunk_size)
+        logging.info(f"Text scanning complete in {time.time() - start_time:.2f} seconds.")
+        return results
+
+    def stream(skill_keywords, pending_only, tagged_ids=None):
+        logging.info(f"Streaming {'pending' if pending_only else 'all'} open jobs in batches of {chunk_size}...")
+        return _tag_streamed_jobs(skill_keywords, jobs_table, skills_table, pending_only,
+                                  executor, workers, chunk_size, tagged_ids)
+
+    if incremental:
+        save_success = _run_incremental(jobs_table, skills_table, scan, stream)
+    else:
+        skill_keywords = _load_skill_keywords()
+        entries = dictionary_entries(skill_keywords)
+        save_success, tagged_count = stream(skill_keywords, pending_only=False)
+        if save_success and not tagged_count:
+            logging.info("No jobs found in DB. Process stopped.")
+            return False
+        # Staged tags only count once swapped in; swap_in_staged_load records the dictionary then.
+        if save_success and not staging:
+            dbQueries.save_skill_dictionary(entries)
+        logging.info(f"Successfully processed {tagged_count} jobs.")
 
     elapsed = time.time() - start_time
     if save_success:
         logging.info(f"Skill processing finished successfully! Total time: {elapsed:.2f} seconds")
     else:
-        logging.warning(f"Save failed - check logs. Total time: {elapsed:.2f} seconds")
-    logging.info(f"Successfully processed {len(results_dict)} jobs.")
\ No newline at end of file
+        logging.warning(f"Skill processing saved nothing - check logs. Total time: {elapsed:.2f} seconds")
+    return save_success
@@ -0,0 +1,227 @@
+import re
+import json
+import hashlib
+import sqlite3
+import logging
+import psycopg2
+
+logger = logging.getLogger(__name__)
+
+SQLITE_BUSY_TIMEOUT_SECONDS = 30
+# Rows per INSERT for execute_values (SQLite allows 32766 bound variables per statement).
+SQLITE_VALUES_PAGE_SIZE = 500
+
+_PLACEHOLDER_RE = re.compile(r"=\s*ANY\(%s\)|unnest\(%s::text\[\]\)|%s")
+_TRUNCATE_RE = re.compile(r"^\s*TRUNCATE\s+TABLE\s+(.+?)(\s+RESTART\s+IDENTITY)?(\s+CASCADE)?\s*;?\s*$", re.I | re.S)
+_ADD_COLUMN_RE = re.compile(
+    r"^\s*ALTER\s+TABLE\s+(\w+)\s+ADD\s+COLUMN\s+IF\s+NOT\s+EXISTS\s+(\w+)\s+(.+?)\s*;?\s*$", re.I | re.S
+)
+_DIALECT_REWRITES = (
+    (re.compile(r"\bSERIAL\s+PRIMARY\s+KEY\b", re.I), "INTEGER PRIMARY KEY AUTOINCREMENT"),
+    (re.compile(r"\bnow\(\)", re.I), "CURRENT_TIMESTAMP"),
+    # SQLite's LIKE is already case-insensitive (ASCII); REGEXP is the _regexp function below.
+    (re.compile(r"\bILIKE\b", re.I), "LIKE"),
+    (re.compile(r"\s~\*\s"), " REGEXP "),
+)
+
+
+def _regexp(pattern, value):
+    """Backs `value REGEXP pattern`, the translation of Postgres' case-insensitive `~*`."""
+    return value is not None and re.search(pattern, value, re.I) is not None
+
+
+def _md5(value):
+    """Postgres' md5(text): hex digest of the UTF-8 bytes."""
+    return None if value is None else hashlib.md5(str(value).encode("utf-8")).hexdigest()
+
+
+class SqliteError(psycopg2.DatabaseError):
+    """sqlite3 errors re-raised as psycopg2 errors, so callers keep catching psycopg2.Error."""
+
+
+def translate_sql(sql, params=None):
+    """
+    Rewrites a Postgres statement (psycopg2 paramstyle) for SQLite and returns (sql, params).
+    List parameters bound with `= ANY(%s)` or `unnest(%s::text[])` are passed as JSON
+    and expanded with json_each.
+    """
+    for pattern, replacement in _DIALECT_REWRITES:
+        sql = pattern.sub(replacement, sql)
+    if params is None:
+        return sql, None
+
+    values = iter(params)
+    bound = []
+
+    def bind(match):
+        value = next(values)
+        token = match.group(0)
+        if token == "%s":
+            bound.append(value)
+            return "?"
+        bound.append(json.dumps(list(value)))
+        if token.startswith("unnest"):
+            # WHERE true keeps "INSERT ... SELECT ... ON CONFLICT" unambiguous for SQLite's parser.
+            return "value FROM json_each(?) WHERE true"
+        return "IN (SELECT value FROM json_each(?))"
+
+    sql = _PLACEHOLDER_RE.sub(bind, sql)
+    bound.extend(values)
+    return sql, bound
+
+
+class SqliteCursor:
+    """psycopg2-style cursor over sqlite3: translates SQL and maps errors to psycopg2.Error."""
+
+    def __init__(self, connection, dict_rows=False):
+        self.connection = connection
+        self.cursor = connection.raw.cursor()
+        self.dict_rows = dict_rows
+        self.rowcount = -1
+
+    @property
+    def description(self):
+        return self.cursor.description
+
+    def execute(self, sql, params=None):
+        try:
+            truncate = _TRUNCATE_RE.match(sql)
+            add_column = _ADD_COLUMN_RE.match(sql)
+            if truncate:
+                self._truncate(truncate)
+            elif add_column:
+                self._add_column(*add_column.groups())
+            else:
+                sql, params = translate_sql(sql, params)
+                self.cursor.execute(sql, params or ())
+                self.rowcount = self.cursor.rowcount
+        except sqlite3.Error as e:
+            raise SqliteError(str(e)) from e
+        return self
+
+    def executemany(self, sql, seq_of_params):
+        seq_of_params = list(seq_of_params)
+        if not seq_of_params:
+            return self
+        try:
+            translated, _ = translate_sql(sql, seq_of_params[0])
+            self.cursor.executemany(translated, [translate_sql(sql, params)[1] for params in seq_of_params])
+            self.rowcount = self.cursor.rowcount
+        except sqlite3.Error as e:
+            raise SqliteError(str(e)) from e
+        return self
+
+    def _truncate(self, match):
+        tables = [table.strip() for table in match.group(1).split(",")]
+        for table in tables:
+            self.cursor.execute(f"DELETE FROM {table}")
+        if match.group(2):
+            placeholders = ",".join("?" * len(tables))
+            self.cursor.execute(f"DELETE FROM sqlite_sequence WHERE name IN ({placeholders})", tables)
+        self.rowcount = -1
+
+    def _add_column(self, table, column, definition):
+        columns = {row[1] for row in self.cursor.execute(f"PRAGMA table_xinfo({table})")}
+        if column not in columns:
+            # SQLite only allows constant defaults, and only virtual generated columns, on added columns.
+            definition = re.sub(r"\s+DEFAULT\s+CURRENT_TIMESTAMP", "", definition, flags=re.I)
+            definition = re.sub(r"\bSTORED$", "VIRTUAL", definition, flags=re.I)
+            self.cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+        self.rowcount = -1
+
+    def _convert(self, row):
+        if row is None or not self.dict_rows:
+            return row
+        return {column[0]: value for column, value in zip(self.cursor.description, row)}
+
+    def fetchone(self):
+        return self._convert(self.cursor.fetchone())
+
+    def fetchmany(self, size=None):
+        rows = self.cursor.fetchmany(size) if size is not None else self.cursor.fetchmany()
+        return [self._convert(row) for row in rows]
+
+    def fetchall(self):
+        return [self._convert(row) for row in self.cursor.fetchall()]
+
+    def __iter__(self):
+        return (self._convert(row) for row in self.cursor)
+
+    def copy_expert(self, sql, file):
+        raise SqliteError("COPY is not supported by the SQLite backend.")
+
+    def close(self):
+        self.cursor.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class SqliteConnection:
+    """
+    psycopg2-style connection over an SQLite file (WAL mode, foreign keys on).
+    Like psycopg2, `with conn:` commits or rolls back but does not close the connection.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.raw = sqlite3.connect(path, timeout=SQLITE_BUSY_TIMEOUT_SECONDS)
+        self.raw.execute("PRAGMA foreign_keys = ON")
+        self.raw.create_function("REGEXP", 2, _regexp, deterministic=True)
+        self.raw.create_function("md5", 1, _md5, deterministic=True)
+        if path != ":memory:":
+            self.raw.execute("PRAGMA journal_mode = WAL")
+            self.raw.execute("PRAGMA synchronous = NORMAL")
+
+    @property
+    def closed(self):
+        try:
+            self.raw.total_changes
+            return 0
+        except sqlite3.ProgrammingError:
+            return 1
+
+    def cursor(self, cursor_factory=None):
+        # Any cursor_factory (in practice RealDictCursor) means dict rows.
+        return SqliteCursor(self, dict_rows=cursor_factory is not None)
+
+    def commit(self):
+        self.raw.commit()
+
+    def rollback(self):
+        self.raw.rollback()
+
+    def close(self):
+        self.raw.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+
+def connect_sqlite(path):
+    try:
+        return SqliteConnection(path)
+    except sqlite3.Error as e:
+        raise SqliteError(f"Could not open SQLite database {path}: {e}") from e
+
+
+def execute_values_sqlite(cursor, sql, argslist, page_size=SQLITE_VALUES_PAGE_SIZE, fetch=False):
+    """Same contract as psycopg2.extras.execute_values: the single VALUES %s becomes a multi-row VALUES."""
+    argslist = list(argslist)
+    results = []
+    for start in range(0, len(argslist), page_size):
+        page = argslist[start:start + page_size]
+        values_sql = ",".join("(" + ",".join(["%s"] * len(row)) + ")" for row in page)
+        cursor.execute(sql.replace("%s", values_sql, 1), [value for row in page for value in row])
+        if fetch:
+            results.extend(cursor.fetchall())
+    return results if fetch else None
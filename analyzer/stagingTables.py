@@ -0,0 +1,85 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+STAGING_SUFFIX = "_staging"
+STAGED_TABLES = ("jobs", "job_locations", "job_skills")
+
+# Constraints and indexes of the staged tables, added only after the bulk load.
+# Names get STAGING_SUFFIX while staged and are renamed to these on swap.
+STAGED_INDEXES = (
+    ("jobs", "jobs_pkey", "ALTER TABLE {table} ADD CONSTRAINT {name} PRIMARY KEY (job_id)"),
+    ("job_locations", "job_locations_pkey",
+     "ALTER TABLE {table} ADD CONSTRAINT {name} PRIMARY KEY (job_id, location_id)"),
+    ("job_skills", "job_skills_pkey",
+     "ALTER TABLE {table} ADD CONSTRAINT {name} PRIMARY KEY (job_id, skill_id)"),
+    ("jobs", "idx_jobs_company_id", "CREATE INDEX {name} ON {table} (company_id)"),
+    ("jobs", "idx_jobs_level_id", "CREATE INDEX {name} ON {table} (level_id)"),
+    ("jobs", "idx_jobs_link", "CREATE INDEX {name} ON {table} (link)"),
+    ("jobs", "idx_jobs_search", "CREATE INDEX {name} ON {table} USING GIN (search_vector)"),
+    ("jobs", "idx_jobs_title_trgm", "CREATE INDEX {name} ON {table} USING GIN (title gin_trgm_ops)"),
+    ("jobs", "idx_jobs_description_trgm", "CREATE INDEX {name} ON {table} USING GIN (description gin_trgm_ops)"),
+    ("job_skills", "idx_job_skills_skill_id", "CREATE INDEX {name} ON {table} (skill_id)"),
+)
+
+STAGED_FOREIGN_KEYS = (
+    ("jobs", "jobs_company_id_fkey", "(company_id) REFERENCES companies (company_id)"),
+    ("jobs", "jobs_level_id_fkey", "(level_id) REFERENCES experience_levels (level_id)"),
+    ("job_locations", "job_locations_job_id_fkey",
+     "(job_id) REFERENCES jobs_staging (job_id) ON DELETE CASCADE"),
+    ("job_locations", "job_locations_location_id_fkey",
+     "(location_id) REFERENCES locations (location_id) ON DELETE CASCADE"),
+    ("job_skills", "job_skills_job_id_fkey",
+     "(job_id) REFERENCES jobs_staging (job_id) ON DELETE CASCADE"),
+    ("job_skills", "job_skills_skill_id_fkey",
+     "(skill_id) REFERENCES skills (skill_id) ON DELETE CASCADE"),
+)
+
+
+def staging_name(table):
+    return f"{table}{STAGING_SUFFIX}"
+
+
+def create_staging_tables(cursor):
+    """
+    (Re)creates empty, index-free copies of jobs, job_locations and job_skills.
+    jobs_staging keeps the column defaults, so new job ids come from the live jobs sequence,
+    and the generated search_vector column.
+    """
+    for table in reversed(STAGED_TABLES):
+        cursor.execute(f"DROP TABLE IF EXISTS {staging_name(table)};")
+    for table in STAGED_TABLES:
+        cursor.execute(f"CREATE TABLE {staging_name(table)} (LIKE {table} INCLUDING DEFAULTS INCLUDING GENERATED);")
+    logger.info("Staging: Created empty staging tables.")
+
+
+def index_staging_tables(cursor):
+    """Adds primary keys, indexes and foreign keys once the staging tables are filled."""
+    for table, name, definition in STAGED_INDEXES:
+        cursor.execute(definition.format(table=staging_name(table), name=staging_name(name)) + ";")
+    for table, name, definition in STAGED_FOREIGN_KEYS:
+        cursor.execute(f"ALTER TABLE {staging_name(table)} ADD CONSTRAINT {name} FOREIGN KEY {definition};")
+    for table in STAGED_TABLES:
+        cursor.execute(f"ANALYZE {staging_name(table)};")
+    logger.info("Staging: Built indexes and constraints.")
+
+
+def swap_staging_tables(cursor):
+    """
+    Replaces the live tables with the staging tables. Meant to run in its own short
+    transaction: readers see either the old tables or the new ones, never a partial load.
+    """
+    cursor.execute("LOCK TABLE jobs, job_locations, job_skills IN ACCESS EXCLUSIVE MODE;")
+
+    # The job_id sequence belongs to the live jobs table; hand it over before that is dropped.
+    cursor.execute("SELECT pg_get_serial_sequence('jobs', 'job_id');")
+    sequence_name = cursor.fetchone()[0]
+    if sequence_name:
+        cursor.execute(f"ALTER SEQUENCE {sequence_name} OWNED BY {staging_name('jobs')}.job_id;")
+
+    cursor.execute(f"DROP TABLE {', '.join(reversed(STAGED_TABLES))};")
+    for table in STAGED_TABLES:
+        cursor.execute(f"ALTER TABLE {staging_name(table)} RENAME TO {table};")
+    for _, name, _ in STAGED_INDEXES:
+        cursor.execute(f"ALTER INDEX {staging_name(name)} RENAME TO {name};")
+    logger.info("Staging: Swapped staging tables in.")
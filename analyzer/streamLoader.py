@@ -0,0 +1,139 @@
+import logging
+from threading import Lock
+
+from .dbCore import get_db_connection, resolve_ids, execute_values
+from .dbQueries import write_skill_dictionary
+from .skillProcessor import extract_skills_from_text, current_dictionary_entries
+
+logger = logging.getLogger(__name__)
+
+STREAM_BATCH_SIZE = 200
+
+
+class StreamingDbLoader:
+    """
+    Writer-compatible sink (same interface as StreamingJsonlWriter) for the streaming ETL:
+    every batch of parsed jobs is tagged with skills and inserted together with its
+    location and skill links as soon as it arrives, so descriptions never make a
+    JSONL -> DB -> Python round trip.
+
+    The whole load runs in one transaction. Old rows are removed with DELETE (not TRUNCATE)
+    so readers keep seeing the previous data until the final commit. That also drops the
+    job history (first_seen, content_hash), so it is not used with DB_LOAD_MODE="incremental".
+    """
+
+    def __init__(self, batch_size=STREAM_BATCH_SIZE):
+        self.batch_size = batch_size
+        self.buffer = []
+        self.lock = Lock()
+        self.conn = None
+        self.cursor = None
+        self.company_cache = {}
+        self.level_cache = {}
+        self.location_cache = {}
+        self.skill_cache = {}
+        self.jobs_loaded = 0
+        self.skill_links_loaded = 0
+
+    def __enter__(self):
+        self.conn = get_db_connection()
+        if self.conn is None:
+            raise RuntimeError("Stream Loader: Could not get DB connection.")
+        self.cursor = self.conn.cursor()
+        logger.info("Stream Loader: Clearing old data (DELETE FROM jobs)...")
+        self.cursor.execute("DELETE FROM jobs;")
+        return self
+
+    def write_rows(self, rows):
+        if not rows:
+            return
+        with self.lock:
+            self.buffer.extend(rows)
+            if len(self.buffer) >= self.batch_size:
+                self._flush()
+
+    def _flush(self):
+        batch, self.buffer = self.buffer, []
+        if not batch:
+            return
+
+        company_ids = resolve_ids(
+            self.cursor, "companies", "company", {job.get('company') for job in batch}, self.company_cache)
+        level_ids = resolve_ids(
+            self.cursor, "experience_levels", "level", {job.get('experience') for job in batch}, self.level_cache)
+        location_ids = resolve_ids(
+            self.cursor, "locations", "location",
+            {loc for job in batch for loc in job.get('locations') or []}, self.location_cache)
+
+        job_values = [
+            (job.get('title'), job.get('description'), job.get('link'),
+             company_ids.get(job.get('company')), level_ids.get(job.get('experience')))
+            for job in batch
+        ]
+        inserted = execute_values(
+            self.cursor,
+            "INSERT INTO jobs (title, description, link, company_id, level_id) VALUES %s RETURNING job_id",
+            job_values,
+            fetch=True,
+        )
+        job_ids = [row[0] for row in inserted]
+
+        location_links = []
+        job_skills = []
+        for job_id, job in zip(job_ids, batch):
+            for loc_name in job.get('locations') or []:
+                if loc_name in location_ids:
+                    location_links.append((job_id, location_ids[loc_name]))
+            job_skills.append(extract_skills_from_text(job_id, job.get('description')))
+
+        skill_ids = resolve_ids(
+            self.cursor, "skills", "skill",
+            {skill for _, skills_list in job_skills for skill in skills_list}, self.skill_cache)
+        skill_links = [
+            (job_id, skill_ids[skill_name])
+            for job_id, skills_list in job_skills
+            for skill_name in skills_list
+            if skill_name in skill_ids
+        ]
+
+        if location_links:
+            execute_values(
+                self.cursor,
+                "INSERT INTO job_locations (job_id, location_id) VALUES %s ON CONFLICT DO NOTHING",
+                location_links,
+            )
+        if skill_links:
+            execute_values(
+                self.cursor,
+                "INSERT INTO job_skills (job_id, skill_id) VALUES %s ON CONFLICT DO NOTHING",
+                skill_links,
+            )
+
+        self.jobs_loaded += len(job_ids)
+        self.skill_links_loaded += len(skill_links)
+        logger.debug(f"Stream Loader: Flushed {len(job_ids)} jobs ({self.jobs_loaded} total).")
+
+    def _record_tagging_state(self):
+        """Every job was tagged with the current dictionary; lets incremental skill runs skip them."""
+        self.cursor.execute("UPDATE jobs SET skills_hash = description_hash;")
+        write_skill_dictionary(self.cursor, current_dictionary_entries())
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                with self.lock:
+                    self._flush()
+                self._record_tagging_state()
+                self.conn.commit()
+                logger.info(
+                    f"Stream Loader: Committed {self.jobs_loaded} jobs "
+                    f"with {self.skill_links_loaded} skill links."
+                )
+            else:
+                logger.error(f"Stream Loader: Load aborted ({exc_type.__name__}); rolling back.")
+                self.conn.rollback()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            self.conn.close()
@@ -0,0 +1,21 @@
+from fastapi import APIRouter, HTTPException, Query
+from api.services import jobSearchService
+from api.schemas.jobSchemas import JobSearchResponse
+from config import JOB_SEARCH_MAX_PAGE_SIZE
+import logging
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+@router.get("/jobs/search", response_model=JobSearchResponse)
+def search_jobs_route(
+    q: str = Query(..., min_length=2, max_length=200),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=JOB_SEARCH_MAX_PAGE_SIZE),
+):
+    logger.info("Route: /api/jobs/search - Request received")
+    try:
+        return jobSearchService.search_jobs(q, page, page_size)
+    except Exception as e:
+        logger.critical(f"Route: /api/jobs/search - Critical error: {e}")
+        raise HTTPException(status_code=500, detail="שגיאה פנימית בשרת בעת חיפוש משרות")
@@ -0,0 +1,19 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class JobSearchResult(BaseModel):
+    job_id: int
+    title: Optional[str] = None
+    company: Optional[str] = None
+    level: Optional[str] = None
+    link: Optional[str] = None
+    rank: float
+
+
+class JobSearchResponse(BaseModel):
+    query: str
+    page: int
+    page_size: int
+    total: int
+    results: List[JobSearchResult]
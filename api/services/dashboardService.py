@@ -6,11 +6,17 @@ logger = logging.getLogger(__name__)
 def get_dashboard_data():
     """
     Fetches and processes all data required for the dashboard.
+    Reads the summary tables the ETL refreshes; falls back to the live aggregates
+    when they have not been built yet.
     """
     logger.info("Service: Fetching dashboard data...")
     try:
-        skills_data = dbQueries.get_skill_popularity_percentages(top_n=10)
-        levels_data = dbQueries.get_experience_level_distribution()
+        summary = dbQueries.get_dashboard_summary(top_n=10)
+        if summary:
+            skills_data, levels_data = summary["skills"], summary["levels"]
+        else:
+            skills_data = dbQueries.get_skill_popularity_percentages(top_n=10)
+            levels_data = dbQueries.get_experience_level_distribution()
         
         total_jobs = sum([lvl['count'] for lvl in levels_data]) if levels_data else 0
         
@@ -0,0 +1,20 @@
+from analyzer import dbQueries
+import logging
+
+logger = logging.getLogger(__name__)
+
+def search_jobs(query: str, page: int, page_size: int):
+    """
+    Runs a ranked text search over open postings and returns one page of results.
+    """
+    query = " ".join(query.split())
+    logger.info(f"Service: Searching jobs for '{query}' (page {page})...")
+    found = dbQueries.search_jobs(query, limit=page_size, offset=(page - 1) * page_size)
+
+    return {
+        "query": query,
+        "page": page,
+        "page_size": page_size,
+        "total": found.get("total", 0),
+        "results": found.get("results", []),
+    }
@@ -0,0 +1,85 @@
+"""
+Benchmark for jobScraper.parser.clean_html: fast tokenizer path vs. the BeautifulSoup path.
+
+jobs_data.jsonl only keeps cleaned text, so the HTML the API would have sent is rebuilt from
+each description using the markup styles seen in postings (<p>, <br>, lists, inline tags,
+entities). Every document is checked for identical output before timings are reported.
+
+Usage: python -m benchmarks.benchCleanHtml [jobs_data.jsonl] [--repeat N]
+"""
+import sys
+import json
+import html
+import time
+import argparse
+
+from jobScraper import parser
+from config import JSONL_OUTPUT_FILE
+
+
+def build_html(text, style):
+    lines = [html.escape(line, quote=False) for line in text.split("\n")]
+    if style == 0:
+        return "".join(f"<p>{line}</p>" for line in lines)
+    if style == 1:
+        return "<br/>".join(lines)
+    if style == 2:
+        return "<ul>" + "".join(f"<li><span>{line}</span></li>" for line in lines) + "</ul>"
+    return "".join(
+        f"<div><strong>{line.replace(' ', '&nbsp;', 1)}</strong> </div>\n" for line in lines
+    )
+
+
+def load_documents(path):
+    documents = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for index, line in enumerate(f):
+            description = json.loads(line).get('description') or ""
+            documents.append(build_html(description, index % 4))
+    return documents
+
+
+def reference_clean_html(raw_html):
+    """The pre-fast-path implementation: always BeautifulSoup."""
+    if not raw_html:
+        return ""
+    raw_html = raw_html.replace("<br/>", "<br>")
+    return parser._BLANK_LINES_RE.sub('\n', parser._soup_html_to_text(raw_html))
+
+
+def time_it(func, documents, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for document in documents:
+            func(document)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("path", nargs="?", default=JSONL_OUTPUT_FILE)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args(argv)
+
+    documents = load_documents(args.path)
+
+    mismatches = [doc for doc in documents if parser.clean_html(doc) != reference_clean_html(doc)]
+    fast_hits = sum(1 for doc in documents if parser._fast_html_to_text(doc.replace("<br/>", "<br>")) is not None)
+    print(f"Documents: {len(documents)}  fast path: {fast_hits}  mismatches: {len(mismatches)}")
+    if mismatches:
+        print("Output differs from the BeautifulSoup implementation. Aborting benchmark.")
+        return 1
+
+    reference_time = time_it(reference_clean_html, documents, args.repeat)
+    fast_time = time_it(parser.clean_html, documents, args.repeat)
+
+    print(f"BeautifulSoup: {reference_time:.3f}s ({len(documents) / reference_time:,.0f} docs/s)")
+    print(f"clean_html:    {fast_time:.3f}s ({len(documents) / fast_time:,.0f} docs/s)")
+    print(f"Speedup:       {reference_time / fast_time:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""
+Benchmark for skill extraction: the single-pass SkillEngine vs. the per-skill regex engine.
+
+Both engines run over every description of a JSONL snapshot; the skill sets must be
+identical for every posting before timings are reported.
+
+Usage: python -m benchmarks.benchSkillEngine [jobs_data.jsonl] [--repeat N]
+"""
+import sys
+import json
+import time
+import argparse
+
+from analyzer import skillProcessor
+from config import JSONL_OUTPUT_FILE
+
+
+def load_descriptions(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line).get('description') or "" for line in f]
+
+
+def time_it(func, documents, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for document in documents:
+            func(document)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("path", nargs="?", default=JSONL_OUTPUT_FILE)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args(argv)
+
+    documents = load_descriptions(args.path)
+    engine = skillProcessor._get_skill_engine()
+    skillProcessor._get_compiled_skill_engine()
+
+    mismatches = [doc for doc in documents if engine.extract(doc) != skillProcessor.extract_skills_per_pattern(doc)]
+    total_chars = sum(len(doc) for doc in documents)
+    print(f"Documents: {len(documents)}  characters: {total_chars:,}  mismatches: {len(mismatches)}")
+    if mismatches:
+        print("Skill sets differ from the per-skill regex engine. Aborting benchmark.")
+        return 1
+
+    reference_time = time_it(skillProcessor.extract_skills_per_pattern, documents, args.repeat)
+    engine_time = time_it(engine.extract, documents, args.repeat)
+
+    print(f"Per-skill regexes: {reference_time:.3f}s ({len(documents) / reference_time:,.0f} docs/s)")
+    print(f"SkillEngine:       {engine_time:.3f}s ({len(documents) / engine_time:,.0f} docs/s)")
+    print(f"Speedup:           {reference_time / engine_time:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,55 @@
 DB_FILE_PATH = "jobs.db"
+# "postgres" (DATABASE_URL) or "sqlite" (DB_FILE_PATH); the DB_BACKEND env var overrides it.
+DB_BACKEND = "postgres"
 JSONL_OUTPUT_FILE = "jobs_data.jsonl"
+JSONL_COMPRESSION = None
+SCRAPER_ENGINE = "async"
+SCRAPER_PIPELINE = True
+STREAMING_ETL = False
+STREAMING_JSONL_TAP = True
+JSONL_DELTA_OUTPUT_FILE = "jobs_delta.jsonl"
+SEEN_JOBS_FILE = "seen_jobs.json"
+DELTA_STOP_RATIO = 0.8
+# Delta scrapes forget postings not seen for this long, and keep at most this many.
+SEEN_JOBS_MAX_AGE_DAYS = 90
+SEEN_JOBS_MAX_ENTRIES = 200000
+HTTP_CACHE_MODE = "off"
+HTTP_CACHE_DIR = ".http_cache"
+HTTP_CACHE_TTL_SECONDS = 6 * 60 * 60
+SCRAPE_CHECKPOINT_FILE = "scrape_checkpoint.json"
+# "incremental" applies the day's delta; "swap" rebuilds in staging tables and swaps them in.
+DB_LOAD_MODE = "incremental"
+DB_POOL_MIN_CONNECTIONS = 1
+DB_POOL_MAX_CONNECTIONS = 10
+DB_POOL_TIMEOUT_SECONDS = 10
+DB_POOL_HEALTHCHECK_SECONDS = 30
+# Read-query cache (analyzer/queryCache.py); entries also go stale when the ETL bumps the data generation.
+QUERY_CACHE_TTL_SECONDS = 15 * 60
+QUERY_CACHE_MAX_ENTRIES = 256
+# Most recently used entries per cached query that are re-run when a new data generation arrives.
+QUERY_CACHE_PREWARM_ENTRIES = 8
+# The ETL announces each new data generation on this channel (Postgres NOTIFY); API processes
+# LISTEN on it. On SQLite the listener polls the data_generation table instead.
+CACHE_NOTIFY_CHANNEL = "data_generation"
+CACHE_LISTENER_POLL_SECONDS = 30
+# Reconnect delays of the listener double from the poll interval after each failure, up to this cap.
+CACHE_LISTENER_MAX_BACKOFF_SECONDS = 5 * 60
+# Postgres text search configuration for job search. 'simple' (no stemming) because Postgres
+# ships no Hebrew dictionary and postings mix Hebrew and English.
+SEARCH_TEXT_CONFIG = "simple"
+JOB_SEARCH_MAX_PAGE_SIZE = 50
+# Skill tagging: "process" scans chunks of jobs in a process pool, "thread" is the old per-job thread pool.
+SKILL_EXECUTOR = "process"
+SKILL_PROCESS_WORKERS = None  # None = one per CPU core
+SKILL_CHUNK_SIZE = 500  # jobs per scan chunk, and per batch read from the server-side cursor
 SEARCH_QUERY = {
     "main_category": "hitech_software",
     "roles": None,
     "experience": None,
     "keyword": None
-}
\ No newline at end of file
+}
+# Scraped in one fan-out run (see run_scraper); overlapping postings are kept once.
+SEARCH_QUERIES = [
+    {"main_category": category, "roles": None, "experience": None, "keyword": None}
+    for category in ("hitech_software", "hitech_hardware", "hitech_qa", "hitech_general")
+]
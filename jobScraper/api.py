@@ -1,15 +1,37 @@
 import requests
 import time
 import logging
+from requests.adapters import HTTPAdapter
 from jobSearchConfig import BASE_URL, API_SEARCH_PATH, build_api_params, MAIN_CATEGORIES
+from .rateLimit import RateLimiter, backoff_delay, parse_retry_after
 
 logger = logging.getLogger(__name__)
 
+
+def create_session(pool_size=10):
+    """
+    Returns a requests.Session whose connection pool keeps up to `pool_size`
+    keep-alive connections open, so pages reuse TCP/TLS connections.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 class ApiClient:
-    def __init__(self, search_config):
+    def __init__(self, search_config, session=None, cache=None, rate_limiter=None, query_index=None):
         self.base_url = BASE_URL
         self.search_path = API_SEARCH_PATH
         self.search_config = search_config
+        # Without a session every call goes through requests.get (new connection per page).
+        self.http = session or requests
+        self.cache = cache
+        # Shared between clients/workers of one scrape so the whole pool obeys one budget.
+        self.rate_limiter = rate_limiter or RateLimiter()
+        # Set by multi-query scrapes so lost pages are reported as (query_index, page_num).
+        self.query_index = query_index
         self.headers = {
             'User-Agent': (
                 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
@@ -23,6 +45,9 @@ class ApiClient:
             ),
         }
 
+    def _lost_page_key(self, page_num):
+        return page_num if self.query_index is None else (self.query_index, page_num)
+
     def fetch_page(self, page_num, retries=3):
         params = build_api_params(
             main_category_key=self.search_config["main_category"],
@@ -33,30 +58,77 @@ class ApiClient:
         )
 
         api_url = f"{self.base_url}{self.search_path}"
+        cached_entry = None
+        request_headers = self.headers
+        if self.cache is not None:
+            cached_entry = self.cache.get(api_url, params)
+            if cached_entry and (self.cache.replay_only or self.cache.is_fresh(cached_entry)):
+                logger.debug(f"ApiClient serving page {page_num} from cache.")
+                return cached_entry["body"]
+            if self.cache.replay_only:
+                logger.warning(f"Cache miss for page {page_num} in replay mode. Skipping page.")
+                self.rate_limiter.stats.page_lost(self._lost_page_key(page_num))
+                return None
+            request_headers = {**self.headers, **self.cache.conditional_headers(cached_entry)}
+
         logger.debug(f"ApiClient sending request for page {page_num} with params={params}")
+        stats = self.rate_limiter.stats
 
         for attempt in range(retries):
+            is_last_attempt = attempt == retries - 1
+            self.rate_limiter.before_request()
             try:
-                response = requests.get(
+                response = self.http.get(
                     api_url,
                     params=params,
-                    headers=self.headers,
+                    headers=request_headers,
                     timeout=(3, 5),
                 )
+                if cached_entry and response.status_code == 304:
+                    logger.debug(f"Page {page_num} not modified, refreshing cache entry.")
+                    self.rate_limiter.record_success()
+                    self.cache.refresh(cached_entry)
+                    return cached_entry["body"]
+
+                if response.status_code == 429 or response.status_code >= 500:
+                    stats.increment("throttled" if response.status_code == 429 else "server_errors")
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                    self.rate_limiter.record_failure(retry_after)
+                    logger.warning(
+                        f"HTTP {response.status_code} on attempt {attempt+1}/{retries} "
+                        f"for page {page_num} (Retry-After: {retry_after})."
+                    )
+                    if not is_last_attempt:
+                        stats.increment("retries")
+                        time.sleep(backoff_delay(attempt, retry_after))
+                    continue
+
                 response.raise_for_status()
-                return response.json()
+                data = response.json()
+                self.rate_limiter.record_success()
+                if self.cache is not None:
+                    self.cache.store(
+                        api_url, params, data,
+                        etag=response.headers.get('ETag'),
+                        last_modified=response.headers.get('Last-Modified'),
+                    )
+                return data
 
             except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
                 logger.warning(
                     f"Timeout/connection error on attempt {attempt+1}/{retries} "
                     f"for page {page_num}: {e}"
                 )
-                time.sleep(0.5)
+                self.rate_limiter.record_failure()
+                if not is_last_attempt:
+                    stats.increment("retries")
+                    time.sleep(backoff_delay(attempt))
 
             except requests.exceptions.RequestException as e:
                 logger.error(
                     f"HTTP error for page {page_num}: {e}. Aborting this page."
                 )
+                stats.page_lost(self._lost_page_key(page_num))
                 return None
 
             except Exception as e:
@@ -64,7 +136,27 @@ class ApiClient:
                     f"Unexpected error in fetch_page for page {page_num}: {e}",
                     exc_info=True,
                 )
+                stats.page_lost(self._lost_page_key(page_num))
                 return None
 
         logger.error(f"All {retries} attempts failed for page {page_num}.")
-        return None
\ No newline at end of file
+        stats.page_lost(self._lost_page_key(page_num))
+        return None
+
+
+class MultiQueryClient:
+    """
+    Fans one scrape out over several search configs. Pages are addressed as
+    (query_index, page_num) and routed to the ApiClient of that query, so a fetch engine
+    schedules the pages of every query on one pool. The clients should share one session,
+    response cache and rate limiter.
+    """
+
+    def __init__(self, clients):
+        self.clients = clients
+        self.base_url = clients[0].base_url
+        self.rate_limiter = clients[0].rate_limiter
+
+    def fetch_page(self, page):
+        query_index, page_num = page
+        return self.clients[query_index].fetch_page(page_num)
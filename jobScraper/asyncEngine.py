@@ -0,0 +1,167 @@
+import asyncio
+import queue
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+ASYNC_INITIAL_CONCURRENCY = 4
+ASYNC_MIN_CONCURRENCY = 1
+ASYNC_MAX_CONCURRENCY = 32
+LATENCY_TOLERANCE = 2.0
+ERROR_RATE_THRESHOLD = 0.1
+
+_DONE = object()
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD limiter for in-flight pages.
+    After every `limit` completed requests the window is re-evaluated: it grows by one
+    while latency stays close to the best observed baseline, and is halved when the
+    error rate or the latency climbs (the site is pushing back).
+    """
+
+    def __init__(
+        self,
+        initial=ASYNC_INITIAL_CONCURRENCY,
+        minimum=ASYNC_MIN_CONCURRENCY,
+        maximum=ASYNC_MAX_CONCURRENCY,
+        latency_tolerance=LATENCY_TOLERANCE,
+        error_threshold=ERROR_RATE_THRESHOLD,
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = max(minimum, min(initial, maximum))
+        self.latency_tolerance = latency_tolerance
+        self.error_threshold = error_threshold
+
+        self.in_flight = 0
+        self.baseline_latency = None
+        self._window_latencies = []
+        self._window_errors = 0
+        self._condition = None
+
+    async def acquire(self):
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    async def release(self, latency, ok):
+        async with self._condition:
+            self.in_flight -= 1
+            self.record(latency, ok)
+            self._condition.notify_all()
+
+    def record(self, latency, ok):
+        if ok:
+            self._window_latencies.append(latency)
+        else:
+            self._window_errors += 1
+
+        samples = len(self._window_latencies) + self._window_errors
+        if samples < self.limit:
+            return
+
+        error_rate = self._window_errors / samples
+        avg_latency = (
+            sum(self._window_latencies) / len(self._window_latencies)
+            if self._window_latencies else None
+        )
+        if avg_latency is not None:
+            if self.baseline_latency is None or avg_latency < self.baseline_latency:
+                self.baseline_latency = avg_latency
+
+        overloaded = error_rate > self.error_threshold or (
+            avg_latency is not None
+            and avg_latency > self.baseline_latency * self.latency_tolerance
+        )
+
+        old_limit = self.limit
+        if overloaded:
+            self.limit = max(self.minimum, self.limit // 2)
+        else:
+            self.limit = min(self.maximum, self.limit + 1)
+
+        if self.limit != old_limit:
+            logger.debug(
+                f"Concurrency {old_limit} -> {self.limit} "
+                f"(error rate {error_rate:.0%}, avg latency {avg_latency or 0:.2f}s)"
+            )
+
+        self._window_latencies = []
+        self._window_errors = 0
+
+
+async def _fetch_all(api_client, pages, limiter, executor, results):
+    loop = asyncio.get_running_loop()
+
+    async def fetch_one(page_num):
+        await limiter.acquire()
+        start = time.monotonic()
+        data, ok = None, False
+        try:
+            data = await loop.run_in_executor(executor, api_client.fetch_page, page_num)
+            ok = data is not None
+        except Exception as e:
+            logger.error(f"Failed processing page {page_num}: {e}", exc_info=False)
+        finally:
+            await limiter.release(time.monotonic() - start, ok)
+        results.put((page_num, data))
+
+    await asyncio.gather(*(fetch_one(page) for page in pages))
+
+
+def fetch_pages_async(api_client, pages, limiter=None):
+    """
+    Fetches `pages` on an asyncio event loop and yields (page_num, data) as they complete.
+    The in-flight page count is driven by an AdaptiveConcurrencyLimiter instead of a fixed
+    pool size. Requests are blocking calls on the client's pooled session, dispatched to a
+    thread pool sized to the limiter's ceiling.
+    Closing the generator early (a writer error, KeyboardInterrupt) cancels the pages not
+    yet requested and waits for the in-flight ones, like leaving the threaded engine's pool.
+    """
+    limiter = limiter or AdaptiveConcurrencyLimiter()
+    results = queue.Queue()
+    loop = asyncio.new_event_loop()
+    fetch_task = []
+    started = threading.Event()
+
+    def run_loop():
+        try:
+            with ThreadPoolExecutor(max_workers=limiter.maximum) as executor:
+                fetch_task.append(loop.create_task(_fetch_all(api_client, pages, limiter, executor, results)))
+                started.set()
+                loop.run_until_complete(fetch_task[0])
+        except asyncio.CancelledError:
+            logger.info("Async engine: Stopped early; remaining pages cancelled.")
+        except Exception as e:
+            logger.critical(f"Async engine crashed: {e}", exc_info=True)
+        finally:
+            started.set()
+            loop.close()
+            results.put(_DONE)
+
+    worker = threading.Thread(target=run_loop, name="scraper-async-engine", daemon=True)
+    worker.start()
+
+    try:
+        while True:
+            item = results.get()
+            if item is _DONE:
+                break
+            yield item
+    finally:
+        started.wait()
+        if fetch_task and not fetch_task[0].done():
+            try:
+                loop.call_soon_threadsafe(fetch_task[0].cancel)
+            except RuntimeError:
+                pass  # The loop finished and closed in the meantime.
+        worker.join()
+
+    logger.info(f"Async engine finished with concurrency limit {limiter.limit}.")
@@ -0,0 +1,85 @@
+import json
+import os
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _encode_page(page):
+    return json.dumps(list(page) if isinstance(page, tuple) else page)
+
+
+def _decode_page(key):
+    page = json.loads(key)
+    return tuple(page) if isinstance(page, list) else page
+
+
+class ScrapeCheckpoint:
+    """
+    Manifest of a scrape in progress, rewritten atomically after every completed page:
+    the session parameters, the pages already written and the row range each page occupies
+    in the partial output file. A resumed run fetches only the missing pages and keeps the
+    first `rows_committed` rows of the partial output.
+    Page keys are page numbers or (query_index, page_num) tuples for multi-query scrapes.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.session = None
+        self.pages = {}
+        self.rows_committed = 0
+
+    @property
+    def completed_pages(self):
+        return set(self.pages)
+
+    def load(self):
+        """Loads an existing manifest. Returns False when there is nothing to resume."""
+        if not os.path.exists(self.filename):
+            return False
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            self.session = manifest["session"]
+            self.pages = {_decode_page(page): tuple(offsets) for page, offsets in manifest["pages"].items()}
+            self.rows_committed = manifest["rows_committed"]
+            return True
+        except (OSError, KeyError, ValueError, TypeError) as e:
+            logger.error(f"Checkpoint: Ignoring unreadable manifest {self.filename}: {e}")
+            return False
+
+    def matches(self, session):
+        """True when the stored session was started with the same search parameters and output."""
+        if not self.session:
+            return False
+        keys = ("search_config", "output", "compression")
+        return all(self.session.get(key) == session.get(key) for key in keys)
+
+    def start(self, session):
+        self.session = dict(session, started_at=time.time())
+        self.pages = {}
+        self.rows_committed = 0
+        self._save()
+
+    def record_page(self, page, row_count):
+        """Records that `row_count` rows of `page` are durably in the partial output."""
+        start_row = self.rows_committed
+        self.rows_committed += row_count
+        self.pages[page] = (start_row, self.rows_committed)
+        self._save()
+
+    def clear(self):
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+
+    def _save(self):
+        manifest = {
+            "session": self.session,
+            "pages": {_encode_page(page): list(offsets) for page, offsets in sorted(self.pages.items())},
+            "rows_committed": self.rows_committed,
+        }
+        tmp_filename = f"{self.filename}.tmp"
+        with open(tmp_filename, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(tmp_filename, self.filename)
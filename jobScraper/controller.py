@@ -1,80 +1,317 @@
+import json
 import time
 import logging
+from itertools import chain
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from .api import ApiClient
-from .parser import extract_jobs_from_page
-from .storage import StreamingJsonlWriter
-from config import JSONL_OUTPUT_FILE
+from .api import ApiClient, MultiQueryClient, create_session
+from .asyncEngine import fetch_pages_async, ASYNC_MAX_CONCURRENCY
+from .parser import extract_jobs_from_page, drop_seen_jobs
+from .pipeline import run_pipeline, write_unseen_rows, PIPELINE_PARSE_WORKERS
+from .storage import StreamingJsonlWriter, partial_path, read_partial_lines
+from .checkpoint import ScrapeCheckpoint
+from .seenStore import SeenJobsStore, KNOWN, job_key
+from .responseCache import ResponseCache, CACHE_MODES
+from .rateLimit import RateLimiter
+from config import (
+    JSONL_OUTPUT_FILE, JSONL_DELTA_OUTPUT_FILE, SEEN_JOBS_FILE, DELTA_STOP_RATIO,
+    HTTP_CACHE_DIR, HTTP_CACHE_TTL_SECONDS, SCRAPE_CHECKPOINT_FILE,
+)
 
 logger = logging.getLogger(__name__)
 
 MAX_CONCURRENT_WORKERS = 15
 MAX_PAGES_TO_FETCH = 80
+ENGINES = ("threads", "async")
+DELTA_PAGE_WINDOW = 4
 
 
-def run_scraper(search_config):
-    filename = JSONL_OUTPUT_FILE
+def fetch_pages_threaded(api_client, pages):
+    """
+    Fetches `pages` on a fixed-size ThreadPool and yields (page_num, data) as they complete.
+    """
+    if not pages:
+        return
 
-    logger.info("Scraper started")
-    logger.info(f"Search config: {search_config}")
+    logger.info(f"Dispatching {len(pages)} pages to ThreadPool ({MAX_CONCURRENT_WORKERS} workers).")
 
-    api_client = ApiClient(search_config)
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_WORKERS) as executor:
+        future_to_page = {
+            executor.submit(api_client.fetch_page, page): page
+            for page in pages
+        }
 
-    first_page = api_client.fetch_page(1)
-    if not first_page:
-        logger.error("Failed to fetch page 1. Aborting.")
-        return
+        for future in as_completed(future_to_page):
+            page_num = future_to_page[future]
+            try:
+                data = future.result()
+            except Exception as e:
+                logger.error(f"Failed processing page {page_num}: {e}", exc_info=False)
+                continue
+            yield page_num, data
 
-    total_api_pages = first_page.get("TotalPagesNumber", 0)
-    total_jobs = first_page.get("TotalSearchResultCount", 0)
 
-    logger.info(f"API reports {total_jobs} jobs across {total_api_pages} pages.")
+def select_delta_jobs(jobs, seen_store, run_keys):
+    """
+    Splits a page into the jobs worth emitting (new or changed) and returns them
+    together with the share of the page that was already known from earlier runs.
+    `run_keys` maps the postings met earlier in this run (under any query) to whether they
+    were known then: those are not emitted again and count as they did the first time,
+    so overlapping queries neither duplicate postings nor cut each other's paging short.
+    """
+    fresh_jobs = []
+    known_count = 0
+    for job in jobs:
+        key = job_key(job)
+        if key in run_keys:
+            known_count += run_keys[key]
+            continue
+        known = seen_store.classify(job) == KNOWN
+        run_keys[key] = known
+        if known:
+            known_count += 1
+        else:
+            fresh_jobs.append(job)
+        seen_store.mark(job)
 
-    if total_api_pages == 0:
-        logger.warning("API returned 0 pages. Aborting.")
-        return
+    known_share = known_count / len(jobs) if jobs else 1.0
+    return fresh_jobs, known_share
 
-    pages_to_process = min(total_api_pages, MAX_PAGES_TO_FETCH)
-    logger.info(f"Processing {pages_to_process} pages (limit: {MAX_PAGES_TO_FETCH}).")
 
+def scrape_delta_pages(api_client, fetch_pages, first_page, pages_to_process, writer, seen_store, stop_ratio,
+                       run_keys):
+    """
+    Walks pages in recency order in small concurrent windows and writes only new or changed
+    jobs. Stops at the first page whose known share reaches `stop_ratio`.
+    """
     total_collected = 0
+    page_results = [(1, first_page)]
+    next_page = 2
+
+    while page_results:
+        for page_num, data in sorted(page_results, key=lambda item: item[0]):
+            if not data:
+                continue
+
+            jobs = extract_jobs_from_page(data, api_client.base_url)
+            fresh_jobs, known_share = select_delta_jobs(jobs, seen_store, run_keys)
+            if fresh_jobs:
+                writer.write_rows(fresh_jobs)
+                total_collected += len(fresh_jobs)
+
+            logger.info(f"Delta: page {page_num} - {len(fresh_jobs)} new/changed, {known_share:.0%} already known.")
+            if known_share >= stop_ratio:
+                logger.info(f"Delta: known share reached {stop_ratio:.0%} on page {page_num}. Stopping.")
+                return total_collected
+
+        window = list(range(next_page, min(next_page + DELTA_PAGE_WINDOW, pages_to_process + 1)))
+        next_page += len(window)
+        page_results = list(fetch_pages(api_client, window)) if window else []
+
+    return total_collected
+
+
+def run_scraper(
+    search_config,
+    engine="threads",
+    delta=False,
+    stop_ratio=DELTA_STOP_RATIO,
+    cache_mode="off",
+    pipeline=False,
+    parse_workers=PIPELINE_PARSE_WORKERS,
+    compression=None,
+    writer=None,
+    resume=False,
+    seen_store=None,
+):
+    """
+    Scrapes all result pages for `search_config` into the JSONL output file.
+    `search_config` may also be a list of configs: the pages of every query are scheduled
+    on one shared pool (one session, cache and rate limit), and postings already returned
+    by another query are dropped before they are parsed.
+    engine="threads" uses a fixed ThreadPool; engine="async" uses an asyncio engine
+    with adaptive concurrency over a pooled keep-alive session.
+    delta=True writes only new or changed postings to the delta output file and stops
+    paging once `stop_ratio` of a page is already known from earlier runs. Postings are
+    classified and marked in `seen_store` (default: a SeenJobsStore on SEEN_JOBS_FILE), which
+    is not saved here: the caller saves it once the delta file has been consumed, so postings
+    of a delta that never reached the DB are emitted again by the next run.
+    cache_mode="use" serves page responses from the on-disk cache (revalidating stale ones),
+    cache_mode="replay" serves only cached responses and never touches the network.
+    pipeline=True moves parsing into a process pool (`parse_workers` processes) and writing into
+    its own thread, connected to the fetch engine by bounded queues (full scrapes only).
+    compression="gzip"/"zstd" compresses the output snapshot (see storage.output_path).
+    writer replaces the JSONL output with any sink exposing write_rows (e.g. a DB loader).
+    Full scrapes into the JSONL output checkpoint every written page; resume=True continues
+    an interrupted run from its checkpoint, fetching only the missing pages.
+    Returns the number of jobs collected, or None when the scrape was aborted.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown scraper engine '{engine}'. Expected one of {ENGINES}.")
+    if cache_mode not in CACHE_MODES:
+        raise ValueError(f"Unknown cache mode '{cache_mode}'. Expected one of {CACHE_MODES}.")
+
+    search_configs = search_config if isinstance(search_config, list) else [search_config]
+    if not search_configs:
+        raise ValueError("run_scraper needs at least one search config.")
+
+    filename = JSONL_DELTA_OUTPUT_FILE if delta else JSONL_OUTPUT_FILE
+    if delta and seen_store is None:
+        seen_store = SeenJobsStore(SEEN_JOBS_FILE)
+
+    logger.info(f"Scraper started (engine: {engine}, delta: {delta}, queries: {len(search_configs)})")
+    for query in search_configs:
+        logger.info(f"Search config: {query}")
+
+    cache = None
+    if cache_mode != "off":
+        cache = ResponseCache(HTTP_CACHE_DIR, HTTP_CACHE_TTL_SECONDS, mode=cache_mode)
+        logger.info(f"Response cache enabled (mode: {cache_mode}, dir: {HTTP_CACHE_DIR}).")
+
+    rate_limiter = RateLimiter()
+    if engine == "async":
+        session = create_session(ASYNC_MAX_CONCURRENCY)
+        fetch_pages = fetch_pages_async
+    else:
+        session = None
+        fetch_pages = fetch_pages_threaded
+
+    clients = [
+        ApiClient(
+            query, session=session, cache=cache, rate_limiter=rate_limiter, query_index=query_index,
+        )
+        for query_index, query in enumerate(search_configs)
+    ]
+    api_client = MultiQueryClient(clients)
+
+    first_pages = {
+        query_index: data
+        for (query_index, _), data in fetch_pages(api_client, [(index, 1) for index in range(len(clients))])
+        if data
+    }
+
+    pages_to_process = []
+    for query_index in range(len(clients)):
+        first_page = first_pages.get(query_index)
+        if not first_page:
+            logger.error(f"Failed to fetch page 1 of query {query_index}.")
+            pages_to_process.append(0)
+            continue
+
+        total_api_pages = first_page.get("TotalPagesNumber", 0)
+        total_jobs = first_page.get("TotalSearchResultCount", 0)
+        logger.info(f"Query {query_index}: API reports {total_jobs} jobs across {total_api_pages} pages.")
+        pages_to_process.append(min(total_api_pages, MAX_PAGES_TO_FETCH))
+
+    if not any(pages_to_process):
+        logger.error("No query returned any pages. Aborting.")
+        return None
+
+    logger.info(
+        f"Processing {sum(pages_to_process)} pages across {len(clients)} queries "
+        f"(limit: {MAX_PAGES_TO_FETCH} per query)."
+    )
+
+    checkpoint = None
+    resume_lines = None
+    completed_pages = set()
+    if writer is None and not delta:
+        checkpoint = ScrapeCheckpoint(SCRAPE_CHECKPOINT_FILE)
+        session_info = {
+            "search_config": search_config,
+            "output": filename,
+            "compression": compression,
+            "pages_to_process": pages_to_process,
+        }
+        if resume and checkpoint.load() and checkpoint.matches(session_info):
+            resume_lines = read_partial_lines(partial_path(filename, compression), checkpoint.rows_committed)
+            if len(resume_lines) == checkpoint.rows_committed:
+                completed_pages = checkpoint.completed_pages
+                pages_to_process = checkpoint.session.get("pages_to_process", pages_to_process)
+                logger.info(
+                    f"Resuming scrape: {len(completed_pages)}/{sum(pages_to_process)} pages "
+                    f"({len(resume_lines)} rows) already written."
+                )
+            else:
+                logger.warning(
+                    f"Partial output has {len(resume_lines)} of {checkpoint.rows_committed} "
+                    f"checkpointed rows. Starting over."
+                )
+                resume_lines = None
+        elif resume:
+            logger.warning("No matching checkpoint found. Starting a fresh scrape.")
+        if not completed_pages:
+            checkpoint.start(session_info)
+    elif resume:
+        logger.warning("Resume is only supported for full scrapes into the JSONL output. Starting over.")
+
+    total_collected = len(resume_lines or [])
+    # Links already written (restored rows included); duplicates from other queries are dropped.
+    seen_links = {json.loads(line).get('link') for line in resume_lines or []}
     start_time = time.time()
 
+    def keep_unseen(data):
+        return drop_seen_jobs(data, api_client.base_url, seen_links)
+
     try:
-        with StreamingJsonlWriter(filename) as writer:
-            logger.info("Processing page 1...")
-            jobs_page_1 = extract_jobs_from_page(first_page, api_client.base_url)
-            writer.write_rows(jobs_page_1)
-            total_collected += len(jobs_page_1)
-
-            pages_to_fetch = list(range(2, pages_to_process + 1))
-
-            if pages_to_fetch:
-                logger.info(f"Dispatching {len(pages_to_fetch)} pages to ThreadPool ({MAX_CONCURRENT_WORKERS} workers).")
-
-                with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_WORKERS) as executor:
-                    future_to_page = {
-                        executor.submit(api_client.fetch_page, page): page
-                        for page in pages_to_fetch
-                    }
-
-                    for future in as_completed(future_to_page):
-                        page_num = future_to_page[future]
-                        try:
-                            data = future.result()
-                            if data:
-                                jobs = extract_jobs_from_page(data, api_client.base_url)
-                                if jobs:
-                                    writer.write_rows(jobs)
-                                    total_collected += len(jobs)
-
-                        except Exception as e:
-                            logger.error(f"Failed processing page {page_num}: {e}", exc_info=False)
+        output = writer or StreamingJsonlWriter(
+            filename, compression=compression,
+            keep_partial=checkpoint is not None, resume_lines=resume_lines,
+        )
+        with output as writer:
+            def page_written(page, row_count):
+                if checkpoint is not None:
+                    writer.flush()
+                    checkpoint.record_page(page, row_count)
+
+            first_results = [
+                ((query_index, 1), data) for query_index, data in sorted(first_pages.items())
+                if (query_index, 1) not in completed_pages
+            ]
+            pages_to_fetch = [
+                (query_index, page_num)
+                for query_index, page_count in enumerate(pages_to_process)
+                for page_num in range(1, page_count + 1)
+                if (query_index, page_num) not in completed_pages
+                and not (page_num == 1 and query_index in first_pages)
+            ]
+
+            if delta:
+                total_collected = 0
+                run_keys = {}
+                for query_index, first_page in sorted(first_pages.items()):
+                    total_collected += scrape_delta_pages(
+                        clients[query_index], fetch_pages, first_page, pages_to_process[query_index],
+                        writer, seen_store, stop_ratio, run_keys
+                    )
+            elif pipeline:
+                page_results = chain(first_results, fetch_pages(api_client, pages_to_fetch))
+                total_collected += run_pipeline(
+                    page_results, api_client.base_url, writer,
+                    parse_workers=parse_workers, on_page_written=page_written,
+                    page_filter=keep_unseen, seen_links=seen_links,
+                )
+            else:
+                for page, data in chain(first_results, fetch_pages(api_client, pages_to_fetch)):
+                    try:
+                        if data:
+                            jobs = extract_jobs_from_page(keep_unseen(data), api_client.base_url)
+                            row_count = write_unseen_rows(writer, jobs, seen_links)
+                            total_collected += row_count
+                            page_written(page, row_count)
+
+                    except Exception as e:
+                        logger.error(f"Failed processing page {page}: {e}", exc_info=False)
 
     except Exception as e:
         logger.critical(f"Critical failure during scraping: {e}", exc_info=True)
-        return
+        logger.info(f"Request stats: {rate_limiter.stats.summary()}")
+        return None
+
+    if checkpoint is not None:
+        checkpoint.clear()
 
     elapsed = time.time() - start_time
     logger.info("Scraper finished")
-    logger.info(f"Collected total {total_collected} jobs in {elapsed:.2f} seconds.")
\ No newline at end of file
+    logger.info(f"Collected total {total_collected} jobs in {elapsed:.2f} seconds.")
+    logger.info(f"Request stats: {rate_limiter.stats.summary()}")
+    return total_collected
\ No newline at end of file
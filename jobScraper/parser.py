@@ -1,9 +1,96 @@
 from bs4 import BeautifulSoup
 import re
+import html
 import logging
+from html.entities import html5 as HTML5_ENTITIES
 
 logger = logging.getLogger(__name__)
 
+# Tags the fast path understands. They only separate text; anything else
+# (script/style/template content, comments, CDATA, stray '<') goes to BeautifulSoup.
+FAST_PATH_TAGS = frozenset({
+    "a", "abbr", "b", "big", "blockquote", "br", "center", "cite", "code", "dd", "del", "div",
+    "dl", "dt", "em", "font", "h1", "h2", "h3", "h4", "h5", "h6", "hr", "i", "img", "ins",
+    "label", "li", "mark", "ol", "p", "q", "s", "small", "span", "strike", "strong", "sub",
+    "sup", "table", "tbody", "td", "tfoot", "th", "thead", "tr", "u", "ul", "wbr",
+    "section", "article", "header", "footer",
+})
+
+# BeautifulSoup does not treat end tags of void elements (e.g. </br>) as text separators.
+VOID_TAGS = frozenset({"br", "hr", "img", "wbr"})
+
+_TAG_RE = re.compile(
+    r"""<(?:
+        ([A-Za-z][A-Za-z0-9]*)                                   # start tag name
+        (?:\s+[^\s"'<>/=]+(?:\s*=\s*(?:"[^"<]*"|'[^'<]*'|[^\s"'<>=`]+))?)*
+        \s*/?
+      |
+        /([A-Za-z][A-Za-z0-9]*)\s*                                # end tag name
+    )>""",
+    re.VERBOSE,
+)
+_CHARREF_RE = re.compile(r"&(?:#([0-9]{1,7});|#[xX]([0-9a-fA-F]{1,6});|([A-Za-z][A-Za-z0-9]*);)")
+_BLANK_LINES_RE = re.compile(r'\n\s*\n+')
+_SAFE_CONTROL_CHARS = frozenset("\t\n\x0c\r")
+
+
+def _fast_charrefs_ok(text):
+    """True when every '&' in `text` is a reference that html.unescape resolves like BeautifulSoup."""
+    matched = 0
+    for match in _CHARREF_RE.finditer(text):
+        name = match.group(3)
+        if name is not None:
+            if name + ";" not in HTML5_ENTITIES:
+                return False
+        else:
+            char = html.unescape(match.group(0))
+            if len(char) != 1 or not (char.isprintable() or char in _SAFE_CONTROL_CHARS):
+                return False
+        matched += 1
+    return matched == text.count("&")
+
+
+def _fast_html_to_text(raw_html):
+    """
+    Streaming tokenizer equivalent of BeautifulSoup(...).get_text("\n", strip=True) for the
+    simple markup job postings use. Returns None when the input needs the full parser.
+    """
+    if "\x00" in raw_html:
+        return None
+
+    parts = []
+    position = 0
+    for match in _TAG_RE.finditer(raw_html):
+        start_name, end_name = match.groups()
+        tag_name = (start_name or end_name).lower()
+        if tag_name not in FAST_PATH_TAGS or (end_name and tag_name in VOID_TAGS):
+            return None
+        parts.append(raw_html[position:match.start()])
+        position = match.end()
+    parts.append(raw_html[position:])
+
+    strings = []
+    for part in parts:
+        if "<" in part:
+            return None
+        if "&" in part:
+            if not _fast_charrefs_ok(part):
+                return None
+            part = html.unescape(part)
+        part = part.strip()
+        if part:
+            strings.append(part)
+
+    return "\n".join(strings)
+
+
+def _soup_html_to_text(raw_html):
+    soup = BeautifulSoup(raw_html, 'html.parser')
+    for br in soup.find_all("br"):
+        br.replace_with("\n")
+
+    return soup.get_text(separator="\n", strip=True)
+
 
 def clean_html(raw_html):
     if not raw_html:
@@ -11,12 +98,51 @@ def clean_html(raw_html):
 
     raw_html = raw_html.replace("<br/>", "<br>")
 
-    soup = BeautifulSoup(raw_html, 'html.parser')
-    for br in soup.find_all("br"):
-        br.replace_with("\n")
-
-    text = soup.get_text(separator="\n", strip=True)
-    return re.sub(r'\n\s*\n+', '\n', text)
+    text = _fast_html_to_text(raw_html)
+    if text is None:
+        text = _soup_html_to_text(raw_html)
+    return _BLANK_LINES_RE.sub('\n', text)
+
+
+def job_link(job_item, base_url):
+    """Absolute link of a raw ResultList item, or None when it has none."""
+    relative_link = job_item.get('JobInfo', {}).get('Link')
+    return f"{base_url}{relative_link}" if base_url and relative_link else None
+
+
+def drop_seen_jobs(data, base_url, seen_links):
+    """
+    Removes raw postings whose link is already in `seen_links` (e.g. written under another
+    search query of the same scrape), so duplicates are dropped before their HTML is parsed.
+    `seen_links` is only read: links are recorded once their rows are written (see
+    drop_seen_rows), so a page that fails later does not hide its postings from other queries.
+    Returns the page with the filtered ResultList.
+    """
+    job_list = data.get('ResultList') if data else None
+    if not isinstance(job_list, list):
+        return data
+
+    unseen = [
+        job_item for job_item in job_list
+        if not isinstance(job_item, dict) or job_link(job_item, base_url) not in seen_links
+    ]
+    if len(unseen) == len(job_list):
+        return data
+    return dict(data, ResultList=unseen)
+
+
+def drop_seen_rows(jobs, seen_links):
+    """Parsed jobs whose link is neither in `seen_links` nor repeated earlier in `jobs`."""
+    unseen = []
+    batch_links = set()
+    for job in jobs:
+        link = job.get('link')
+        if link and link != 'N/A':
+            if link in seen_links or link in batch_links:
+                continue
+            batch_links.add(link)
+        unseen.append(job)
+    return unseen
 
 
 def extract_jobs_from_page(data, base_url):
@@ -33,13 +159,11 @@ def extract_jobs_from_page(data, base_url):
 
         job_content = job_item.get('JobContent', {})
         company_data = job_item.get('Company', {})
-        job_info = job_item.get('JobInfo', {})
 
         job_title = job_content.get('Name', 'N/A')
         company_name = company_data.get('CompanyDisplayName', 'N/A')
         experience_text = job_content.get('Experience', {}).get('NameInHebrew', 'N/A')
-        relative_link = job_info.get('Link')
-        full_link = f"{base_url}{relative_link}" if base_url and relative_link else 'N/A'
+        full_link = job_link(job_item, base_url) or 'N/A'
 
         description_html = job_content.get('Description', '')
         requirements_html = job_content.get('Requirements', '')
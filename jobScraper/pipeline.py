@@ -0,0 +1,154 @@
+import os
+import queue
+import logging
+import threading
+from collections import deque
+from multiprocessing import get_context
+from concurrent.futures import ProcessPoolExecutor
+
+from .parser import extract_jobs_from_page, drop_seen_rows
+
+logger = logging.getLogger(__name__)
+
+PIPELINE_PARSE_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+PIPELINE_QUEUE_SIZE = 32
+
+_DONE = object()
+
+
+def _fetch_stage(page_results, raw_queue, errors):
+    try:
+        for item in page_results:
+            raw_queue.put(item)
+    except Exception as e:
+        errors.append(e)
+    finally:
+        raw_queue.put(_DONE)
+
+
+def write_unseen_rows(writer, jobs, seen_links=None):
+    """
+    Writes the parsed jobs, minus those whose link is in `seen_links`, and records their
+    links only once the write succeeded. Returns the number of rows written.
+    """
+    if seen_links is not None:
+        jobs = drop_seen_rows(jobs, seen_links)
+    if jobs:
+        writer.write_rows(jobs)
+        if seen_links is not None:
+            seen_links.update(job.get('link') for job in jobs if job.get('link') not in (None, 'N/A'))
+    return len(jobs)
+
+
+def _write_stage(writer, parsed_queue, counter, errors, on_page_written, seen_links):
+    while True:
+        item = parsed_queue.get()
+        if item is _DONE:
+            return
+        if errors:
+            # Keep draining so the parse stage never blocks on a full queue.
+            continue
+        page_num, jobs = item
+        try:
+            row_count = write_unseen_rows(writer, jobs, seen_links)
+            counter[0] += row_count
+            if on_page_written is not None:
+                on_page_written(page_num, row_count)
+        except Exception as e:
+            errors.append(e)
+
+
+def run_pipeline(
+    page_results,
+    base_url,
+    writer,
+    parse_workers=PIPELINE_PARSE_WORKERS,
+    queue_size=PIPELINE_QUEUE_SIZE,
+    parse_executor=None,
+    on_page_written=None,
+    page_filter=None,
+    seen_links=None,
+):
+    """
+    Runs fetch -> parse -> write as three stages connected by bounded queues.
+
+    `page_results` is any iterable of (page_num, data), e.g. one of the fetch engines; it is
+    drained by its own thread. Pages are parsed in a process pool (`parse_workers` processes,
+    at most 2 * parse_workers pages in flight) and written by a dedicated writer thread.
+    A full queue blocks the stage in front of it, so a slow stage throttles the others.
+    `on_page_written(page_num, row_count)` is called by the writer thread after each page.
+    `page_filter(data)` runs on the raw page before it is handed to a parse worker
+    (e.g. parser.drop_seen_jobs for cross-query dedupe). With `seen_links`, the writer thread
+    skips rows whose link is in it and adds the links of every row it writes.
+    Returns the number of rows written.
+    """
+    raw_queue = queue.Queue(maxsize=queue_size)
+    parsed_queue = queue.Queue(maxsize=queue_size)
+    errors = []
+    written = [0]
+    max_in_flight = 2 * parse_workers
+
+    # Spawned, not forked: the fetch engine and the caller may already run threads holding
+    # locks (logging, the HTTP pool, the async loop), which a forked child would inherit locked.
+    # Created before this function starts its own threads.
+    owns_executor = parse_executor is None
+    executor = parse_executor or ProcessPoolExecutor(max_workers=parse_workers, mp_context=get_context("spawn"))
+
+    fetch_thread = threading.Thread(
+        target=_fetch_stage, args=(page_results, raw_queue, errors), name="pipeline-fetch", daemon=True
+    )
+    write_thread = threading.Thread(
+        target=_write_stage, args=(writer, parsed_queue, written, errors, on_page_written, seen_links),
+        name="pipeline-write", daemon=True
+    )
+    fetch_thread.start()
+    write_thread.start()
+
+    logger.info(f"Pipeline started: {parse_workers} parse workers, queue size {queue_size}.")
+
+    def forward_oldest(pending):
+        page_num, future = pending.popleft()
+        try:
+            jobs = future.result()
+        except Exception as e:
+            logger.error(f"Failed processing page {page_num}: {e}", exc_info=False)
+            return
+        parsed_queue.put((page_num, jobs or []))
+
+    fetch_finished = False
+    try:
+        pending = deque()
+        while True:
+            item = raw_queue.get()
+            if item is _DONE:
+                fetch_finished = True
+                break
+            page_num, data = item
+            if not data:
+                continue
+            if page_filter is not None:
+                try:
+                    data = page_filter(data)
+                except Exception as e:
+                    logger.error(f"Failed processing page {page_num}: {e}", exc_info=False)
+                    continue
+
+            pending.append((page_num, executor.submit(extract_jobs_from_page, data, base_url)))
+            while len(pending) >= max_in_flight:
+                forward_oldest(pending)
+
+        while pending:
+            forward_oldest(pending)
+    finally:
+        if owns_executor:
+            executor.shutdown()
+        parsed_queue.put(_DONE)
+        while not fetch_finished:
+            fetch_finished = raw_queue.get() is _DONE
+        fetch_thread.join()
+        write_thread.join()
+
+    if errors:
+        raise errors[0]
+
+    return written[0]
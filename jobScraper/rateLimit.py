@@ -0,0 +1,151 @@
+import time
+import random
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+
+logger = logging.getLogger(__name__)
+
+REQUESTS_PER_SECOND = 10.0
+BURST_SIZE = 10
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 30.0
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN_SECONDS = 15.0
+
+
+def parse_retry_after(value):
+    """Returns the Retry-After header as seconds (delta-seconds or HTTP-date), or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt, retry_after=None, base=BACKOFF_BASE_SECONDS, cap=BACKOFF_MAX_SECONDS):
+    """Exponential backoff with full jitter; never shorter than the server's Retry-After."""
+    delay = random.uniform(0, min(cap, base * (2 ** attempt)))
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, cap))
+    return delay
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by every worker of a scrape."""
+
+    def __init__(self, rate=REQUESTS_PER_SECOND, capacity=BURST_SIZE):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures across all workers and holds every
+    worker for `cooldown` seconds. A server Retry-After can also pause the pool directly.
+    """
+
+    def __init__(self, failure_threshold=BREAKER_FAILURE_THRESHOLD, cooldown=BREAKER_COOLDOWN_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.trips = 0
+        self.lock = threading.Lock()
+
+    def wait_if_open(self):
+        while True:
+            with self.lock:
+                remaining = self.open_until - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(remaining)
+
+    def pause(self, seconds):
+        with self.lock:
+            self.open_until = max(self.open_until, time.monotonic() + seconds)
+
+    def record_success(self):
+        with self.lock:
+            self.consecutive_failures = 0
+
+    def record_failure(self):
+        with self.lock:
+            self.consecutive_failures += 1
+            if self.consecutive_failures < self.failure_threshold:
+                return
+            self.consecutive_failures = 0
+            self.open_until = max(self.open_until, time.monotonic() + self.cooldown)
+            self.trips += 1
+        logger.warning(f"Circuit breaker open: pausing all workers for {self.cooldown:.0f}s.")
+
+
+class ScrapeStats:
+    """Thread-safe counters reported at the end of a scrape."""
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+        self.server_errors = 0
+        self.lost_pages = []
+        self.lock = threading.Lock()
+
+    def increment(self, counter):
+        with self.lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def page_lost(self, page_key):
+        """page_key is the page number, or (query_index, page_num) for a multi-query scrape."""
+        with self.lock:
+            self.lost_pages.append(page_key)
+
+    def summary(self):
+        return (
+            f"{self.requests} requests, {self.retries} retries, {self.throttled} throttled (429), "
+            f"{self.server_errors} server errors (5xx), {len(self.lost_pages)} pages lost"
+            + (f": {sorted(self.lost_pages)}" if self.lost_pages else "")
+        )
+
+
+class RateLimiter:
+    """Token bucket + circuit breaker + stats, shared by every ApiClient call of a scrape."""
+
+    def __init__(self, bucket=None, breaker=None):
+        self.bucket = bucket or TokenBucket()
+        self.breaker = breaker or CircuitBreaker()
+        self.stats = ScrapeStats()
+
+    def before_request(self):
+        self.breaker.wait_if_open()
+        self.bucket.acquire()
+        self.stats.increment("requests")
+
+    def record_success(self):
+        self.breaker.record_success()
+
+    def record_failure(self, retry_after=None):
+        if retry_after:
+            self.breaker.pause(retry_after)
+        self.breaker.record_failure()
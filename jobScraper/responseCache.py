@@ -0,0 +1,99 @@
+import json
+import os
+import time
+import hashlib
+import tempfile
+import logging
+
+logger = logging.getLogger(__name__)
+
+CACHE_MODES = ("off", "use", "replay")
+
+
+class ResponseCache:
+    """
+    On-disk cache of API page responses, one JSON file per request keyed by URL + query params.
+
+    mode="use":    fresh entries (younger than `ttl` seconds) are served from disk; stale ones
+                   are revalidated with If-None-Match / If-Modified-Since when the server sent
+                   validators, otherwise refetched.
+    mode="replay": only cached entries are served, regardless of age; misses never hit the network.
+    """
+
+    def __init__(self, directory, ttl, mode="use"):
+        if mode not in CACHE_MODES or mode == "off":
+            raise ValueError(f"Invalid cache mode '{mode}'. Expected 'use' or 'replay'.")
+        self.directory = directory
+        self.ttl = ttl
+        self.mode = mode
+        os.makedirs(self.directory, exist_ok=True)
+
+    @property
+    def replay_only(self):
+        return self.mode == "replay"
+
+    @staticmethod
+    def make_key(url, params):
+        payload = json.dumps({"url": url, "params": params}, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, url, params):
+        path = self._path(self.make_key(url, params))
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"ResponseCache: Ignoring unreadable entry {path}: {e}")
+            return None
+
+    def is_fresh(self, entry):
+        return time.time() - entry.get("fetched_at", 0) < self.ttl
+
+    @staticmethod
+    def conditional_headers(entry):
+        headers = {}
+        if not entry:
+            return headers
+        if entry.get("etag"):
+            headers['If-None-Match'] = entry["etag"]
+        if entry.get("last_modified"):
+            headers['If-Modified-Since'] = entry["last_modified"]
+        return headers
+
+    def store(self, url, params, body, etag=None, last_modified=None):
+        entry = {
+            "url": url,
+            "params": params,
+            "fetched_at": time.time(),
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body,
+        }
+        self._write(self.make_key(url, params), entry)
+        return entry
+
+    def refresh(self, entry):
+        """Marks a revalidated (304) entry as fresh again."""
+        entry["fetched_at"] = time.time()
+        self._write(self.make_key(entry["url"], entry["params"]), entry)
+
+    def _write(self, key, entry):
+        path = self._path(key)
+        tmp_path = None
+        try:
+            # A unique temp file per write: concurrent fetchers may write the same key at once.
+            with tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', dir=os.path.dirname(path), suffix='.tmp', delete=False
+            ) as f:
+                tmp_path = f.name
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"ResponseCache: Could not write entry {path}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
@@ -0,0 +1,93 @@
+import json
+import os
+import time
+import hashlib
+import logging
+
+from config import SEEN_JOBS_MAX_AGE_DAYS, SEEN_JOBS_MAX_ENTRIES
+
+logger = logging.getLogger(__name__)
+
+NEW = "new"
+CHANGED = "changed"
+KNOWN = "known"
+
+
+def job_key(job):
+    """Stable identity of a posting: its link, or title+company when the link is missing."""
+    link = job.get('link')
+    if link and link != 'N/A':
+        return link
+    return f"{job.get('title', 'N/A')}|{job.get('company', 'N/A')}"
+
+
+def content_hash(job):
+    payload = json.dumps(job, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class SeenJobsStore:
+    """
+    Persistent map of posting key -> (content hash, last time seen) for postings seen by
+    earlier scrapes. Changes are kept in memory until save() so an aborted run does not
+    advance the store. save() drops postings not seen for `max_age_days` and then keeps
+    at most `max_entries` of the most recently seen ones; a dropped posting that shows up
+    again is simply reported as new.
+    """
+
+    def __init__(self, filename, max_age_days=SEEN_JOBS_MAX_AGE_DAYS, max_entries=SEEN_JOBS_MAX_ENTRIES):
+        self.filename = filename
+        self.max_age_days = max_age_days
+        self.max_entries = max_entries
+        self.hashes = {}
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.filename):
+            logger.info(f"SeenJobsStore: {self.filename} not found, starting with an empty store.")
+            return
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"SeenJobsStore: Could not read {self.filename}: {e}. Starting empty.")
+            return
+        now = time.time()
+        # Stores written before entries had a timestamp hold the bare hash; count those as seen now.
+        self.hashes = {
+            key: entry if isinstance(entry, list) else [entry, now]
+            for key, entry in stored.items()
+        }
+        logger.info(f"SeenJobsStore: Loaded {len(self.hashes)} known postings.")
+
+    def classify(self, job):
+        entry = self.hashes.get(job_key(job))
+        if entry is None:
+            return NEW
+        if entry[0] != content_hash(job):
+            return CHANGED
+        return KNOWN
+
+    def mark(self, job):
+        self.hashes[job_key(job)] = [content_hash(job), time.time()]
+
+    def prune(self):
+        """Applies the age and size bounds. Returns the number of postings dropped."""
+        before = len(self.hashes)
+        if self.max_age_days is not None:
+            cutoff = time.time() - self.max_age_days * 86400
+            self.hashes = {key: entry for key, entry in self.hashes.items() if entry[1] >= cutoff}
+        if self.max_entries is not None and len(self.hashes) > self.max_entries:
+            newest = sorted(self.hashes.items(), key=lambda item: item[1][1], reverse=True)[:self.max_entries]
+            self.hashes = dict(newest)
+        return before - len(self.hashes)
+
+    def save(self):
+        dropped = self.prune()
+        if dropped:
+            logger.info(f"SeenJobsStore: Dropped {dropped} postings not seen recently.")
+        tmp_filename = f"{self.filename}.tmp"
+        with open(tmp_filename, 'w', encoding='utf-8') as f:
+            json.dump(self.hashes, f, ensure_ascii=False)
+        os.replace(tmp_filename, self.filename)
+        logger.info(f"SeenJobsStore: Saved {len(self.hashes)} known postings to {self.filename}.")
@@ -1,24 +1,191 @@
+import io
+import os
+import gzip
 import json
+import logging
 from threading import Lock
+from contextlib import ExitStack
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _dumps(row):
+    # orjson is a pinned requirement; the stdlib fallback writes the same compact form.
+    if orjson is not None:
+        return orjson.dumps(row)
+    return json.dumps(row, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+
+
+def output_path(filename, compression=None):
+    """Final path of a JSONL snapshot for the given compression (e.g. jobs_data.jsonl.gz)."""
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unknown compression '{compression}'. Expected one of {list(COMPRESSION_SUFFIXES)}.")
+    return f"{filename}{COMPRESSION_SUFFIXES[compression]}"
+
+
+def partial_path(filename, compression=None):
+    """Temp file a writer streams into before the atomic rename (kept on failure for resume)."""
+    return f"{output_path(filename, compression)}.tmp"
+
+
+def read_partial_lines(path, limit):
+    """
+    Returns up to `limit` complete lines from a partial output left by an interrupted run.
+    A torn last line or a truncated compressed tail is ignored.
+    """
+    lines = []
+    if limit <= 0 or not os.path.exists(path):
+        return lines
+    try:
+        with open_jsonl(path) as f:
+            for line in f:
+                if len(lines) >= limit or not line.endswith("\n"):
+                    break
+                lines.append(line)
+    except Exception as e:
+        logger.warning(f"Storage: Stopped reading partial output {path} after {len(lines)} rows: {e}")
+    return lines
+
+
+def open_jsonl(path):
+    """Opens a JSONL snapshot for reading as text, transparently decompressing gzip/zstd."""
+    with open(path, 'rb') as f:
+        magic = f.read(4)
+
+    if magic.startswith(_GZIP_MAGIC):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    if magic.startswith(_ZSTD_MAGIC):
+        if zstandard is None:
+            raise RuntimeError(f"{path} is zstd-compressed but 'zstandard' is not installed.")
+        raw = open(path, 'rb')
+        return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(raw, closefd=True), encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
 
 class StreamingJsonlWriter:
-    def __init__(self, filename):
-        self.filename = filename
+    """
+    Writes JSONL rows to a temp file next to the target and atomically renames it over the
+    target when the `with` block exits cleanly; on error the previous snapshot stays untouched.
+    Rows are serialized per batch outside the lock and written through a large buffer,
+    optionally gzip/zstd compressed (the suffix is added to the filename).
+
+    keep_partial=True leaves the temp file in place on error, and `resume_lines` (from
+    read_partial_lines) are written back first, so an interrupted scrape can be resumed.
+    """
+
+    def __init__(self, filename, compression=None, buffer_size=WRITE_BUFFER_SIZE,
+                 keep_partial=False, resume_lines=None):
+        if compression == "zstd" and zstandard is None:
+            raise ValueError("compression='zstd' needs the 'zstandard' package (see requirements.txt).")
+        self.filename = output_path(filename, compression)
+        self.tmp_filename = partial_path(filename, compression)
+        self.compression = compression
+        self.buffer_size = buffer_size
+        self.keep_partial = keep_partial
+        self.resume_lines = resume_lines or []
         self.write_lock = Lock()
+        self.raw_handle = None
         self.file_handle = None
+        self.rows_written = 0
 
     def __enter__(self):
-        self.file_handle = open(self.filename, 'w', encoding='utf-8')
+        self.raw_handle = open(self.tmp_filename, 'wb', buffering=self.buffer_size)
+        if self.compression == "gzip":
+            self.file_handle = gzip.GzipFile(fileobj=self.raw_handle, mode='wb', compresslevel=6)
+        elif self.compression == "zstd":
+            self.file_handle = zstandard.ZstdCompressor(level=3).stream_writer(self.raw_handle, closefd=False)
+        else:
+            self.file_handle = self.raw_handle
+
+        if self.resume_lines:
+            self.file_handle.write("".join(self.resume_lines).encode('utf-8'))
+            self.rows_written = len(self.resume_lines)
+            logger.info(f"Storage: Restored {self.rows_written} rows from the partial output.")
         return self
 
     def write_rows(self, rows):
         if not rows:
             return
+        payload = b"".join(_dumps(row) + b"\n" for row in rows)
+        with self.write_lock:
+            self.file_handle.write(payload)
+            self.rows_written += len(rows)
+
+    def flush(self):
+        """Pushes everything written so far to disk (used before checkpointing a page)."""
         with self.write_lock:
-            for row in rows:
-                json.dump(row, self.file_handle, ensure_ascii=False)
-                self.file_handle.write('\n')
+            if self.compression == "zstd":
+                self.file_handle.flush(zstandard.FLUSH_BLOCK)
+            elif self.file_handle is not self.raw_handle:
+                self.file_handle.flush()
+            self.raw_handle.flush()
+            os.fsync(self.raw_handle.fileno())
+
+    def _close(self):
+        if self.file_handle is not None and self.file_handle is not self.raw_handle:
+            self.file_handle.close()
+        if self.raw_handle is not None:
+            self.raw_handle.flush()
+            os.fsync(self.raw_handle.fileno())
+            self.raw_handle.close()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            self._close()
+        except Exception:
+            if exc_type is None:
+                raise
+
+        if exc_type is None:
+            os.replace(self.tmp_filename, self.filename)
+            logger.info(f"Storage: Wrote {self.rows_written} rows to {self.filename}.")
+        else:
+            logger.error(f"Storage: Write aborted ({exc_type.__name__}); keeping previous {self.filename}.")
+            if self.keep_partial:
+                logger.info(f"Storage: Partial output kept at {self.tmp_filename} for resume.")
+            elif os.path.exists(self.tmp_filename):
+                os.remove(self.tmp_filename)
+
+
+class TeeWriter:
+    """
+    Fans write_rows out to several writers (e.g. a JSONL side tap plus a DB loader).
+    Writers are exited in reverse order, so a failure in a later writer aborts the earlier ones.
+    """
+
+    def __init__(self, *writers):
+        self.writers = writers
+        self.stack = None
+
+    def __enter__(self):
+        self.stack = ExitStack()
+        try:
+            for writer in self.writers:
+                self.stack.enter_context(writer)
+        except Exception:
+            self.stack.close()
+            raise
+        return self
+
+    def write_rows(self, rows):
+        for writer in self.writers:
+            writer.write_rows(rows)
 
     def __exit__(self, exc_type, exc_value, traceback):
-        if self.file_handle:
-            self.file_handle.close()
\ No newline at end of file
+        return self.stack.__exit__(exc_type, exc_value, traceback)
@@ -9,8 +9,10 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from runUpdate import run_full_update
+from analyzer.cacheListener import start_cache_listener, stop_cache_listener
 from api.routes.dashboard import router as dashboard_router
 from api.routes.analysis import router as analysis_router
+from api.routes.jobs import router as jobs_router
 
 logging.basicConfig(
     level=logging.INFO,
@@ -34,6 +36,18 @@ app.add_middleware(
 
 app.include_router(dashboard_router, prefix="/api", tags=["Dashboard"])
 app.include_router(analysis_router, prefix="/api", tags=["Analysis"])
+app.include_router(jobs_router, prefix="/api", tags=["Jobs"])
+
+
+@app.on_event("startup")
+def start_cache_invalidation():
+    # Runs in every uvicorn worker, so each process keeps its own query caches current.
+    start_cache_listener()
+
+
+@app.on_event("shutdown")
+def stop_cache_invalidation():
+    stop_cache_listener()
 
 
 def start_scheduler():
@@ -1,14 +1,25 @@
 import time
 import os
+import argparse
 import traceback
 import logging
 from dotenv import load_dotenv
 load_dotenv()
 from jobScraper.controller import run_scraper
-from analyzer.dbLoader import load_raw_data_to_db, create_schema
+from jobScraper.seenStore import SeenJobsStore
+from analyzer.dbLoader import (
+    load_raw_data_to_db, create_schema, swap_in_staged_load, effective_load_mode, bump_data_generation,
+    refresh_dashboard_summaries,
+)
 from analyzer import skillProcessor
-from analyzer.dbCore import get_db_connection
-from config import SEARCH_QUERY, JSONL_OUTPUT_FILE
+from analyzer.dbCore import db_connection, pool_stats
+from analyzer.streamLoader import StreamingDbLoader
+from jobScraper.storage import output_path, StreamingJsonlWriter, TeeWriter
+from config import (
+    SEARCH_QUERIES, JSONL_OUTPUT_FILE, JSONL_COMPRESSION, SEEN_JOBS_FILE,
+    SCRAPER_ENGINE, SCRAPER_PIPELINE, HTTP_CACHE_MODE,
+    STREAMING_ETL, STREAMING_JSONL_TAP, DB_LOAD_MODE,
+)
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(
@@ -20,7 +31,7 @@ logging.basicConfig(
 def ensure_schema():
     """Ensure database schema exists."""
     try:
-        with get_db_connection() as conn:
+        with db_connection() as conn:
             if conn is None:
                 logger.critical("DB connection unavailable.")
                 return False
@@ -33,9 +44,37 @@ def ensure_schema():
         return False
 
 
-def run_full_update():
-    """Run the full ETL process."""
-    logger.info("Starting full update...")
+def refresh_dashboard():
+    """Recompute the dashboard summary tables from the freshly loaded data."""
+    try:
+        with db_connection() as conn:
+            if conn is None:
+                logger.error("DB connection unavailable; dashboard summaries not refreshed.")
+                return False
+            refresh_dashboard_summaries(conn.cursor())
+            conn.commit()
+            return True
+    except Exception as e:
+        logger.error(f"Dashboard summary refresh error: {e}", exc_info=True)
+        return False
+
+
+def build_streaming_sink():
+    """DB loader for the streaming ETL, optionally teed into the JSONL snapshot."""
+    db_sink = StreamingDbLoader()
+    if not STREAMING_JSONL_TAP:
+        return db_sink
+    return TeeWriter(StreamingJsonlWriter(JSONL_OUTPUT_FILE, compression=JSONL_COMPRESSION), db_sink)
+
+
+def run_full_update(streaming=STREAMING_ETL, resume=False):
+    """
+    Run the full ETL process.
+    streaming=True scrapes straight into the DB (skills extracted on the fly) instead of
+    scrape -> JSONL -> load -> skill processing as separate stages. The streaming loader
+    replaces all jobs, so with DB_LOAD_MODE="incremental" the staged path is used instead.
+    resume=True continues an interrupted scrape from its page checkpoint.
+    """
     start = time.time()
 
     try:
@@ -43,20 +82,128 @@ def run_full_update():
             logger.critical("Update aborted: schema init failed.")
             return
 
-        run_scraper(SEARCH_QUERY)
+        load_mode = effective_load_mode(DB_LOAD_MODE)
+        if streaming and load_mode == "incremental":
+            logger.warning(
+                "Streaming ETL would replace every job and lose the history the incremental load keeps "
+                "(first_seen, content hashes); using scrape -> JSONL -> incremental load instead."
+            )
+            streaming = False
+        logger.info(f"Starting full update (streaming: {streaming}, resume: {resume})...")
 
-        if not os.path.exists(JSONL_OUTPUT_FILE):
-            logger.error(f"Output file not found: {JSONL_OUTPUT_FILE}")
-            return
+        collected = run_scraper(
+            SEARCH_QUERIES,
+            engine=SCRAPER_ENGINE,
+            cache_mode=HTTP_CACHE_MODE,
+            pipeline=SCRAPER_PIPELINE,
+            compression=JSONL_COMPRESSION,
+            writer=build_streaming_sink() if streaming else None,
+            resume=resume,
+        )
 
-        load_raw_data_to_db()
-        skillProcessor.run_skill_processor()
+        if streaming:
+            if collected is None:
+                logger.error("Streaming update failed; previous data kept.")
+                return
+        else:
+            snapshot_path = output_path(JSONL_OUTPUT_FILE, JSONL_COMPRESSION)
+            if not os.path.exists(snapshot_path):
+                logger.error(f"Output file not found: {snapshot_path}")
+                return
 
+            if not load_raw_data_to_db(mode=load_mode):
+                logger.error("DB load failed; skipping skill processing.")
+                return
+            tagged = skillProcessor.run_skill_processor(
+                incremental=load_mode == "incremental",
+                staging=load_mode == "swap",
+            )
+            if load_mode == "swap":
+                if not tagged or not swap_in_staged_load(skillProcessor.current_dictionary_entries()):
+                    logger.error("Staged load not swapped in; previous data kept.")
+                    return
+
+        refresh_dashboard()
+        bump_data_generation()
         logger.info(f"Update completed in {time.time() - start:.1f} seconds.")
+        logger.info(f"DB pool stats: {pool_stats()}")
     except Exception as e:
         logger.critical(f"Update crashed: {e}")
         traceback.print_exc()
 
 
+def run_delta_update():
+    """
+    Scrapes only postings that are new or changed since earlier delta runs (see
+    run_scraper(delta=True)) and applies that file to the DB incrementally, then re-tags
+    the changed jobs. Nothing is closed: postings that disappeared are only detected by
+    run_full_update, so run that one periodically.
+    """
+    logger.info("Starting delta update...")
+    start = time.time()
+    if not ensure_schema():
+        logger.critical("Delta update aborted: schema init failed.")
+        return False
+    seen_store = SeenJobsStore(SEEN_JOBS_FILE)
+    collected = run_scraper(
+        SEARCH_QUERIES, engine=SCRAPER_ENGINE, delta=True, cache_mode=HTTP_CACHE_MODE,
+        compression=JSONL_COMPRESSION, seen_store=seen_store,
+    )
+    if collected is None:
+        logger.error("Delta scrape failed; DB left unchanged.")
+        return False
+    if not collected:
+        seen_store.save()
+        logger.info("No new or changed postings.")
+        return True
+    if not load_raw_data_to_db(mode="incremental", delta=True):
+        # The store is not saved, so the next delta run emits these postings again.
+        logger.error("Delta load failed; skipping skill processing.")
+        return False
+    seen_store.save()
+    if not skillProcessor.run_skill_processor(incremental=True):
+        logger.error("Delta skill re-tag failed; dashboard not refreshed.")
+        return False
+    refresh_dashboard()
+    bump_data_generation()
+    logger.info(f"Delta update completed in {time.time() - start:.1f} seconds.")
+    return True
+
+
+def run_skill_retag():
+    """Apply skill_keywords.json edits to the stored skill links without scraping or reloading."""
+    logger.info("Starting skill re-tag...")
+    start = time.time()
+    if not ensure_schema():
+        logger.critical("Re-tag aborted: schema init failed.")
+        return False
+    if not skillProcessor.retag_changed_skills():
+        logger.error("Skill re-tag failed; see log above.")
+        return False
+    refresh_dashboard()
+    bump_data_generation()
+    logger.info(f"Skill re-tag completed in {time.time() - start:.1f} seconds.")
+    return True
+
+
 if __name__ == "__main__":
-    run_full_update()
\ No newline at end of file
+    arg_parser = argparse.ArgumentParser(description="Run the job market ETL.")
+    arg_parser.add_argument(
+        "--resume", action="store_true",
+        help="continue an interrupted scrape from its checkpoint instead of starting over",
+    )
+    arg_parser.add_argument(
+        "--retag-skills", action="store_true",
+        help="only re-tag the jobs affected by edits to skill_keywords.json, then exit",
+    )
+    arg_parser.add_argument(
+        "--delta", action="store_true",
+        help="scrape only new or changed postings and apply them incrementally (closes nothing)",
+    )
+    args = arg_parser.parse_args()
+    if args.retag_skills:
+        run_skill_retag()
+    elif args.delta:
+        run_delta_update()
+    else:
+        run_full_update(resume=args.resume)
\ No newline at end of file
@@ -0,0 +1,82 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from analyzer import queryCache, dbCore, dbLoader
+from analyzer.cacheListener import CacheInvalidationListener
+
+
+@pytest.fixture(autouse=True)
+def reset_generation(monkeypatch):
+    monkeypatch.setattr(queryCache, "_generation", 0)
+    yield
+    queryCache.clear_all()
+
+
+def test_drain_notifications_applies_the_newest_generation():
+    conn = MagicMock()
+    conn.notifies = [
+        SimpleNamespace(payload="3"),
+        SimpleNamespace(payload="garbage"),
+        SimpleNamespace(payload="5"),
+    ]
+    listener = CacheInvalidationListener(prewarm=0)
+
+    listener.drain_notifications(conn)
+
+    conn.poll.assert_called_once()
+    assert conn.notifies == []
+    assert queryCache.current_generation() == 5
+
+
+def test_sync_reads_the_generation_on_sqlite(mocker, tmp_path):
+    mocker.patch('analyzer.dbCore.DB_BACKEND', "sqlite")
+    mocker.patch('analyzer.dbCore.DB_FILE_PATH', str(tmp_path / "jobs.db"))
+    with dbCore.db_connection() as conn:
+        dbLoader.create_schema(conn.cursor())
+        conn.cursor().execute("UPDATE data_generation SET generation = 4 WHERE id = 1")
+
+    conn = dbCore.get_db_connection()
+    try:
+        CacheInvalidationListener(prewarm=0).sync(conn)
+    finally:
+        conn.close()
+    assert queryCache.current_generation() == 4
+
+
+def test_new_generation_prewarms_recently_used_queries():
+    calls = []
+
+    @queryCache.cached_query(maxsize=8, ttl=None)
+    def query(names):
+        calls.append(list(names))
+        return [queryCache.current_generation()]
+
+    query(["a", "b"])
+    listener = CacheInvalidationListener(prewarm=4)
+    listener.apply(1)
+
+    assert calls == [["a", "b"], ["a", "b"]]
+    assert query(["a", "b"]) == [1]
+    assert len(calls) == 2
+
+
+def test_run_survives_unexpected_errors_and_backs_off(mocker):
+    listener = CacheInvalidationListener(poll_seconds=10, prewarm=0, max_backoff=25)
+    conn = MagicMock()
+    mocker.patch('analyzer.cacheListener.get_db_connection', return_value=conn)
+    mocker.patch('analyzer.cacheListener.is_sqlite', return_value=False)
+    delays = []
+    mocker.patch.object(listener.stop_event, 'wait', side_effect=delays.append)
+    errors = [OSError("select failed"), ValueError("handler bug"), KeyError("again")]
+
+    def listen(conn):
+        if errors:
+            raise errors.pop(0)
+        listener.stop()
+
+    mocker.patch.object(listener, '_listen', side_effect=listen)
+
+    listener.run()
+
+    assert delays == [10, 20, 25, 0]
+    assert conn.close.call_count == 4
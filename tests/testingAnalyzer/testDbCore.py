@@ -0,0 +1,127 @@
+import pytest
+import psycopg2
+from unittest.mock import MagicMock
+from analyzer.dbCore import resolve_ids
+
+
+def test_resolve_ids_upserts_missing_names_in_two_round_trips():
+    cursor = MagicMock()
+    cursor.fetchall.side_effect = [
+        [("Python", 7)],
+        [("SQL", 3)],
+    ]
+    cache = {"Docker": 11}
+
+    ids = resolve_ids(cursor, "skills", "skill", ["SQL", "Python", "Docker", "", "N/A", "SQL"], cache)
+
+    assert ids == {"Python": 7, "SQL": 3, "Docker": 11}
+    assert cache == {"Python": 7, "SQL": 3, "Docker": 11}
+    assert cursor.execute.call_count == 2
+
+    insert_sql, insert_params = cursor.execute.call_args_list[0].args
+    assert "ON CONFLICT (skill_name) DO NOTHING RETURNING skill_name, skill_id" in insert_sql
+    assert insert_params == (["Python", "SQL"],)
+    assert cursor.execute.call_args_list[1].args[1] == (["SQL"],)
+
+
+def test_resolve_ids_skips_db_when_everything_is_cached():
+    cursor = MagicMock()
+    assert resolve_ids(cursor, "companies", "company", ["Google"], {"Google": 1}) == {"Google": 1}
+    assert resolve_ids(cursor, "companies", "company", [None, "N/A"]) == {}
+    cursor.execute.assert_not_called()
+
+
+def test_resolve_ids_raises_db_errors():
+    cursor = MagicMock()
+    cursor.execute.side_effect = psycopg2.Error("boom")
+    with pytest.raises(psycopg2.Error):
+        resolve_ids(cursor, "locations", "location", ["Haifa"])
+
+
+@pytest.fixture
+def fake_pool(mocker):
+    from psycopg2 import extensions
+    connections = []
+
+    def make_conn():
+        conn = MagicMock()
+        conn.closed = 0
+        conn.get_transaction_status.return_value = extensions.TRANSACTION_STATUS_IDLE
+        connections.append(conn)
+        return conn
+
+    threaded_pool = MagicMock()
+    idle = []
+    threaded_pool.getconn.side_effect = lambda: idle.pop() if idle else make_conn()
+    threaded_pool.putconn.side_effect = lambda conn, close=False: None if close else idle.append(conn)
+    mocker.patch('analyzer.dbCore.ThreadedConnectionPool', return_value=threaded_pool)
+    return threaded_pool, connections
+
+
+def test_pool_reuses_connections_and_tracks_stats(fake_pool):
+    from analyzer.dbCore import ConnectionPool, PoolTimeout
+    threaded_pool, connections = fake_pool
+    pool = ConnectionPool("dsn", min_size=1, max_size=2, timeout=0.05)
+
+    first = pool.getconn()
+    assert pool.stats()["in_use"] == 1
+    pool.putconn(first)
+    assert pool.getconn() is first
+
+    pool.getconn()
+    with pytest.raises(PoolTimeout):
+        pool.getconn()
+
+    stats = pool.stats()
+    assert stats["checkouts"] == 3
+    assert stats["in_use"] == stats["max_in_use"] == 2
+    assert stats["timeouts"] == 1
+    assert len(connections) == 2
+
+
+def test_pool_replaces_dead_and_rolls_back_dirty_connections(fake_pool):
+    from psycopg2 import extensions
+    from analyzer.dbCore import ConnectionPool, PoolTimeout
+    threaded_pool, connections = fake_pool
+    pool = ConnectionPool("dsn", max_size=1, timeout=0.05, healthcheck_after=0)
+
+    conn = pool.getconn()
+    conn.get_transaction_status.return_value = extensions.TRANSACTION_STATUS_INTRANS
+    pool.putconn(conn)
+    conn.rollback.assert_called()
+
+    conn.closed = 1
+    replacement = pool.getconn()
+    assert replacement is not conn
+    assert pool.stats()["replaced"] == 1
+
+    # The replacement holds the only slot, so the next checkout times out.
+    with pytest.raises(PoolTimeout):
+        pool.getconn()
+    assert pool.stats()["timeouts"] == 1
+
+
+def test_db_connection_commits_and_always_returns_connection(mocker):
+    from analyzer import dbCore
+    pool = MagicMock()
+    conn = pool.getconn.return_value
+    conn.closed = 0
+    mocker.patch('analyzer.dbCore.get_pool', return_value=pool)
+
+    with dbCore.db_connection() as borrowed:
+        assert borrowed is conn
+    conn.commit.assert_called_once()
+    pool.putconn.assert_called_once_with(conn)
+
+    with pytest.raises(RuntimeError):
+        with dbCore.db_connection():
+            raise RuntimeError("query failed")
+    conn.rollback.assert_called_once()
+    assert pool.putconn.call_count == 2
+
+
+def test_db_connection_yields_none_when_database_is_down(mocker):
+    from analyzer import dbCore
+    mocker.patch('analyzer.dbCore.get_pool', side_effect=psycopg2.OperationalError("refused"))
+    with dbCore.db_connection() as conn:
+        assert conn is None
@@ -0,0 +1,130 @@
+import json
+import pytest
+from unittest.mock import MagicMock
+from analyzer import dbLoader
+
+
+@pytest.fixture
+def snapshot(mocker, tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    jobs = [
+        {"title": "Dev\tOps", "company": "Google", "experience": "N/A",
+         "description": "line 1\nC:\\path", "link": "/job/1", "locations": ["תל אביב", "Haifa"]},
+        {"title": "QA", "company": "N/A", "experience": "1-2 שנים",
+         "description": "", "link": "/job/2", "locations": []},
+    ]
+    lines = [json.dumps(job, ensure_ascii=False) for job in jobs]
+    path.write_text("\n".join(lines[:1] + ["{broken"] + lines[1:]) + "\n", encoding="utf-8")
+    mocker.patch('analyzer.dbLoader.JSONL_OUTPUT_FILE', str(path))
+    mocker.patch('analyzer.dbLoader.JSONL_COMPRESSION', None)
+    return jobs
+
+
+@pytest.fixture
+def mock_conn(mocker):
+    conn = MagicMock()
+    conn.__enter__.return_value = conn
+    cursor = conn.cursor.return_value
+    cursor.rowcount = 2
+    copied = []
+    cursor.copy_expert.side_effect = lambda sql, stream: copied.append(stream.read(7) + stream.read())
+    mocker.patch('analyzer.dbLoader.db_connection', return_value=conn)
+    return conn, cursor, copied
+
+
+def test_bulk_load_streams_snapshot_through_copy(snapshot, mock_conn):
+    conn, cursor, copied = mock_conn
+
+    assert dbLoader.load_raw_data_to_db(mode="bulk") is True
+
+    rows = [line.split("\t") for line in copied[0].splitlines()]
+    assert len(rows) == 2
+    assert rows[0][:3] == ["Dev\\tOps", "line 1\\nC:\\\\path", "/job/1"]
+    assert json.loads(rows[0][5]) == ["תל אביב", "Haifa"]
+    assert rows[1][3:5] == ["N/A", "1-2 שנים"]
+
+    statements = [c.args[0] for c in cursor.execute.call_args_list]
+    assert not [sql for sql in statements if "VALUES" in sql]
+    assert len(statements) == 7
+    cursor.copy_expert.assert_called_once()
+    conn.commit.assert_called_once()
+
+
+def test_load_rejects_unknown_mode(snapshot):
+    with pytest.raises(ValueError):
+        dbLoader.load_raw_data_to_db(mode="fast")
+
+
+def test_rows_load_resolves_dimensions_per_batch(snapshot, mock_conn, mocker):
+    conn, cursor, _ = mock_conn
+    resolve = mocker.patch('analyzer.dbLoader.resolve_ids',
+                           side_effect=lambda cursor, table, prefix, names, cache=None: {
+                               name: index for index, name in enumerate(sorted(n for n in names if n))
+                           })
+    inserts = []
+    def fake_execute_values(cursor, sql, values, fetch=False):
+        inserts.append((sql, list(values)))
+        if fetch:
+            return [(job_id,) for job_id in range(1, len(values) + 1)]
+    mocker.patch('analyzer.dbLoader.execute_values', side_effect=fake_execute_values)
+
+    assert dbLoader.load_raw_data_to_db(mode="rows") is True
+
+    assert resolve.call_count == 3
+    job_rows = [values for sql, values in inserts if "INSERT INTO jobs" in sql]
+    assert [len(values) for values in job_rows] == [2]
+    location_links = [values for sql, values in inserts if "job_locations" in sql][0]
+    assert [job_id for job_id, _ in location_links] == [1, 1]
+    conn.commit.assert_called_once()
+
+
+def test_incremental_load_applies_delta_without_truncate(snapshot, mock_conn):
+    conn, cursor, copied = mock_conn
+    cursor.fetchone.return_value = (0,)
+
+    assert dbLoader.load_raw_data_to_db(mode="incremental") is True
+
+    statements = [c.args[0] for c in cursor.execute.call_args_list]
+    assert not [sql for sql in statements if "TRUNCATE" in sql or "DELETE FROM jobs" in sql]
+    assert any("UPDATE jobs SET closed_at = now()" in sql for sql in statements)
+    assert any("content_hash IS DISTINCT FROM" in sql for sql in statements)
+    assert "job_skills" not in "".join(statements)
+    assert len(copied[0].splitlines()) == 2
+    conn.commit.assert_called_once()
+
+
+def test_swap_records_the_staged_skill_dictionary_in_the_swap_transaction(mock_conn, mocker):
+    conn, cursor, _ = mock_conn
+    calls = MagicMock()
+    mocker.patch('analyzer.dbLoader.index_staging_tables')
+    calls.attach_mock(mocker.patch('analyzer.dbLoader.swap_staging_tables'), 'swap')
+    calls.attach_mock(mocker.patch('analyzer.dbLoader.write_skill_dictionary'), 'record')
+    calls.attach_mock(conn.commit, 'commit')
+
+    assert dbLoader.swap_in_staged_load({"python": ["py", "python"]}) is True
+
+    assert [name for name, _, _ in calls.mock_calls][-3:] == ["swap", "record", "commit"]
+    calls.record.assert_called_once_with(cursor, {"python": ["py", "python"]})
+
+
+def test_incremental_load_reports_postings_without_a_link(snapshot, mock_conn):
+    _, cursor, _ = mock_conn
+    cursor.fetchone.return_value = (3,)
+
+    with open(dbLoader.JSONL_OUTPUT_FILE, encoding="utf-8") as f_json:
+        counts = dbLoader.incremental_load_jobs(cursor, f_json)
+
+    assert counts["skipped"] == 3
+
+
+def test_delta_load_applies_the_delta_file_without_closing_jobs(snapshot, mock_conn, mocker):
+    _, cursor, _ = mock_conn
+    cursor.fetchone.return_value = (0,)
+    mocker.patch('analyzer.dbLoader.JSONL_DELTA_OUTPUT_FILE', dbLoader.JSONL_OUTPUT_FILE)
+
+    assert dbLoader.load_raw_data_to_db(mode="incremental", delta=True) is True
+    assert dbLoader.load_raw_data_to_db(mode="bulk", delta=True) is False
+
+    statements = [c.args[0] for c in cursor.execute.call_args_list]
+    assert any("content_hash IS DISTINCT FROM" in sql for sql in statements)
+    assert not any("SET closed_at = now()" in sql for sql in statements)
@@ -1,7 +1,8 @@
 import pytest
-import sqlite3
-from analyzer import dbQueries
-from analyzer.dbLoader import create_schema
+from contextlib import nullcontext
+from analyzer.sqliteBackend import connect_sqlite
+from analyzer import dbQueries, queryCache
+from analyzer.dbLoader import create_schema, refresh_dashboard_summaries
 
 @pytest.fixture(autouse=True)
 def clear_lru_caches():
@@ -13,12 +14,12 @@ def clear_lru_caches():
     dbQueries.get_skill_keywords_dict.cache_clear()
     dbQueries.get_level_hierarchy.cache_clear()
     dbQueries.get_all_canonical_profiles.cache_clear()
+    queryCache.clear_all()
 
 
 @pytest.fixture
 def mock_db(mocker):
-    conn = sqlite3.connect(":memory:")
-    conn.execute("PRAGMA foreign_keys = ON;")
+    conn = connect_sqlite(":memory:")
     cursor = conn.cursor()
     
     create_schema(cursor)
@@ -30,7 +31,7 @@ def mock_db(mocker):
     
     conn.commit()
     
-    mocker.patch('analyzer.db_queries.get_db_connection', return_value=conn)
+    mocker.patch('analyzer.dbQueries.db_connection', side_effect=lambda: nullcontext(conn))
     
     yield conn
     
@@ -117,4 +118,127 @@ def test_find_matching_jobs(mock_db):
         ('Python Dev', 25), 
         ('Full Stack', 25)
     }
-    assert set(remaining_results) == expected_set
\ No newline at end of file
+    assert set(remaining_results) == expected_set
+
+
+def test_dashboard_summary_reads_refreshed_aggregates(mock_db):
+    assert dbQueries.get_dashboard_summary(top_n=2) == {}
+
+    cursor = mock_db.cursor()
+    cursor.executemany("INSERT INTO jobs (job_id, title, level_id, company_id) VALUES (?, ?, ?, ?)", [
+        (1, 'Job 1', 1, 1),
+        (2, 'Job 2', 3, 2),
+        (3, 'Job 3', 3, 1),
+        (4, 'Job 4', 3, 1),
+    ])
+    cursor.execute("UPDATE jobs SET closed_at = CURRENT_TIMESTAMP WHERE job_id = 4")
+    mock_db.commit()
+    dbQueries.save_processed_skills({1: ['python', 'sql'], 2: ['python'], 3: ['python', 'aws', 'sql']})
+
+    refresh_dashboard_summaries(cursor)
+    mock_db.commit()
+    queryCache.clear_all()
+
+    summary = dbQueries.get_dashboard_summary(top_n=2)
+
+    assert summary["skills"] == [('python', 3, 100.0), ('sql', 2, 66.7)]
+    assert summary["levels"] == [{'name': 'Senior', 'count': 2}, {'name': 'Junior', 'count': 1}]
+
+
+@pytest.fixture
+def searchable_jobs(mock_db):
+    cursor = mock_db.cursor()
+    cursor.executemany("INSERT INTO jobs (job_id, title, description, level_id, company_id) VALUES (?, ?, ?, ?, ?)", [
+        (1, 'Senior Backend Developer', 'Python and Postgres', 3, 1),
+        (2, 'QA Automation Engineer', 'Selenium, some Python', 2, 2),
+        (3, 'מפתח/ת Backend', 'Go ו-Kubernetes', 2, 3),
+        (4, 'Data Analyst', 'SQL dashboards', 1, 1),
+    ])
+    mock_db.commit()
+    dbQueries.save_processed_skills({1: ['python', 'sql'], 2: ['python', 'selenium'], 3: ['go'], 4: ['sql']})
+    return mock_db
+
+
+def test_popular_skills_for_profile_matches_title_then_keywords(searchable_jobs):
+    assert sorted(dbQueries.get_popular_skills_for_profile("backend developer")) == ['python', 'sql']
+    assert sorted(dbQueries.get_popular_skills_for_profile("backend engineer")) == ['go', 'python', 'selenium', 'sql']
+    assert dbQueries.get_popular_skills_for_profile("c++ wizard") == []
+
+
+def test_search_jobs_ranks_title_hits_first_and_paginates(searchable_jobs):
+    found = dbQueries.search_jobs("python", limit=10, offset=0)
+    assert found["total"] == 2
+    assert [job["job_id"] for job in found["results"]] == [2, 1]
+
+    found = dbQueries.search_jobs("backend", limit=1, offset=1)
+    assert found["total"] == 2
+    assert [job["job_id"] for job in found["results"]] == [1]
+    assert found["results"][0]["company"] == 'Google'
+
+
+def _links(conn):
+    rows = conn.cursor().execute(
+        "SELECT js.job_id, s.skill_name FROM job_skills js JOIN skills s ON s.skill_id = js.skill_id").fetchall()
+    return sorted(tuple(row) for row in rows)
+
+
+def test_incremental_save_applies_a_diff_and_tracks_description_hashes(mock_db):
+    cursor = mock_db.cursor()
+    cursor.executemany("INSERT INTO jobs (job_id, title, description, level_id, company_id) VALUES (?, ?, ?, ?, ?)", [
+        (1, 'Job 1', 'python, sql', 1, 1),
+        (2, 'Job 2', 'go', 2, 2),
+    ])
+    mock_db.commit()
+    assert [job_id for job_id, _ in dbQueries.get_jobs_to_process(pending_only=True)] == [1, 2]
+
+    dbQueries.save_processed_skills({1: ['python', 'sql'], 2: ['go']})
+    assert dbQueries.get_jobs_to_process(pending_only=True) == []
+
+    cursor.execute("UPDATE jobs SET description = 'python, aws' WHERE job_id = 1")
+    mock_db.commit()
+    assert dbQueries.get_jobs_to_process(pending_only=True) == [(1, 'python, aws')]
+
+    dbQueries.save_processed_skills({1: ['python', 'aws']}, replace_all=False)
+    assert _links(mock_db) == [(1, 'aws'), (1, 'python'), (2, 'go')]
+    assert dbQueries.get_jobs_to_process(pending_only=True) == []
+
+    dbQueries.save_processed_skills({1: [], 2: ['python']}, replace_all=False, only_skills={'python'})
+    assert _links(mock_db) == [(1, 'aws'), (2, 'go'), (2, 'python')]
+
+
+def test_retag_candidates_come_from_added_terms_and_shrunk_skills(searchable_jobs):
+    candidates = dbQueries.get_retag_candidates({'selenium', 'KUBERNETES'}, set())
+    assert [job_id for job_id, _ in candidates] == [2, 3]
+
+    candidates = dbQueries.get_retag_candidates({'postgres'}, {'sql'})
+    assert [job_id for job_id, _ in candidates] == [1, 4]
+    assert dbQueries.get_retag_candidates(set(), set()) == []
+
+
+def test_skill_dictionary_round_trips(mock_db):
+    entries = {'c#': ['#c', '.net', 'c#'], 'hebrew': ['עברית']}
+    assert dbQueries.save_skill_dictionary(entries) is True
+    assert dbQueries.get_skill_dictionary() == entries
+
+
+def test_jobs_to_process_stream_in_batches_and_are_written_as_they_go(mock_db):
+    cursor = mock_db.cursor()
+    cursor.executemany("INSERT INTO jobs (job_id, title, description, closed_at) VALUES (?, ?, ?, ?)", [
+        (1, 'Job 1', 'python', None), (2, 'Job 2', 'go', None), (3, 'Job 3', 'sql', None),
+        (4, 'Closed', 'perl', '2024-01-01'), (5, 'Job 5', 'aws', None),
+    ])
+    mock_db.commit()
+    dbQueries.save_processed_skills({1: ['perl']})
+
+    batches = list(dbQueries.iter_jobs_to_process(batch_size=2))
+    assert [[job_id for job_id, _ in batch] for batch in batches] == [[1, 2], [3, 5]]
+
+    with dbQueries.skill_link_writer() as write:
+        for batch in dbQueries.iter_jobs_to_process(batch_size=2):
+            write({job_id: [description] for job_id, description in batch})
+
+    links = cursor.execute(
+        "SELECT js.job_id, s.skill_name FROM job_skills js JOIN skills s ON s.skill_id = js.skill_id "
+        "ORDER BY js.job_id").fetchall()
+    assert links == [(1, 'python'), (2, 'go'), (3, 'sql'), (5, 'aws')]
+    assert list(dbQueries.iter_jobs_to_process(pending_only=True)) == []
@@ -0,0 +1,98 @@
+import pytest
+from analyzer import queryCache, dbCore, dbLoader
+from analyzer.queryCache import QueryCache, cached_query
+
+
+@pytest.fixture(autouse=True)
+def reset_generation(monkeypatch):
+    monkeypatch.setattr(queryCache, "_generation", 0)
+    yield
+    queryCache.clear_all()
+
+
+def test_cached_query_counts_hits_and_misses_and_freezes_list_args():
+    calls = []
+
+    @cached_query(maxsize=8, ttl=60)
+    def query(names, limit=10):
+        calls.append((names, limit))
+        return [len(names), limit]
+
+    assert query(["a", "b"], limit=5) == [2, 5]
+    assert query(["a", "b"], limit=5) == [2, 5]
+    assert query(["a"], limit=5) == [1, 5]
+
+    assert len(calls) == 2
+    info = query.cache_info()
+    assert info["hits"] == 1
+    assert info["misses"] == 2
+    assert info["size"] == 2
+
+
+def test_bumping_the_generation_invalidates_cached_results():
+    results = iter([["old"], ["new"]])
+
+    @cached_query(maxsize=8, ttl=None)
+    def query():
+        return next(results)
+
+    assert query() == ["old"]
+    assert query() == ["old"]
+
+    assert queryCache.set_generation(1) is True
+    assert queryCache.set_generation(1) is False
+    assert query() == ["new"]
+
+
+def test_a_reset_generation_also_invalidates_cached_results():
+    results = iter([["before reset"], ["after reset"]])
+
+    @cached_query(maxsize=8, ttl=None)
+    def query():
+        return next(results)
+
+    queryCache.set_generation(7)
+    assert query() == ["before reset"]
+
+    assert queryCache.set_generation(1) is True
+    assert query() == ["after reset"]
+
+
+def test_empty_results_are_not_cached():
+    calls = []
+
+    @cached_query(maxsize=8, ttl=60)
+    def query():
+        calls.append(1)
+        return []
+
+    query()
+    query()
+    assert len(calls) == 2
+
+
+def test_query_cache_evicts_least_recently_used_and_expired_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(queryCache.time, "monotonic", lambda: now[0])
+    cache = QueryCache(maxsize=2, ttl=10)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == (True, 1)
+    cache.set("c", 3)
+    assert cache.get("b") == (False, None)
+
+    now[0] += 11
+    assert cache.get("a") == (False, None)
+    assert cache.stats()["evictions"] == 2
+
+
+def test_bump_data_generation_persists_and_moves_the_cache(mocker, tmp_path):
+    mocker.patch('analyzer.dbCore.DB_BACKEND', "sqlite")
+    mocker.patch('analyzer.dbCore.DB_FILE_PATH', str(tmp_path / "jobs.db"))
+    with dbCore.db_connection() as conn:
+        dbLoader.create_schema(conn.cursor())
+
+    assert dbLoader.bump_data_generation() == 1
+    assert dbLoader.bump_data_generation() == 2
+    assert queryCache.current_generation() == 2
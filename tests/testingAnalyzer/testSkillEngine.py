@@ -0,0 +1,64 @@
+import json
+import pytest
+from pathlib import Path
+from analyzer import skillProcessor
+from analyzer.skillEngine import SkillEngine
+
+JOBS_DATA = Path(__file__).resolve().parents[2] / "jobs_data.jsonl"
+
+KEYWORDS = {
+    "c": ["c"],
+    "c++": ["c++", "cpp"],
+    "c#": ["c#", "c-sharp", ".net", "asp.net"],
+    "react": ["react"],
+    "react native": ["react native"],
+    "node.js": ["node", "node.js", "nodejs"],
+    "ci/cd": ["ci/cd, cicd"],
+    "hebrew": ["עברית"],
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_engine_caches():
+    yield
+    skillProcessor._load_skill_keywords.cache_clear()
+    skillProcessor._get_compiled_skill_engine.cache_clear()
+    skillProcessor._get_skill_engine.cache_clear()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("C, C++ and C#", {"c", "c++", "c#"}),
+    ("c++ only", {"c++"}),
+    ("#c and c+", set()),
+    ("objective-c developer", {"c"}),
+    ("React Native apps", {"react", "react native"}),
+    ("react-native", set()),
+    ("node.jsx and Node.js", {"node.js"}),
+    ("ASP.NET MVC", {"c#"}),
+    ("asp.netcore", set()),
+    ("CI/CD pipelines, cicd", {"ci/cd"}),
+    ("דובר/ת עברית ואנגלית", {"hebrew"}),
+    ("", set()),
+])
+def test_boundary_rules(text, expected):
+    assert SkillEngine(KEYWORDS).extract(text) == expected
+
+
+def test_matches_the_per_pattern_engine(mocker):
+    mocker.patch('analyzer.skillProcessor._load_skill_keywords', return_value=KEYWORDS)
+    engine = SkillEngine(KEYWORDS)
+    for text in ["c-sharp, -c, c#-c", "_c c_ c.", "React-Native or react native.", "nodejs/node"]:
+        assert engine.extract(text) == skillProcessor.extract_skills_per_pattern(text)
+
+
+@pytest.mark.skipif(not JOBS_DATA.exists(), reason="jobs_data.jsonl snapshot not present")
+def test_same_skills_as_per_pattern_engine_on_job_snapshot():
+    engine = skillProcessor._get_skill_engine()
+    with open(JOBS_DATA, encoding="utf-8") as f:
+        descriptions = [json.loads(line).get("description") for line in f]
+
+    mismatches = [
+        index for index, description in enumerate(descriptions)
+        if engine.extract(description) != skillProcessor.extract_skills_per_pattern(description)
+    ]
+    assert mismatches == []
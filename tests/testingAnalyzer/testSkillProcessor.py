@@ -1,5 +1,6 @@
 import pytest
-from analyzer.skillProcessor import extract_skills_from_text, _load_skill_keywords, _get_compiled_skill_engine
+from contextlib import contextmanager
+from analyzer.skillProcessor import extract_skills_from_text, _load_skill_keywords, _get_compiled_skill_engine, _get_skill_engine
 
 
 @pytest.fixture
@@ -23,6 +24,26 @@ def mock_file_loading(mocker, fake_skill_keywords):
 
     _load_skill_keywords.cache_clear()
     _get_compiled_skill_engine.cache_clear()
+    _get_skill_engine.cache_clear()
+
+
+def stream_jobs(mocker, jobs):
+    """
+    Serves `jobs` through iter_jobs_to_process in batches of the requested size and collects
+    every batch handed to the skill_link_writer. Returns (iter mock, writer mock, written batches).
+    """
+    written = []
+
+    @contextmanager
+    def writer(**kwargs):
+        yield written.append
+
+    iter_jobs = mocker.patch(
+        'analyzer.skillProcessor.dbQueries.iter_jobs_to_process',
+        side_effect=lambda pending_only, jobs_table, batch_size: iter(
+            [jobs[start:start + batch_size] for start in range(0, len(jobs), batch_size)]))
+    link_writer = mocker.patch('analyzer.skillProcessor.dbQueries.skill_link_writer', side_effect=writer)
+    return iter_jobs, link_writer, written
 
 
 def test_extract_skills_basic():
@@ -61,3 +82,137 @@ def test_extract_skills_empty_input():
     job_id = 5
     _id, skills = extract_skills_from_text(job_id, text)
     assert len(skills) == 0
+
+
+def test_run_skill_processor_incremental_only_retags_pending_jobs(mocker):
+    from analyzer import skillProcessor
+    iter_jobs, link_writer, written = stream_jobs(mocker, [(7, "python and docker")])
+    mocker.patch('analyzer.skillProcessor.dbQueries.get_skill_dictionary',
+                 return_value=skillProcessor.current_dictionary_entries())
+    save_dictionary = mocker.patch('analyzer.skillProcessor.dbQueries.save_skill_dictionary')
+
+    skillProcessor.run_skill_processor(incremental=True)
+
+    iter_jobs.assert_called_once_with(pending_only=True, jobs_table="jobs", batch_size=500)
+    results, = written
+    assert sorted(results[7]) == ["docker", "python"]
+    assert link_writer.call_args.kwargs == {
+        "replace_all": False, "jobs_table": "jobs", "skills_table": "job_skills",
+    }
+    save_dictionary.assert_not_called()
+
+
+def test_run_skill_processor_incremental_with_nothing_pending_is_up_to_date(mocker):
+    from analyzer import skillProcessor
+    stream_jobs(mocker, [])
+    mocker.patch('analyzer.skillProcessor.dbQueries.get_skill_dictionary',
+                 return_value=skillProcessor.current_dictionary_entries())
+
+    assert skillProcessor.run_skill_processor(incremental=True) is True
+
+    mocker.patch('analyzer.skillProcessor.dbQueries.skill_link_writer', side_effect=RuntimeError("no DB"))
+    assert skillProcessor.run_skill_processor(incremental=True) is False
+
+
+def test_run_skill_processor_incremental_rescans_only_changed_dictionary_entries(mocker, fake_skill_keywords):
+    from analyzer import skillProcessor
+    applied = skillProcessor.dictionary_entries(dict(fake_skill_keywords, python=["python"]))
+    mocker.patch('analyzer.skillProcessor.dbQueries.get_skill_dictionary', return_value=applied)
+    _, _, written = stream_jobs(mocker, [(1, "new posting: python")])
+    candidates = mocker.patch('analyzer.skillProcessor.dbQueries.get_retag_candidates',
+                              return_value=[(1, "new posting: python"), (2, "py and docker"), (3, "copy")])
+    save = mocker.patch('analyzer.skillProcessor.dbQueries.save_processed_skills', return_value=True)
+    save_dictionary = mocker.patch('analyzer.skillProcessor.dbQueries.save_skill_dictionary')
+
+    assert skillProcessor.run_skill_processor(incremental=True) is True
+
+    candidates.assert_called_once_with({"py"}, set(), "jobs", "job_skills")
+    assert written == [{1: ["python"]}]
+    rescan_call, = save.call_args_list
+    assert rescan_call.args[0] == {2: ["python"], 3: []}
+    assert rescan_call.kwargs["only_skills"] == {"python"}
+    save_dictionary.assert_called_once_with(skillProcessor.current_dictionary_entries())
+
+
+def test_diff_dictionaries_reports_added_and_removed_synonyms():
+    from analyzer.skillProcessor import diff_dictionaries
+    old = {"python": ["py", "python"], "go": ["go", "golang"], "perl": ["perl"]}
+    new = {"python": ["python", "python3"], "go": ["go", "golang"], "rust": ["rust"]}
+
+    assert diff_dictionaries(old, new) == {
+        "python": ({"python3"}, {"py"}),
+        "perl": (set(), {"perl"}),
+        "rust": ({"rust"}, set()),
+    }
+
+
+def test_retag_changed_skills_only_touches_affected_skills(mocker, fake_skill_keywords):
+    from analyzer import skillProcessor
+    applied = skillProcessor.dictionary_entries(dict(fake_skill_keywords, docker=["docker", "moby"]))
+    mocker.patch('analyzer.skillProcessor.dbQueries.get_skill_dictionary', return_value=applied)
+    candidates = mocker.patch('analyzer.skillProcessor.dbQueries.get_retag_candidates',
+                              return_value=[(4, "moby and docker"), (5, "moby only")])
+    save = mocker.patch('analyzer.skillProcessor.dbQueries.save_processed_skills', return_value=True)
+    save_dictionary = mocker.patch('analyzer.skillProcessor.dbQueries.save_skill_dictionary')
+
+    assert skillProcessor.retag_changed_skills() is True
+
+    candidates.assert_called_once_with(set(), {"docker"}, "jobs", "job_skills")
+    results, = save.call_args.args
+    assert results == {4: ["docker"], 5: []}
+    assert save.call_args.kwargs["only_skills"] == {"docker"}
+    save_dictionary.assert_called_once()
+
+
+def test_run_skill_processor_scans_chunks_in_a_process_pool(mocker):
+    from analyzer import skillProcessor
+    jobs = [(1, "python"), (2, "docker and c#"), (3, "c and c++"), (4, ""), (5, "React, py")]
+    iter_jobs, link_writer, written = stream_jobs(mocker, jobs)
+    mocker.patch('analyzer.skillProcessor.dbQueries.save_skill_dictionary')
+
+    assert skillProcessor.run_skill_processor(executor="process", workers=2, chunk_size=2) is True
+
+    iter_jobs.assert_called_once_with(pending_only=False, jobs_table="jobs", batch_size=2)
+    assert link_writer.call_args.kwargs["replace_all"] is True
+    # Each streamed batch is written on its own, in order.
+    assert [list(batch) for batch in written] == [[1, 2], [3, 4], [5]]
+    results = {job_id: sorted(skills) for batch in written for job_id, skills in batch.items()}
+    assert results == {
+        1: ["python"], 2: ["c#", "docker"], 3: ["c", "c++"], 4: [], 5: ["python", "react"],
+    }
+
+
+def test_run_skill_processor_saves_nothing_when_the_stream_fails(mocker):
+    from analyzer import skillProcessor
+
+    def failing_stream(pending_only, jobs_table, batch_size):
+        yield [(1, "python")]
+        raise RuntimeError("connection lost")
+
+    iter_jobs, link_writer, _ = stream_jobs(mocker, [])
+    iter_jobs.side_effect = failing_stream
+    save_dictionary = mocker.patch('analyzer.skillProcessor.dbQueries.save_skill_dictionary')
+
+    assert skillProcessor.run_skill_processor(staging=True) is False
+
+    assert link_writer.call_args.kwargs["skills_table"] == "job_skills_staging"
+    save_dictionary.assert_not_called()
+
+
+def test_run_skill_processor_rejects_unknown_executor():
+    from analyzer import skillProcessor
+    with pytest.raises(ValueError):
+        skillProcessor.run_skill_processor(executor="gpu")
+
+
+def test_run_skill_processor_saves_nothing_when_a_chunk_fails(mocker):
+    from analyzer import skillProcessor
+    jobs = [(1, "python"), (2, "docker"), (3, "react")]
+    _, _, written = stream_jobs(mocker, jobs)
+    mocker.patch('analyzer.skillProcessor.SkillEngine.extract', side_effect=[{"python"}, RuntimeError("bad text")])
+    save_dictionary = mocker.patch('analyzer.skillProcessor.dbQueries.save_skill_dictionary')
+
+    assert skillProcessor.run_skill_processor(executor="thread", chunk_size=2) is False
+
+    assert written == []
+    save_dictionary.assert_not_called()
@@ -0,0 +1,97 @@
+import json
+import pytest
+import psycopg2
+from analyzer import dbCore, dbLoader, dbQueries
+from analyzer.sqliteBackend import connect_sqlite, translate_sql
+
+
+@pytest.fixture
+def sqlite_backend(mocker, tmp_path):
+    db_file = str(tmp_path / "jobs.db")
+    mocker.patch('analyzer.dbCore.DB_BACKEND', "sqlite")
+    mocker.patch('analyzer.dbCore.DB_FILE_PATH', db_file)
+    with dbCore.db_connection() as conn:
+        dbLoader.create_schema(conn.cursor())
+    return db_file
+
+
+def test_translate_sql_binds_lists_as_json():
+    sql, params = translate_sql(
+        "DELETE FROM job_skills WHERE job_id = ANY(%s) AND skill_id = %s", ([1, 2], 7))
+    assert sql == "DELETE FROM job_skills WHERE job_id IN (SELECT value FROM json_each(?)) AND skill_id = ?"
+    assert params == ["[1, 2]", 7]
+
+    sql, params = translate_sql("INSERT INTO skills (skill_name) SELECT unnest(%s::text[]) ON CONFLICT DO NOTHING", (["a"],))
+    assert "SELECT value FROM json_each(?) WHERE true ON CONFLICT" in sql
+
+
+def test_connection_commits_rolls_back_and_speaks_postgres(tmp_path):
+    conn = connect_sqlite(str(tmp_path / "raw.db"))
+    try:
+        with conn:
+            cursor = conn.cursor()
+            cursor.execute("CREATE TABLE parents (id INTEGER PRIMARY KEY)")
+            cursor.execute("CREATE TABLE children (parent_id INTEGER REFERENCES parents (id))")
+            cursor.execute("INSERT INTO parents (id) VALUES (%s)", (1,))
+
+        with pytest.raises(psycopg2.Error):
+            with conn:
+                conn.cursor().execute("INSERT INTO parents (id) VALUES (%s)", (2,))
+                conn.cursor().execute("INSERT INTO children (parent_id) VALUES (%s)", (99,))
+
+        cursor = conn.cursor()
+        assert cursor.execute("SELECT id FROM parents").fetchall() == [(1,)]
+        cursor.execute("SELECT md5('abc'), 'Senior Python Dev' ~* %s", (r"\bpython\b",))
+        assert cursor.fetchone() == ("900150983cd24fb0d6963f7d28e17f72", 1)
+    finally:
+        conn.close()
+    assert conn.closed
+
+
+def test_connect_sqlite_reports_unopenable_files_as_psycopg2_errors(tmp_path):
+    with pytest.raises(psycopg2.Error):
+        connect_sqlite(str(tmp_path / "missing_dir" / "jobs.db"))
+
+
+def test_schema_is_idempotent_and_uses_wal(sqlite_backend):
+    with dbCore.db_connection() as conn:
+        cursor = conn.cursor()
+        dbLoader.create_schema(cursor)
+        assert cursor.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(jobs)").fetchall()}
+    assert {"content_hash", "first_seen", "last_seen", "closed_at"} <= columns
+
+
+def test_errors_surface_as_psycopg2_errors(sqlite_backend):
+    with pytest.raises(psycopg2.Error):
+        with dbCore.db_connection() as conn:
+            conn.cursor().execute("SELECT * FROM no_such_table")
+
+
+def test_etl_and_queries_run_on_sqlite(sqlite_backend, mocker, tmp_path):
+    snapshot = tmp_path / "jobs.jsonl"
+    jobs = [
+        {"title": "Python Dev", "company": "Google", "experience": "Mid", "description": "python sql",
+         "link": "/1", "locations": ["Haifa"]},
+        {"title": "QA", "company": "TestCo", "experience": "Junior", "description": "python",
+         "link": "/2", "locations": []},
+    ]
+    snapshot.write_text("\n".join(json.dumps(job) for job in jobs) + "\n", encoding="utf-8")
+    mocker.patch('analyzer.dbLoader.JSONL_OUTPUT_FILE', str(snapshot))
+    mocker.patch('analyzer.dbLoader.JSONL_COMPRESSION', None)
+
+    assert dbLoader.load_raw_data_to_db(mode="bulk") is True
+    assert dbLoader.load_raw_data_to_db(mode="rows") is True
+
+    job_rows = dbQueries.get_jobs_to_process()
+    assert sorted(desc for _, desc in job_rows) == ["python", "python sql"]
+    ids = {desc: job_id for job_id, desc in job_rows}
+    assert dbQueries.save_processed_skills({ids["python sql"]: ["python", "sql"], ids["python"]: ["python"]})
+
+    assert dbQueries.get_skill_popularity_percentages(top_n=1) == [("python", 2, 100.0)]
+    levels = dbQueries.get_experience_level_distribution()
+    assert sorted(levels, key=lambda row: row["name"]) == [
+        {"name": "Junior", "count": 1}, {"name": "Mid", "count": 1}
+    ]
+    matches = dbQueries.find_matching_jobs(["sql"], ["Mid"], "Mid")
+    assert [(job["title"], job["match_percentage"]) for job in matches] == [("Python Dev", 50)]
@@ -0,0 +1,41 @@
+from unittest.mock import MagicMock
+from analyzer import stagingTables
+
+
+def _statements(cursor):
+    return [c.args[0] for c in cursor.execute.call_args_list]
+
+
+def test_staging_tables_are_created_without_indexes():
+    cursor = MagicMock()
+    stagingTables.create_staging_tables(cursor)
+
+    statements = _statements(cursor)
+    assert "CREATE TABLE jobs_staging (LIKE jobs INCLUDING DEFAULTS INCLUDING GENERATED);" in statements
+    assert not [sql for sql in statements if "INDEX" in sql or "PRIMARY KEY" in sql]
+
+
+def test_indexes_are_built_before_foreign_keys():
+    cursor = MagicMock()
+    stagingTables.index_staging_tables(cursor)
+
+    statements = _statements(cursor)
+    pkey = statements.index("ALTER TABLE jobs_staging ADD CONSTRAINT jobs_pkey_staging PRIMARY KEY (job_id);")
+    fkey = next(i for i, sql in enumerate(statements) if "job_skills_job_id_fkey" in sql)
+    assert pkey < fkey
+    assert "CREATE INDEX idx_jobs_link_staging ON jobs_staging (link);" in statements
+
+
+def test_swap_hands_over_sequence_then_renames():
+    cursor = MagicMock()
+    cursor.fetchone.return_value = ("public.jobs_job_id_seq",)
+
+    stagingTables.swap_staging_tables(cursor)
+
+    statements = _statements(cursor)
+    assert statements[0].startswith("LOCK TABLE jobs, job_locations, job_skills")
+    owned = statements.index("ALTER SEQUENCE public.jobs_job_id_seq OWNED BY jobs_staging.job_id;")
+    drop = statements.index("DROP TABLE job_skills, job_locations, jobs;")
+    rename = statements.index("ALTER TABLE jobs_staging RENAME TO jobs;")
+    assert owned < drop < rename
+    assert "ALTER INDEX jobs_pkey_staging RENAME TO jobs_pkey;" in statements
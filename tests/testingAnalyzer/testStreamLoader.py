@@ -0,0 +1,71 @@
+import pytest
+from unittest.mock import MagicMock
+from analyzer.streamLoader import StreamingDbLoader
+
+
+@pytest.fixture
+def mock_db(mocker):
+    conn = MagicMock()
+    cursor = conn.cursor.return_value
+    mocker.patch('analyzer.streamLoader.get_db_connection', return_value=conn)
+
+    ids = {}
+    def fake_resolve_ids(cursor, table, prefix, names, cache=None):
+        return {
+            name: ids.setdefault((table, name), len(ids) + 1)
+            for name in names if name and name != "N/A"
+        }
+    mocker.patch('analyzer.streamLoader.resolve_ids', side_effect=fake_resolve_ids)
+
+    next_job_id = iter(range(100, 200))
+    def fake_execute_values(cursor, sql, values, fetch=False):
+        fake_execute_values.calls.append((sql, list(values)))
+        if fetch:
+            return [(next(next_job_id),) for _ in values]
+    fake_execute_values.calls = []
+    mocker.patch('analyzer.streamLoader.execute_values', side_effect=fake_execute_values)
+    mocker.patch('analyzer.streamLoader.write_skill_dictionary')
+    mocker.patch('analyzer.streamLoader.extract_skills_from_text',
+                 side_effect=lambda job_id, text: (job_id, ["python"] if "python" in text else []))
+
+    return conn, cursor, fake_execute_values.calls
+
+
+def _job(title, description, locations):
+    return {"title": title, "company": "Google", "experience": "1-2 שנים",
+            "description": description, "link": f"/job/{title}", "locations": locations}
+
+
+def test_stream_loader_flushes_in_batches_and_commits(mock_db):
+    conn, cursor, calls = mock_db
+
+    with StreamingDbLoader(batch_size=2) as loader:
+        loader.write_rows([_job("a", "python dev", ["Tel Aviv"]), _job("b", "java", [])])
+        loader.write_rows([_job("c", "python", ["Haifa"])])
+
+    cursor.execute.assert_any_call("DELETE FROM jobs;")
+    job_inserts = [values for sql, values in calls if sql.startswith("INSERT INTO jobs")]
+    assert [len(v) for v in job_inserts] == [2, 1]
+
+    skill_links = [link for sql, values in calls if "job_skills" in sql for link in values]
+    assert [job_id for job_id, _ in skill_links] == [100, 102]
+
+    location_links = [link for sql, values in calls if "job_locations" in sql for link in values]
+    assert [job_id for job_id, _ in location_links] == [100, 102]
+
+    conn.commit.assert_called_once()
+    conn.close.assert_called_once()
+    assert loader.jobs_loaded == 3
+
+
+def test_stream_loader_rolls_back_on_error(mock_db):
+    conn, cursor, calls = mock_db
+
+    with pytest.raises(RuntimeError):
+        with StreamingDbLoader(batch_size=10) as loader:
+            loader.write_rows([_job("a", "python", [])])
+            raise RuntimeError("scrape crashed")
+
+    conn.rollback.assert_called_once()
+    conn.commit.assert_not_called()
+    assert not [sql for sql, _ in calls if sql.startswith("INSERT INTO jobs")]
@@ -1,7 +1,8 @@
 import pytest
 import requests
 from unittest.mock import MagicMock
-from jobScraper.api import ApiClient
+from jobScraper.api import ApiClient, MultiQueryClient
+from jobScraper.rateLimit import RateLimiter
 from jobSearchConfig import BASE_URL, MAIN_CATEGORIES, build_api_params
 
 
@@ -73,3 +74,114 @@ def test_fetch_page_retries_on_timeout_then_succeeds(mocker, api_client):
     data = api_client.fetch_page(1, retries=3)
 
     assert data == {"TotalPagesNumber": 10}
+
+
+@pytest.fixture
+def cached_api_client(tmp_path):
+    from jobScraper.responseCache import ResponseCache
+    mock_search_config = {
+        "main_category": "hitech_software",
+        "roles": ["backend"],
+        "experience": "all",
+        "keyword": None
+    }
+    return ApiClient(mock_search_config, cache=ResponseCache(str(tmp_path), ttl=60))
+
+
+def test_fetch_page_served_from_cache(mocker, cached_api_client):
+    fake_response = MagicMock()
+    fake_response.status_code = 200
+    fake_response.json.return_value = {"TotalPagesNumber": 10}
+    fake_response.headers = {}
+
+    mock_get = mocker.patch('requests.get', return_value=fake_response)
+
+    assert cached_api_client.fetch_page(1) == {"TotalPagesNumber": 10}
+    assert cached_api_client.fetch_page(1) == {"TotalPagesNumber": 10}
+    assert mock_get.call_count == 1
+
+
+def test_fetch_page_revalidates_stale_entry(mocker, cached_api_client):
+    first_response = MagicMock()
+    first_response.status_code = 200
+    first_response.json.return_value = {"TotalPagesNumber": 10}
+    first_response.headers = {'ETag': '"v1"'}
+
+    not_modified = MagicMock()
+    not_modified.status_code = 304
+
+    mock_get = mocker.patch('requests.get', side_effect=[first_response, not_modified])
+    cached_api_client.fetch_page(1)
+
+    cached_api_client.cache.ttl = 0
+    data = cached_api_client.fetch_page(1)
+
+    assert data == {"TotalPagesNumber": 10}
+    assert mock_get.call_args.kwargs['headers']['If-None-Match'] == '"v1"'
+
+
+def test_fetch_page_replay_mode_never_hits_network(mocker, cached_api_client):
+    mock_get = mocker.patch('requests.get')
+    cached_api_client.cache.mode = "replay"
+
+    assert cached_api_client.fetch_page(1) is None
+    mock_get.assert_not_called()
+
+
+def test_fetch_page_retries_429_with_retry_after(mocker, api_client):
+    throttled = MagicMock()
+    throttled.status_code = 429
+    throttled.headers = {'Retry-After': '2'}
+
+    success_response = MagicMock()
+    success_response.status_code = 200
+    success_response.json.return_value = {"TotalPagesNumber": 10}
+
+    mocker.patch('requests.get', side_effect=[throttled, success_response])
+    sleep = mocker.patch('time.sleep')
+    mocker.patch.object(api_client.rate_limiter.breaker, 'wait_if_open')
+
+    data = api_client.fetch_page(1, retries=3)
+
+    assert data == {"TotalPagesNumber": 10}
+    assert api_client.rate_limiter.breaker.open_until > 0
+    assert sleep.call_args_list[-1].args[0] >= 2
+    assert api_client.rate_limiter.stats.throttled == 1
+    assert api_client.rate_limiter.stats.retries == 1
+
+
+def test_fetch_page_counts_lost_page_after_server_errors(mocker, api_client):
+    server_error = MagicMock()
+    server_error.status_code = 503
+    server_error.headers = {}
+
+    mocker.patch('requests.get', return_value=server_error)
+    mocker.patch('time.sleep')
+
+    assert api_client.fetch_page(4, retries=2) is None
+    assert api_client.rate_limiter.stats.server_errors == 2
+    assert api_client.rate_limiter.stats.lost_pages == [4]
+
+
+def test_multi_query_client_reports_lost_pages_per_query(mocker):
+    server_error = MagicMock()
+    server_error.status_code = 503
+    server_error.headers = {}
+    mocker.patch('requests.get', return_value=server_error)
+    mocker.patch('time.sleep')
+
+    rate_limiter = RateLimiter()
+    mocker.patch.object(rate_limiter.breaker, 'wait_if_open')
+    configs = [
+        {"main_category": "hitech_software", "roles": [role], "experience": "all", "keyword": None}
+        for role in ("backend", "devops")
+    ]
+    client = MultiQueryClient([
+        ApiClient(config, rate_limiter=rate_limiter, query_index=query_index)
+        for query_index, config in enumerate(configs)
+    ])
+
+    assert client.fetch_page((1, 3)) is None
+    assert client.fetch_page((0, 3)) is None
+    assert rate_limiter.stats.lost_pages == [(1, 3), (0, 3)]
+    assert "2 pages lost: [(0, 3), (1, 3)]" in rate_limiter.stats.summary()
@@ -0,0 +1,93 @@
+from unittest.mock import MagicMock
+from jobScraper.asyncEngine import AdaptiveConcurrencyLimiter, fetch_pages_async
+
+
+def test_limiter_grows_when_latency_is_stable():
+    limiter = AdaptiveConcurrencyLimiter(initial=2, maximum=10)
+
+    for _ in range(2):
+        limiter.record(0.1, ok=True)
+
+    assert limiter.limit == 3
+
+
+def test_limiter_halves_on_errors():
+    limiter = AdaptiveConcurrencyLimiter(initial=8, maximum=10)
+
+    for _ in range(6):
+        limiter.record(0.1, ok=True)
+    for _ in range(2):
+        limiter.record(0.1, ok=False)
+
+    assert limiter.limit == 4
+
+
+def test_limiter_halves_on_latency_spike():
+    limiter = AdaptiveConcurrencyLimiter(initial=2, maximum=10, latency_tolerance=2.0)
+
+    limiter.record(0.1, ok=True)
+    limiter.record(0.1, ok=True)
+    assert limiter.limit == 3
+
+    for _ in range(3):
+        limiter.record(1.0, ok=True)
+
+    assert limiter.limit == 1
+
+
+def test_limiter_respects_bounds():
+    limiter = AdaptiveConcurrencyLimiter(initial=50, minimum=2, maximum=5)
+    assert limiter.limit == 5
+
+    for _ in range(5):
+        limiter.record(0.1, ok=False)
+    for _ in range(2):
+        limiter.record(0.1, ok=False)
+
+    assert limiter.limit == 2
+
+
+def test_fetch_pages_async_yields_every_page():
+    api_client = MagicMock()
+    api_client.fetch_page.side_effect = lambda page: {"page": page}
+
+    results = dict(fetch_pages_async(api_client, [2, 3, 4, 5]))
+
+    assert results == {page: {"page": page} for page in [2, 3, 4, 5]}
+
+
+def test_fetch_pages_async_survives_failing_page():
+    api_client = MagicMock()
+
+    def fetch_page_side_effect(page):
+        if page == 3:
+            raise Exception("Page 3 Failed!")
+        return {"page": page}
+
+    api_client.fetch_page.side_effect = fetch_page_side_effect
+
+    results = dict(fetch_pages_async(api_client, [2, 3, 4]))
+
+    assert results[2] == {"page": 2}
+    assert results[3] is None
+    assert results[4] == {"page": 4}
+
+
+def test_closing_fetch_pages_async_early_stops_requests():
+    import time
+    import threading
+    api_client = MagicMock()
+
+    def fetch_page(page):
+        time.sleep(0.01)
+        return {"page": page}
+
+    api_client.fetch_page.side_effect = fetch_page
+    limiter = AdaptiveConcurrencyLimiter(initial=1, minimum=1, maximum=1)
+
+    pages = fetch_pages_async(api_client, list(range(1, 101)), limiter=limiter)
+    next(pages)
+    pages.close()
+
+    assert api_client.fetch_page.call_count < 10
+    assert not [thread for thread in threading.enumerate() if thread.name == "scraper-async-engine"]
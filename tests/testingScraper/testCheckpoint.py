@@ -0,0 +1,56 @@
+from jobScraper.checkpoint import ScrapeCheckpoint
+
+SESSION = {"search_config": {"main_category": "hitech_qa"}, "output": "jobs.jsonl",
+           "compression": None, "pages_to_process": 5}
+
+
+def test_record_and_reload(tmp_path):
+    filename = str(tmp_path / "checkpoint.json")
+    checkpoint = ScrapeCheckpoint(filename)
+    checkpoint.start(SESSION)
+    checkpoint.record_page(1, 25)
+    checkpoint.record_page(3, 20)
+
+    reloaded = ScrapeCheckpoint(filename)
+    assert reloaded.load()
+    assert reloaded.matches(SESSION)
+    assert reloaded.completed_pages == {1, 3}
+    assert reloaded.pages[3] == (25, 45)
+    assert reloaded.rows_committed == 45
+
+
+def test_session_mismatch(tmp_path):
+    checkpoint = ScrapeCheckpoint(str(tmp_path / "checkpoint.json"))
+    checkpoint.start(SESSION)
+
+    other = dict(SESSION, search_config={"main_category": "hitech_software"})
+    assert not checkpoint.matches(other)
+
+
+def test_missing_or_corrupt_manifest(tmp_path):
+    filename = tmp_path / "checkpoint.json"
+    assert not ScrapeCheckpoint(str(filename)).load()
+
+    filename.write_text("{", encoding="utf-8")
+    assert not ScrapeCheckpoint(str(filename)).load()
+
+
+def test_clear_removes_manifest(tmp_path):
+    filename = tmp_path / "checkpoint.json"
+    checkpoint = ScrapeCheckpoint(str(filename))
+    checkpoint.start(SESSION)
+    checkpoint.clear()
+    assert not filename.exists()
+
+
+def test_multi_query_page_keys_round_trip(tmp_path):
+    filename = str(tmp_path / "checkpoint.json")
+    checkpoint = ScrapeCheckpoint(filename)
+    checkpoint.start(SESSION)
+    checkpoint.record_page((0, 1), 25)
+    checkpoint.record_page((2, 1), 10)
+
+    reloaded = ScrapeCheckpoint(filename)
+    assert reloaded.load()
+    assert reloaded.completed_pages == {(0, 1), (2, 1)}
+    assert reloaded.pages[(2, 1)] == (25, 35)
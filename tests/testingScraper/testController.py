@@ -6,14 +6,16 @@ from jobScraper import controller
 @pytest.fixture
 def mock_dependencies(mocker):
     mock_api_client_instance = MagicMock()
-    mocker.patch('job_scraper.controller.ApiClient', return_value=mock_api_client_instance)
+    mocker.patch('jobScraper.controller.ApiClient', return_value=mock_api_client_instance)
 
-    mock_extractor = mocker.patch('job_scraper.controller.extract_jobs_from_page')
+    mock_extractor = mocker.patch('jobScraper.controller.extract_jobs_from_page')
 
     mock_writer_instance = MagicMock()
-    mocker.patch('job_scraper.controller.StreamingJsonlWriter', return_value=mock_writer_instance)
+    mocker.patch('jobScraper.controller.StreamingJsonlWriter', return_value=mock_writer_instance)
     mock_writer_instance.__enter__.return_value = mock_writer_instance
 
+    mocker.patch('jobScraper.controller.ScrapeCheckpoint')
+
     return {
         "api_client": mock_api_client_instance,
         "extractor": mock_extractor,
@@ -103,3 +105,200 @@ def test_run_scraper_handles_exception_in_thread(mock_dependencies):
     assert mock_api.fetch_page.call_count == 3
     assert mock_extractor.call_count == 2
     assert mock_writer.write_rows.call_count == 2
+
+
+def test_run_scraper_delta_stops_when_page_is_mostly_known(mock_dependencies, mocker):
+    mock_api = mock_dependencies['api_client']
+    mock_extractor = mock_dependencies['extractor']
+    mock_writer = mock_dependencies['writer']
+
+    mock_store = MagicMock()
+    mocker.patch('jobScraper.controller.SeenJobsStore', return_value=mock_store)
+    known_links = {"/old-1", "/old-2", "/old-3"}
+    mock_store.classify.side_effect = lambda job: "known" if job["link"] in known_links else "new"
+
+    def fetch_page_side_effect(page_num):
+        if page_num == 1:
+            return {"TotalPagesNumber": 10, "TotalSearchResultCount": 100, "page": 1}
+        return {"page": page_num}
+
+    mock_api.fetch_page.side_effect = fetch_page_side_effect
+    mock_api.base_url = "http://fake.com"
+
+    def extractor_side_effect(data, base_url):
+        if data["page"] == 1:
+            return [{"link": "/new-1"}, {"link": "/new-2"}]
+        if data["page"] == 2:
+            return [{"link": "/new-3"}, {"link": "/old-1"}, {"link": "/old-2"}, {"link": "/old-3"}]
+        return [{"link": f"/page-{data['page']}"}]
+
+    mock_extractor.side_effect = extractor_side_effect
+
+    controller.run_scraper({}, delta=True, stop_ratio=0.75)
+
+    written = [job for c in mock_writer.write_rows.call_args_list for job in c.args[0]]
+    assert written == [{"link": "/new-1"}, {"link": "/new-2"}, {"link": "/new-3"}]
+    assert mock_extractor.call_count == 2
+    # Saving is left to the caller, once the delta file is loaded.
+    mock_store.save.assert_not_called()
+
+
+def test_run_scraper_resumes_from_checkpoint(mocker, tmp_path):
+    import json
+    output_file = str(tmp_path / "jobs.jsonl")
+    mocker.patch('jobScraper.controller.JSONL_OUTPUT_FILE', output_file)
+    mocker.patch('jobScraper.controller.SCRAPE_CHECKPOINT_FILE', str(tmp_path / "checkpoint.json"))
+    mocker.patch('jobScraper.controller.extract_jobs_from_page',
+                 side_effect=lambda data, base_url: [{"page": data["page"]}])
+
+    mock_api = MagicMock()
+    mocker.patch('jobScraper.controller.ApiClient', return_value=mock_api)
+    mock_api.base_url = "http://fake.com"
+
+    def crashing_fetch(page_num):
+        if page_num == 3:
+            raise KeyboardInterrupt("container preempted")
+        return {"TotalPagesNumber": 4, "TotalSearchResultCount": 4, "page": page_num}
+
+    mock_api.fetch_page.side_effect = crashing_fetch
+    mocker.patch('jobScraper.controller.MAX_CONCURRENT_WORKERS', 1)
+    with pytest.raises(KeyboardInterrupt):
+        controller.run_scraper({"main_category": "hitech_software"})
+
+    assert not (tmp_path / "jobs.jsonl").exists()
+
+    mock_api.fetch_page.side_effect = lambda page_num: {
+        "TotalPagesNumber": 4, "TotalSearchResultCount": 4, "page": page_num
+    }
+    mock_api.fetch_page.reset_mock()
+    collected = controller.run_scraper({"main_category": "hitech_software"}, resume=True)
+
+    fetched = sorted(c.args[0] for c in mock_api.fetch_page.call_args_list)
+    assert fetched == [1, 3, 4]
+    assert collected == 4
+    with open(output_file, encoding="utf-8") as f:
+        assert sorted(json.loads(line)["page"] for line in f) == [1, 2, 3, 4]
+    assert not (tmp_path / "checkpoint.json").exists()
+
+
+def test_run_scraper_fans_out_queries_and_drops_duplicates(mocker, tmp_path):
+    import json
+    output_file = str(tmp_path / "jobs.jsonl")
+    mocker.patch('jobScraper.controller.JSONL_OUTPUT_FILE', output_file)
+    mocker.patch('jobScraper.controller.SCRAPE_CHECKPOINT_FILE', str(tmp_path / "checkpoint.json"))
+
+    def make_client(search_config, **kwargs):
+        category = search_config["main_category"]
+        client = MagicMock()
+        client.base_url = "http://fake.com"
+
+        def fetch_page(page_num):
+            links = [f"/{category}/{page_num}", f"/shared/{page_num}"]
+            return {
+                "TotalPagesNumber": 2,
+                "TotalSearchResultCount": 4,
+                "ResultList": [{"JobContent": {"Name": link}, "JobInfo": {"Link": link}} for link in links],
+            }
+
+        client.fetch_page.side_effect = fetch_page
+        return client
+
+    api_client_cls = mocker.patch('jobScraper.controller.ApiClient', side_effect=make_client)
+    mock_extractor = mocker.patch(
+        'jobScraper.controller.extract_jobs_from_page',
+        side_effect=lambda data, base_url: [
+            {"link": base_url + item["JobInfo"]["Link"]} for item in data["ResultList"]
+        ],
+    )
+
+    collected = controller.run_scraper([{"main_category": "qa"}, {"main_category": "hardware"}])
+
+    assert api_client_cls.call_count == 2
+    limiters = {id(c.kwargs["rate_limiter"]) for c in api_client_cls.call_args_list}
+    assert len(limiters) == 1
+    assert collected == 6
+    assert mock_extractor.call_count == 4
+    with open(output_file, encoding="utf-8") as f:
+        links = sorted(json.loads(line)["link"] for line in f)
+    assert links == sorted(
+        f"http://fake.com/{name}/{page}" for name in ("qa", "hardware", "shared") for page in (1, 2)
+    )
+
+
+def test_delta_postings_are_emitted_again_when_the_load_fails(mock_dependencies, mocker, tmp_path):
+    import runUpdate
+    mock_api = mock_dependencies['api_client']
+    mock_writer = mock_dependencies['writer']
+    mock_api.fetch_page.return_value = {"TotalPagesNumber": 1, "TotalSearchResultCount": 2}
+    mock_dependencies['extractor'].return_value = [{"link": "/job-1"}, {"link": "/job-2"}]
+    mocker.patch('runUpdate.SEEN_JOBS_FILE', str(tmp_path / "seen.json"))
+    mocker.patch('runUpdate.ensure_schema', return_value=True)
+    mocker.patch('runUpdate.skillProcessor.run_skill_processor', return_value=True)
+    mocker.patch('runUpdate.refresh_dashboard')
+    mocker.patch('runUpdate.bump_data_generation')
+    load = mocker.patch('runUpdate.load_raw_data_to_db', side_effect=RuntimeError("DB down"))
+
+    with pytest.raises(RuntimeError):
+        runUpdate.run_delta_update()
+
+    load.side_effect = None
+    load.return_value = True
+    assert runUpdate.run_delta_update() is True
+
+    written = [[job["link"] for job in c.args[0]] for c in mock_writer.write_rows.call_args_list]
+    assert written == [["/job-1", "/job-2"], ["/job-1", "/job-2"]]
+    assert (tmp_path / "seen.json").exists()
+
+
+def test_delta_update_fails_when_the_skill_retag_fails(mock_dependencies, mocker, tmp_path):
+    import runUpdate
+    mock_api = mock_dependencies['api_client']
+    mock_api.fetch_page.return_value = {"TotalPagesNumber": 1, "TotalSearchResultCount": 1}
+    mock_dependencies['extractor'].return_value = [{"link": "/job-1"}]
+    mocker.patch('runUpdate.SEEN_JOBS_FILE', str(tmp_path / "seen.json"))
+    mocker.patch('runUpdate.ensure_schema', return_value=True)
+    mocker.patch('runUpdate.load_raw_data_to_db', return_value=True)
+    mocker.patch('runUpdate.skillProcessor.run_skill_processor', return_value=False)
+    refresh = mocker.patch('runUpdate.refresh_dashboard')
+    bump = mocker.patch('runUpdate.bump_data_generation')
+
+    assert runUpdate.run_delta_update() is False
+
+    refresh.assert_not_called()
+    bump.assert_not_called()
+
+
+def test_delta_overlapping_queries_neither_duplicate_nor_stop_each_other(mocker, tmp_path):
+    from jobScraper.seenStore import SeenJobsStore
+    writer = MagicMock()
+    writer.__enter__.return_value = writer
+    pages = {
+        "qa": {1: ["/shared-1", "/shared-2"], 2: ["/old-1", "/old-2"]},
+        "hardware": {1: ["/shared-1", "/shared-2"], 2: ["/hw-1", "/hw-2"]},
+    }
+
+    def make_client(search_config, **kwargs):
+        category = search_config["main_category"]
+        client = MagicMock()
+        client.base_url = "http://fake.com"
+        client.fetch_page.side_effect = lambda page_num: {
+            "TotalPagesNumber": 2, "TotalSearchResultCount": 4, "links": pages[category][page_num],
+        }
+        return client
+
+    mocker.patch('jobScraper.controller.ApiClient', side_effect=make_client)
+    mocker.patch('jobScraper.controller.extract_jobs_from_page',
+                 side_effect=lambda data, base_url: [{"link": link} for link in data["links"]])
+    store = SeenJobsStore(str(tmp_path / "seen.json"))
+    store.mark({"link": "/old-1"})
+    store.mark({"link": "/old-2"})
+
+    collected = controller.run_scraper(
+        [{"main_category": "qa"}, {"main_category": "hardware"}], delta=True, stop_ratio=0.75,
+        writer=writer, seen_store=store,
+    )
+
+    written = [job["link"] for c in writer.write_rows.call_args_list for job in c.args[0]]
+    # hardware's first page only repeats qa's new postings: not known from earlier runs, so it keeps paging.
+    assert written == ["/shared-1", "/shared-2", "/hw-1", "/hw-2"]
+    assert collected == 4
@@ -80,3 +80,61 @@ def test_extract_jobs_basic_parsing(mock_api_data):
 
     assert jobs[1]['title'] == "Frontend Developer"
     assert jobs[1]['locations'] == ["Haifa", "Tel Aviv"]
+
+
+def _soup_clean_html(raw_html):
+    from jobScraper.parser import _soup_html_to_text, _BLANK_LINES_RE
+    return _BLANK_LINES_RE.sub('\n', _soup_html_to_text(raw_html.replace("<br/>", "<br>")))
+
+
+@pytest.mark.parametrize("raw_html", [
+    "<p>תיאור &amp; דרישות</p><ul><li>Python&nbsp;3</li><li>&lt;SQL&gt;</li></ul>",
+    "<DIV class='x'>Line 1<br />Line 2</DIV>\n<p>\n\n</p><p>Line 3</p>",
+    "<p>a<!-- comment -->b</p>",
+    "<script>var x = 1;</script>visible",
+    "x&foo;y and AT&T",
+    "<p>a</br>b</p>",
+    "a < b <p",
+    "<p>&#150; &#65535; &#0;</p>",
+])
+def test_clean_html_matches_beautifulsoup(raw_html):
+    assert clean_html(raw_html) == _soup_clean_html(raw_html)
+
+
+def test_fast_path_falls_back_on_unsupported_markup():
+    from jobScraper.parser import _fast_html_to_text
+    assert _fast_html_to_text("<p>Hello <b>World</b></p>") == "Hello\nWorld"
+    assert _fast_html_to_text("<p>a<!-- c -->b</p>") is None
+    assert _fast_html_to_text("<style>p {}</style>") is None
+    assert _fast_html_to_text("x&foo;y") is None
+
+
+def test_clean_html_matches_beautifulsoup_on_corpus():
+    from benchmarks.benchCleanHtml import load_documents
+    from config import JSONL_OUTPUT_FILE
+
+    for document in load_documents(JSONL_OUTPUT_FILE)[:200]:
+        assert clean_html(document) == _soup_clean_html(document)
+
+
+def test_drop_seen_jobs_filters_links_seen_under_other_queries():
+    from jobScraper.parser import drop_seen_jobs
+
+    def item(link):
+        return {"JobContent": {"Name": link}, "JobInfo": {"Link": link}}
+
+    seen_links = {"http://fake.com/job/1"}
+    data = {"ResultList": [item("/job/1"), item("/job/2"), {"JobContent": {}}]}
+
+    filtered = drop_seen_jobs(data, "http://fake.com", seen_links)
+
+    assert [job.get("JobInfo", {}).get("Link") for job in filtered["ResultList"]] == ["/job/2", None]
+    # Links are only recorded once their rows are written.
+    assert seen_links == {"http://fake.com/job/1"}
+
+
+def test_drop_seen_rows_skips_seen_and_repeated_links():
+    from jobScraper.parser import drop_seen_rows
+    jobs = [{"link": "a"}, {"link": "b"}, {"link": "b"}, {"link": "N/A"}, {"link": "N/A"}]
+
+    assert drop_seen_rows(jobs, {"a"}) == [{"link": "b"}, {"link": "N/A"}, {"link": "N/A"}]
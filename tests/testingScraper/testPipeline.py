@@ -0,0 +1,87 @@
+import pytest
+from unittest.mock import MagicMock
+from concurrent.futures import ThreadPoolExecutor
+from jobScraper.pipeline import run_pipeline
+
+
+def _page(title):
+    return {
+        "ResultList": [{
+            "JobContent": {"Name": title, "Description": "<p>desc</p>", "Requirements": ""},
+            "Company": {"CompanyDisplayName": "Google"},
+            "JobInfo": {"Link": f"/job/{title}"},
+        }]
+    }
+
+
+def test_pipeline_parses_and_writes_every_page():
+    writer = MagicMock()
+    page_results = [(1, _page("a")), (2, _page("b")), (3, None), (4, _page("c"))]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        written = run_pipeline(page_results, "https://example.com", writer,
+                               parse_workers=1, queue_size=1, parse_executor=executor)
+
+    assert written == 3
+    titles = [c.args[0][0]['title'] for c in writer.write_rows.call_args_list]
+    assert titles == ["a", "b", "c"]
+
+
+def test_pipeline_skips_page_that_fails_to_parse(mocker):
+    writer = MagicMock()
+    mocker.patch('jobScraper.pipeline.extract_jobs_from_page',
+                 side_effect=[[{"title": "a"}], Exception("bad page"), [{"title": "c"}]])
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        written = run_pipeline([(1, {"x": 1}), (2, {"x": 2}), (3, {"x": 3})], "", writer,
+                               parse_workers=1, parse_executor=executor)
+
+    assert written == 2
+
+
+def test_pipeline_raises_writer_error_without_deadlock():
+    writer = MagicMock()
+    writer.write_rows.side_effect = IOError("disk full")
+    page_results = [(page, _page(str(page))) for page in range(1, 20)]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(IOError):
+            run_pipeline(page_results, "", writer, parse_workers=1, queue_size=1, parse_executor=executor)
+
+
+def test_pipeline_with_process_pool():
+    writer = MagicMock()
+    written = run_pipeline([(1, _page("a")), (2, _page("b"))], "", writer, parse_workers=2)
+    assert written == 2
+
+
+def test_pipeline_keeps_postings_of_a_page_that_failed_to_parse(mocker):
+    from jobScraper.parser import extract_jobs_from_page, drop_seen_jobs
+    writer = MagicMock()
+    seen_links = set()
+    mocker.patch('jobScraper.pipeline.extract_jobs_from_page',
+                 side_effect=[Exception("bad page"), extract_jobs_from_page(_page("a"), "https://x.com")])
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        written = run_pipeline([(1, _page("a")), (2, _page("a"))], "https://x.com", writer, parse_workers=1,
+                               parse_executor=executor, seen_links=seen_links,
+                               page_filter=lambda data: drop_seen_jobs(data, "https://x.com", seen_links))
+
+    # The copy returned by the second query is written, not dropped as a duplicate.
+    assert written == 1
+    assert seen_links == {"https://x.com/job/a"}
+
+
+def test_pipeline_skips_page_whose_filter_fails():
+    writer = MagicMock()
+
+    def page_filter(data):
+        if not isinstance(data["ResultList"], list):
+            raise TypeError("ResultList is not a list")
+        return data
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        written = run_pipeline([(1, {"ResultList": "broken"}), (2, _page("b"))], "", writer,
+                               parse_workers=1, parse_executor=executor, page_filter=page_filter)
+
+    assert written == 1
@@ -0,0 +1,72 @@
+from jobScraper.rateLimit import (
+    TokenBucket, CircuitBreaker, ScrapeStats, backoff_delay, parse_retry_after
+)
+
+
+def test_parse_retry_after_seconds():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("garbage") is None
+
+
+def test_parse_retry_after_http_date_in_past():
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_backoff_delay_grows_and_is_capped(mocker):
+    mocker.patch('jobScraper.rateLimit.random.uniform', side_effect=lambda low, high: high)
+    assert backoff_delay(0, base=0.5, cap=4) == 0.5
+    assert backoff_delay(2, base=0.5, cap=4) == 2.0
+    assert backoff_delay(10, base=0.5, cap=4) == 4
+
+
+def test_backoff_delay_honors_retry_after(mocker):
+    mocker.patch('jobScraper.rateLimit.random.uniform', return_value=0.1)
+    assert backoff_delay(0, retry_after=3, cap=30) == 3
+
+
+def test_token_bucket_waits_when_empty(mocker):
+    sleep = mocker.patch('time.sleep')
+    clock = mocker.patch('jobScraper.rateLimit.time.monotonic', return_value=100.0)
+    bucket = TokenBucket(rate=2, capacity=1)
+
+    bucket.acquire()
+    sleep.assert_not_called()
+
+    def advance(seconds):
+        clock.return_value += seconds
+    sleep.side_effect = advance
+
+    bucket.acquire()
+    sleep.assert_called_once_with(0.5)
+
+
+def test_circuit_breaker_opens_after_threshold(mocker):
+    mocker.patch('jobScraper.rateLimit.time.monotonic', return_value=50.0)
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=10)
+
+    breaker.record_failure()
+    assert breaker.open_until == 0.0
+
+    breaker.record_failure()
+    assert breaker.open_until == 60.0
+    assert breaker.trips == 1
+
+
+def test_circuit_breaker_success_resets_count():
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=10)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.trips == 0
+
+
+def test_stats_summary_lists_lost_pages():
+    stats = ScrapeStats()
+    stats.increment("retries")
+    stats.page_lost(7)
+    stats.page_lost(3)
+
+    summary = stats.summary()
+    assert "1 retries" in summary
+    assert "2 pages lost: [3, 7]" in summary
@@ -0,0 +1,52 @@
+import pytest
+from jobScraper.responseCache import ResponseCache
+
+URL = "https://example.com/api/jobs/search"
+PARAMS = {"ssaen": "3", "isAA": "true", "catdir": "6", "page": 2}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(str(tmp_path), ttl=60)
+
+
+def test_key_ignores_param_order():
+    reordered = dict(reversed(list(PARAMS.items())))
+    assert ResponseCache.make_key(URL, PARAMS) == ResponseCache.make_key(URL, reordered)
+
+
+def test_key_depends_on_page():
+    assert ResponseCache.make_key(URL, PARAMS) != ResponseCache.make_key(URL, dict(PARAMS, page=3))
+
+
+def test_store_and_get_roundtrip(cache):
+    cache.store(URL, PARAMS, {"ResultList": []}, etag='"abc"')
+    entry = cache.get(URL, PARAMS)
+
+    assert entry["body"] == {"ResultList": []}
+    assert cache.is_fresh(entry)
+    assert ResponseCache.conditional_headers(entry) == {'If-None-Match': '"abc"'}
+
+
+def test_entry_goes_stale_after_ttl(cache, mocker):
+    cache.store(URL, PARAMS, {"ResultList": []})
+    entry = cache.get(URL, PARAMS)
+
+    mocker.patch('jobScraper.responseCache.time.time', return_value=entry["fetched_at"] + 61)
+    assert not cache.is_fresh(entry)
+
+
+def test_invalid_mode_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        ResponseCache(str(tmp_path), ttl=60, mode="off")
+
+
+def test_concurrent_stores_of_one_key_leave_a_valid_entry(cache, tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+    bodies = [{"ResultList": [{"n": n, "pad": "x" * 20000}]} for n in range(16)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda body: cache.store(URL, PARAMS, body), bodies))
+
+    assert cache.get(URL, PARAMS)["body"] in bodies
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,68 @@
+import json
+import pytest
+from jobScraper.seenStore import SeenJobsStore, job_key, NEW, CHANGED, KNOWN
+
+
+@pytest.fixture
+def job():
+    return {"title": "Backend Developer", "company": "Google", "link": "https://example.com/job/1"}
+
+
+def test_job_key_prefers_link(job):
+    assert job_key(job) == "https://example.com/job/1"
+
+
+def test_job_key_falls_back_to_title_and_company(job):
+    job["link"] = "N/A"
+    assert job_key(job) == "Backend Developer|Google"
+
+
+def test_classify_new_changed_known(tmp_path, job):
+    store = SeenJobsStore(str(tmp_path / "seen.json"))
+    assert store.classify(job) == NEW
+
+    store.mark(job)
+    assert store.classify(job) == KNOWN
+
+    changed_job = dict(job, title="Senior Backend Developer")
+    assert store.classify(changed_job) == CHANGED
+
+
+def test_save_and_reload(tmp_path, job):
+    filename = str(tmp_path / "seen.json")
+    store = SeenJobsStore(filename)
+    store.mark(job)
+    store.save()
+
+    reloaded = SeenJobsStore(filename)
+    assert reloaded.classify(job) == KNOWN
+
+
+def test_corrupt_file_starts_empty(tmp_path, job):
+    filename = tmp_path / "seen.json"
+    filename.write_text("{not json", encoding="utf-8")
+
+    store = SeenJobsStore(str(filename))
+    assert store.classify(job) == NEW
+
+
+def test_save_drops_postings_not_seen_recently(tmp_path, mocker):
+    clock = mocker.patch('jobScraper.seenStore.time.time', return_value=0)
+    store = SeenJobsStore(str(tmp_path / "seen.json"), max_age_days=25, max_entries=2)
+    for number in range(4):
+        clock.return_value = number * 10 * 86400
+        store.mark({"link": f"https://example.com/job/{number}"})
+
+    store.save()
+
+    # Job 0 was last seen 30 days ago; of the rest only the two most recently seen are kept.
+    assert set(SeenJobsStore(store.filename).hashes) == {"https://example.com/job/2", "https://example.com/job/3"}
+
+
+def test_legacy_store_without_timestamps_loads(tmp_path, job):
+    filename = tmp_path / "seen.json"
+    store = SeenJobsStore(str(filename))
+    store.mark(job)
+    filename.write_text(json.dumps({key: entry[0] for key, entry in store.hashes.items()}), encoding="utf-8")
+
+    assert SeenJobsStore(str(filename)).classify(job) == KNOWN
@@ -0,0 +1,117 @@
+import json
+import pytest
+from jobScraper.storage import StreamingJsonlWriter, open_jsonl, output_path
+
+ROWS = [{"title": "מפתח/ת Backend", "locations": ["תל אביב"]}, {"title": "QA", "locations": []}]
+
+
+def _read(path):
+    with open_jsonl(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_output_path_adds_suffix():
+    assert output_path("jobs.jsonl") == "jobs.jsonl"
+    assert output_path("jobs.jsonl", "gzip") == "jobs.jsonl.gz"
+    with pytest.raises(ValueError):
+        output_path("jobs.jsonl", "bz2")
+
+
+def test_write_plain_roundtrip(tmp_path):
+    filename = str(tmp_path / "jobs.jsonl")
+    with StreamingJsonlWriter(filename) as writer:
+        writer.write_rows(ROWS)
+        writer.write_rows([])
+
+    assert _read(filename) == ROWS
+    assert not (tmp_path / "jobs.jsonl.tmp").exists()
+
+
+def test_write_gzip_roundtrip(tmp_path):
+    filename = str(tmp_path / "jobs.jsonl")
+    with StreamingJsonlWriter(filename, compression="gzip") as writer:
+        writer.write_rows(ROWS)
+
+    assert _read(filename + ".gz") == ROWS
+
+
+def test_write_zstd_roundtrip(tmp_path):
+    pytest.importorskip("zstandard")
+    filename = str(tmp_path / "jobs.jsonl")
+    with StreamingJsonlWriter(filename, compression="zstd") as writer:
+        writer.write_rows(ROWS)
+
+    assert _read(filename + ".zst") == ROWS
+
+
+def test_failed_write_keeps_previous_snapshot(tmp_path):
+    filename = str(tmp_path / "jobs.jsonl")
+    with StreamingJsonlWriter(filename) as writer:
+        writer.write_rows(ROWS)
+
+    with pytest.raises(RuntimeError):
+        with StreamingJsonlWriter(filename) as writer:
+            writer.write_rows([{"title": "half"}])
+            raise RuntimeError("scrape crashed")
+
+    assert _read(filename) == ROWS
+    assert not (tmp_path / "jobs.jsonl.tmp").exists()
+
+
+def test_tee_writer_aborts_snapshot_when_later_writer_fails(tmp_path):
+    from jobScraper.storage import TeeWriter
+
+    class FailingSink:
+        def __enter__(self):
+            return self
+
+        def write_rows(self, rows):
+            pass
+
+        def __exit__(self, exc_type, exc_value, traceback):
+            raise RuntimeError("commit failed")
+
+    filename = str(tmp_path / "jobs.jsonl")
+    with pytest.raises(RuntimeError):
+        with TeeWriter(StreamingJsonlWriter(filename), FailingSink()) as writer:
+            writer.write_rows(ROWS)
+
+    assert not (tmp_path / "jobs.jsonl").exists()
+    assert not (tmp_path / "jobs.jsonl.tmp").exists()
+
+
+def test_partial_output_kept_and_restored(tmp_path):
+    from jobScraper.storage import partial_path, read_partial_lines
+    filename = str(tmp_path / "jobs.jsonl")
+
+    with pytest.raises(RuntimeError):
+        with StreamingJsonlWriter(filename, compression="gzip", keep_partial=True) as writer:
+            writer.write_rows(ROWS)
+            writer.flush()
+            writer.write_rows([{"title": "not checkpointed"}])
+            raise RuntimeError("preempted")
+
+    lines = read_partial_lines(partial_path(filename, "gzip"), limit=2)
+    assert [json.loads(line) for line in lines] == ROWS
+
+    with StreamingJsonlWriter(filename, compression="gzip", resume_lines=lines) as writer:
+        writer.write_rows([{"title": "new"}])
+
+    assert _read(filename + ".gz") == ROWS + [{"title": "new"}]
+
+
+def test_stdlib_fallback_writes_the_same_bytes_as_orjson(mocker):
+    from jobScraper import storage
+    pytest.importorskip("orjson")
+    row = {"title": "מפתח/ת Python", "locations": ["תל אביב"], "link": "https://example.com/job/1"}
+    with_orjson = storage._dumps(row)
+
+    mocker.patch('jobScraper.storage.orjson', None)
+
+    assert storage._dumps(row) == with_orjson
+
+
+def test_zstd_without_zstandard_fails_on_construction(mocker, tmp_path):
+    mocker.patch('jobScraper.storage.zstandard', None)
+    with pytest.raises(ValueError, match="zstandard"):
+        StreamingJsonlWriter(str(tmp_path / "jobs.jsonl"), compression="zstd")
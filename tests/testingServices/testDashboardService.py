@@ -38,3 +38,20 @@ def test_get_dashboard_data_handles_db_exception(mocker):
 
     with pytest.raises(Exception, match="SQL Error"):
         dashboardService.get_dashboard_data()
+
+
+def test_get_dashboard_data_uses_precomputed_summary(mocker):
+    mocker.patch.object(dbQueries, 'get_dashboard_summary', return_value={
+        "skills": [('python', 50, 25.0)],
+        "levels": [{'name': 'Mid', 'count': 120}, {'name': 'Junior', 'count': 80}],
+    })
+    live_query = mocker.patch.object(dbQueries, 'get_skill_popularity_percentages')
+
+    result = dashboardService.get_dashboard_data()
+
+    assert result == {
+        "skills": [('python', 50, 25.0)],
+        "levels": [{'name': 'Mid', 'count': 120}, {'name': 'Junior', 'count': 80}],
+        "total_jobs": 200,
+    }
+    live_query.assert_not_called()
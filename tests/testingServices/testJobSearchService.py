@@ -0,0 +1,34 @@
+from fastapi.testclient import TestClient
+from fastapi import FastAPI
+from api.routes.jobs import router
+from api.services import jobSearchService
+from analyzer import dbQueries
+
+
+def test_search_jobs_pages_through_results(mocker):
+    search = mocker.patch.object(dbQueries, 'search_jobs', return_value={
+        "total": 41,
+        "results": [{"job_id": 7, "title": "Backend Developer", "company": "Wix", "level": "Mid",
+                     "link": "https://example.com/7", "rank": 0.5}],
+    })
+
+    result = jobSearchService.search_jobs("  backend   developer ", page=3, page_size=20)
+
+    search.assert_called_once_with("backend developer", limit=20, offset=40)
+    assert result["total"] == 41
+    assert result["query"] == "backend developer"
+    assert result["results"][0]["job_id"] == 7
+
+
+def test_search_route_validates_paging(mocker):
+    mocker.patch.object(dbQueries, 'search_jobs', return_value={})
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    client = TestClient(app)
+
+    response = client.get("/api/jobs/search", params={"q": "python"})
+    assert response.status_code == 200
+    assert response.json() == {"query": "python", "page": 1, "page_size": 20, "total": 0, "results": []}
+
+    assert client.get("/api/jobs/search", params={"q": "python", "page_size": 500}).status_code == 422
+    assert client.get("/api/jobs/search", params={"q": "p"}).status_code == 422